@@ -0,0 +1,52 @@
+"""
+Cold import time of pychoco, measured with `python -X importtime` in fresh interpreters. Importing pychoco must
+neither load the backend nor create the isolate: the import time is checked against a budget.
+
+Usage: python benchmarks/import_time.py [budget in ms] [number of runs] [statement]
+
+The statement defaults to "import pychoco"; e.g. "from pychoco import Model" measures the import of the backend.
+Exits with status 1 if the best run exceeds the budget.
+"""
+import subprocess
+import sys
+
+
+def import_times(statement):
+    """
+    :param statement: The import statement to run in a fresh interpreter.
+    :return: A dict mapping each imported module to its cumulative import time (in microseconds) and its nesting
+        level (0 for the modules imported by the statement itself), and the list of the pychoco modules imported by
+        the statement.
+    """
+    code = "{}\nimport sys\nprint(' '.join(m for m in sys.modules if m.split('.')[0] == 'pychoco'))".format(statement)
+    process = subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                             capture_output=True, text=True, check=True)
+    times = {}
+    for line in process.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, module = line[len("import time:"):].split("|")
+        level = (len(module) - len(module.lstrip()) - 1) // 2
+        times[module.strip()] = (int(cumulative), level)
+    return times, process.stdout.split()
+
+
+if __name__ == "__main__":
+    budget = float(sys.argv[1]) if len(sys.argv) > 1 else 50
+    runs = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    statement = sys.argv[3] if len(sys.argv) > 3 else "import pychoco"
+    best = None
+    for _ in range(0, runs):
+        times, modules = import_times(statement)
+        total = sum(t for module, (t, level) in times.items() if module.split(".")[0] == "pychoco" and level == 0)
+        if best is None or total < best[0]:
+            best = (total, times, modules)
+    total, times, modules = best
+    print("{}: {:.1f} ms (best of {} runs, budget {:.1f} ms)".format(statement, total / 1000, runs, budget))
+    print("pychoco modules imported: {}".format(", ".join(sorted(modules))))
+    print("backend loaded: {}".format("pychoco.backend" in modules))
+    slowest = sorted(((t, m) for m, (t, _) in times.items() if m.split(".")[0] == "pychoco"), reverse=True)[:10]
+    for t, module in slowest:
+        print("  {:>10.1f} ms  {}".format(t / 1000, module))
+    sys.exit(0 if total / 1000 <= budget else 1)
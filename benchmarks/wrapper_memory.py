@@ -0,0 +1,69 @@
+"""
+Memory used by the Python wrappers of Choco objects, with __slots__ (current classes) and with a per-instance
+__dict__ (as before the wrappers were slot-based). The latter is emulated by an unslotted class, whose instances
+set the same attributes, with the same values, as the wrappers.
+
+Usage: python benchmarks/wrapper_memory.py [number of wrappers]
+"""
+import sys
+import tracemalloc
+
+from pychoco.constraints.cnf.log_op import LogOp
+from pychoco.constraints.constraint import Constraint
+from pychoco.solution import Solution
+from pychoco.variables.boolvar import BoolVar
+from pychoco.variables.intvar import IntVar
+from pychoco.variables.setvar import SetVar
+
+
+def bytes_per_wrapper(create, n):
+    """
+    :param create: A function creating a wrapper.
+    :param n: The number of wrappers to create.
+    :return: The average number of bytes allocated per wrapper.
+    """
+    tracemalloc.start()
+    wrappers = [create() for _ in range(0, n)]
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del wrappers
+    return size / n
+
+
+def unslotted(wrapper):
+    """
+    :param wrapper: A wrapper, instance of a class with __slots__.
+    :return: A class without __slots__ (instances have a __dict__ and a __weakref__), whose instances are created
+        with the attributes of the wrapper, set in the same order as its slots.
+    """
+    names = [name for cls in reversed(type(wrapper).__mro__) for name in cls.__dict__.get("__slots__", ())
+             if name != "__weakref__" and hasattr(wrapper, name)]
+    values = [getattr(wrapper, name) for name in names]
+
+    def __init__(self):
+        for name, value in zip(names, values):
+            setattr(self, name, value)
+
+    return type(type(wrapper).__name__, (), {"__init__": __init__})
+
+
+def main(n):
+    # Wrappers of no handle (None): only the Python side is measured, and nothing is destroyed afterwards.
+    classes = {
+        IntVar: lambda cls: cls(None, None),
+        BoolVar: lambda cls: cls(None, None),
+        SetVar: lambda cls: cls(None, None),
+        Constraint: lambda cls: cls(None, None),
+        Solution: lambda cls: cls(None),
+        LogOp: lambda cls: cls(None),
+    }
+    print("{:<12}{:>14}{:>14}".format("class", "__dict__ (B)", "__slots__ (B)"))
+    for cls, create in classes.items():
+        dict_cls = unslotted(create(cls))
+        before = bytes_per_wrapper(dict_cls, n)
+        after = bytes_per_wrapper(lambda: create(cls), n)
+        print("{:<12}{:>14.1f}{:>14.1f}".format(cls.__name__, before, after))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
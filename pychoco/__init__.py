@@ -5,24 +5,60 @@ pychoco - Python API for the Choco Constraint Programming solver
 # Implementation inspired by https://github.com/d-michail/python-jgrapht
 
 import atexit
-
-from . import backend
-
-backend.chocosolver_init()
-del backend
+import importlib
+import sys
 
 
 def _module_cleanup_function():
-    from . import backend
-    backend.chocosolver_init()
+    # Nothing to clean up if the backend was never loaded
+    handle_wrapper = sys.modules.get(__name__ + "._handle_wrapper")
+    if handle_wrapper is not None:
+        handle_wrapper.flush_handles()
+        handle_wrapper.backend.chocosolver_cleanup()
 
 
 atexit.register(_module_cleanup_function)
 del atexit
 
-from .model import Model
-from .objects.graphs.undirected_graph import create_undirected_graph, create_complete_undirected_graph
-from .objects.graphs.directed_graph import create_directed_graph, create_complete_directed_graph
-from .objects.automaton.finite_automaton import FiniteAutomaton
-from .objects.automaton.cost_automaton import CostAutomaton
-from .objects.graphs.multivalued_decision_diagram import MultivaluedDecisionDiagram
+# Public names and the submodules defining them. Submodules (and thus the backend) are imported on first access
+# (PEP 562), so that importing pychoco is cheap. The default isolate is created on the first backend call.
+_LAZY_NAMES = {
+    "flush_handles": "._handle_wrapper",
+    "set_flush_threshold": "._handle_wrapper",
+    "attach_thread": ".isolate",
+    "detach_thread": ".isolate",
+    "attached_thread": ".isolate",
+    "create_isolate": ".isolate",
+    "use_isolate": ".isolate",
+    "init": ".isolate",
+    "isolate_stats": ".isolate",
+    "Model": ".model",
+    "create_undirected_graph": ".objects.graphs.undirected_graph",
+    "create_complete_undirected_graph": ".objects.graphs.undirected_graph",
+    "create_directed_graph": ".objects.graphs.directed_graph",
+    "create_complete_directed_graph": ".objects.graphs.directed_graph",
+    "FiniteAutomaton": ".objects.automaton.finite_automaton",
+    "CostAutomaton": ".objects.automaton.cost_automaton",
+    "MultivaluedDecisionDiagram": ".objects.graphs.multivalued_decision_diagram",
+}
+
+__all__ = list(_LAZY_NAMES)
+
+
+def __getattr__(name):
+    if name in _LAZY_NAMES:
+        value = getattr(importlib.import_module(_LAZY_NAMES[name], __name__), name)
+        globals()[name] = value
+        return value
+    if not name.startswith("_"):
+        # Submodules (e.g. pychoco.isolate) are imported on first access too
+        try:
+            return importlib.import_module("." + name, __name__)
+        except ModuleNotFoundError as e:
+            if e.name != __name__ + "." + name:
+                raise
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_NAMES))
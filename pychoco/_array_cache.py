@@ -0,0 +1,91 @@
+import weakref
+from collections import OrderedDict, namedtuple
+
+from pychoco._handle_wrapper import _HandleWrapper
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+# A single constraint (or search strategy) declaration uses at most a few Java arrays: a smaller cache could
+# release the handle of one of them while the declaration is still being built.
+MIN_CACHE_SIZE = 8
+
+
+class _ArrayCache:
+    """
+    Least-recently used cache of Java array handles, keyed by the identity of the Python objects they contain.
+    Entries only hold weak references to these objects: an entry is evicted as soon as one of them is garbage
+    collected, so that their identities cannot be reused by other objects while it is cached. The handle of an
+    evicted entry is released.
+    """
+
+    def __init__(self, maxsize: int = 128):
+        """
+        :param maxsize: The maximum number of cached arrays (0 disables the cache).
+        """
+        assert maxsize == 0 or maxsize >= MIN_CACHE_SIZE, \
+            "[_ArrayCache] The cache size must be 0 (disabled) or at least {}".format(MIN_CACHE_SIZE)
+        self._maxsize = maxsize
+        self._entries = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, kind: str, objects, build):
+        """
+        :param kind: The kind of Java array (e.g. "intvar", "boolvar").
+        :param objects: A sequence of Python objects holding a handle.
+        :param build: A function building the Java array handle from the objects, on cache misses.
+        :return: A Java array handle.
+        """
+        if self._maxsize == 0:
+            self._misses += 1
+            return build(objects)
+        key = (kind, tuple(map(id, objects)))
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._hits += 1
+            self._entries.move_to_end(key)
+            return entry[1]._handle
+        self._misses += 1
+        wrapper = _HandleWrapper(build(objects))
+        remove = lambda _, entries=self._entries, k=key: entries.pop(k, None)
+        self._entries[key] = (tuple(weakref.ref(o, remove) for o in objects), wrapper)
+        if len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+        return wrapper._handle
+
+    def add(self, kind: str, objects, wrapper: _HandleWrapper):
+        """
+        Caches the handle of an existing Java array (e.g. the one of the variables returned by intvars()). The entry
+        is the least recently used one: it only takes free room in the cache, and never evicts another entry.
+        :param kind: The kind of Java array (e.g. "intvar", "boolvar").
+        :param objects: A sequence of Python objects holding a handle.
+        :param wrapper: The wrapper of the Java array handle holding these objects.
+        """
+        key = (kind, tuple(map(id, objects)))
+        if self._maxsize == 0 or key in self._entries:
+            return
+        remove = lambda _, entries=self._entries, k=key: entries.pop(k, None)
+        self._entries[key] = (tuple(weakref.ref(o, remove) for o in objects), wrapper)
+        self._entries.move_to_end(key, last=False)
+        if len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+    def wrappers(self):
+        """
+        :return: The wrappers of the cached handles.
+        """
+        return [wrapper for _, wrapper in self._entries.values()]
+
+    def info(self):
+        """
+        :return: The cache statistics, as a (hits, misses, maxsize, currsize) named tuple.
+        """
+        return CacheInfo(self._hits, self._misses, self._maxsize, len(self._entries))
+
+    def clear(self):
+        """
+        Empties the cache (releasing the cached handles) and resets its statistics.
+        """
+        self._entries.clear()
+        self._hits = 0
+        self._misses = 0
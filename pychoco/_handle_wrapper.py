@@ -1,4 +1,78 @@
-from pychoco import backend
+from collections import deque
+
+from pychoco import backend, isolate
+
+# Marks the handles released by Model.close(): they must neither be used nor destroyed again.
+_RELEASED = object()
+
+# (isolate, handle) pairs of the garbage collected wrappers, waiting to be destroyed (see flush_handles()).
+_pending_handles = deque()
+_flush_threshold = 1024
+
+
+def flush_handles():
+    """
+    Destroys, with a single backend call, the handles of the garbage collected objects. This is done
+    automatically once enough handles are pending (see set_flush_threshold()).
+    """
+    handles = {}
+    try:
+        while True:
+            index, handle = _pending_handles.popleft()
+            handles.setdefault(index, []).append(handle)
+    except IndexError:
+        pass
+    if len(handles) > 0 and backend.chocosolver_is_initialized():
+        for index, isolate_handles in handles.items():
+            backend.chocosolver_handles_destroy_all(index, isolate_handles)
+
+
+def set_flush_threshold(threshold: int):
+    """
+    :param threshold: The number of pending handles triggering their destruction (1 destroys every handle as
+        soon as its object is garbage collected).
+    """
+    global _flush_threshold
+    assert threshold >= 1, "[set_flush_threshold] The threshold must be at least 1"
+    _flush_threshold = threshold
+    if len(_pending_handles) >= threshold:
+        flush_handles()
+
+
+class _HandleTable:
+    """
+    The handles of the live objects created through a model, released together by Model.close(). Each object
+    keeps its index in the table, whose slots are reused once objects are garbage collected.
+    """
+
+    __slots__ = ("handles", "free", "closed")
+
+    def __init__(self):
+        self.handles = []
+        self.free = []
+        self.closed = False
+
+    def add(self, handle) -> int:
+        """
+        :param handle: A backend object handle (None if it is not created yet).
+        :return: The index of the handle in the table.
+        """
+        if len(self.free) > 0:
+            index = self.free.pop()
+            self.handles[index] = handle
+            return index
+        self.handles.append(handle)
+        return len(self.handles) - 1
+
+    def remove(self, index: int):
+        """
+        :param index: The index of the handle of a garbage collected object.
+        """
+        self.handles[index] = None
+        self.free.append(index)
+
+    def __len__(self):
+        return len(self.handles) - len(self.free)
 
 
 class _HandleWrapper:
@@ -7,17 +81,72 @@ class _HandleWrapper:
     cleans up on deletion. Inspired from https://github.com/d-michail/python-jgrapht/.
     """
 
-    def __init__(self, handle):
+    __slots__ = ("_handle_", "_isolate", "_table", "_index", "__weakref__")
+
+    def __init__(self, handle, model=None):
+        """
+        :param handle: A backend object handle.
+        :param model: The model through which the object was created (optional). If given, the handle is released
+            when the model is closed.
+        """
         self._handle_ = handle
+        # Index of the isolate of the object: the one of its model, or the current one when it is created.
+        if not isolate._multiple:
+            self._isolate = 0
+        elif model is not None:
+            self._isolate = model._isolate
+        else:
+            self._isolate = isolate.get_current_isolate()
+        self._table = getattr(model, "_tracked", None)
+        if self._table is not None:
+            self._index = self._table.add(handle)
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        isolate._register_class(cls)
 
     @property
     def _handle(self):
+        if isolate._multiple:
+            isolate._check_isolate(self)
+        if self._handle_ is _RELEASED or (self._table is not None and self._table.closed):
+            raise RuntimeError("[{}] This object was released (its model was closed)".format(type(self).__name__))
         return self._handle_
 
+    def _set_handle(self, handle):
+        """
+        Sets the handle of an object created without one.
+        """
+        self._handle_ = handle
+        if self._table is not None:
+            self._table.handles[self._index] = handle
+
+    def _take_handle(self):
+        """
+        Removes the handle from this object, which no longer releases it.
+
+        :return: The handle.
+        """
+        handle = self._handle
+        if self._table is not None:
+            self._table.remove(self._index)
+            self._table = None
+        self._handle_ = None
+        return handle
+
     def __del__(self):
-        if backend.chocosolver_is_initialized():
-            if self._handle_ is not None:
-                backend.chocosolver_handles_destroy(self._handle_)
+        # The object may be deleted before its initialization completed (e.g. on a failed argument check)
+        table = getattr(self, "_table", None)
+        if table is not None:
+            if table.closed:
+                # Released by Model.close()
+                return
+            table.remove(self._index)
+        handle = getattr(self, "_handle_", None)
+        if handle is not None and handle is not _RELEASED:
+            _pending_handles.append((self._isolate, handle))
+            if len(_pending_handles) >= _flush_threshold:
+                flush_handles()
 
     def __repr__(self):
         return "_HandleWrapper(%r)" % self._handle_
@@ -0,0 +1,37 @@
+import weakref
+
+
+class _InternTable:
+    """
+    Weak table of the Python wrappers of derived Java objects (e.g. views), keyed by the Python object they are
+    derived from and the parameters of the derivation. Entries are dropped when either the source object or the
+    wrapper is garbage collected, so that a key cannot match an object reusing the identity of a dead one.
+    """
+
+    def __init__(self):
+        self._entries = {}
+
+    def get(self, source, key: tuple, create):
+        """
+        :param source: The Python object the wrapper is derived from.
+        :param key: The parameters of the derivation (e.g. the kind of view and its constant).
+        :param create: A function creating the wrapper, if it is not already in the table.
+        :return: The wrapper associated with (source, key).
+        """
+        full_key = (id(source),) + key
+        entry = self._entries.get(full_key)
+        if entry is not None:
+            source_ref, wrapper_ref = entry
+            wrapper = wrapper_ref()
+            if source_ref() is source and wrapper is not None:
+                return wrapper
+        wrapper = create()
+        remove = lambda _, entries=self._entries, k=full_key: entries.pop(k, None)
+        self._entries[full_key] = (weakref.ref(source, remove), weakref.ref(wrapper, remove))
+        return wrapper
+
+    def __len__(self):
+        return len(self._entries)
+
+    def clear(self):
+        self._entries.clear()
@@ -1,42 +1,171 @@
+from array import array
+from itertools import chain
 from typing import List, Union
 
 from pychoco import backend
 
+_INT_SIZE = array("i").itemsize
+
+
+def as_int_buffer(ints):
+    """
+    Returns a C-contiguous buffer of native ints holding the values of `ints`. Objects already exposing
+    such a buffer (array('i'), NumPy int32 arrays, memoryviews over them) are used without any copy,
+    untyped byte buffers (bytes, bytearray) are read as packed native ints, and any other buffer (including
+    typed small-int buffers, e.g. array('b') or NumPy int8 arrays) or sequence of ints is copied element-wise
+    into an array('i'). Multidimensional buffers are flattened in row-major order.
+    :param ints: A sequence of Python ints, or an object supporting the buffer protocol.
+    :return: An object supporting the buffer protocol, with native int items.
+    """
+    try:
+        view = memoryview(ints)
+    except TypeError:
+        return array("i", ints)
+    if view.format == "B" and isinstance(view.obj, (bytes, bytearray)):
+        return view.cast("i")
+    if view.format == "c":
+        view = view.cast("B")
+    if view.itemsize == _INT_SIZE and view.format.lstrip("@=") in ("i", "l"):
+        if not view.c_contiguous:
+            return array("i", view.tobytes())
+        if view.ndim == 1 and view.format == "i":
+            return view
+        return view.cast("B").cast("i")
+    # Other item types are copied element-wise (tolist() also reads non-contiguous views, e.g. strided slices)
+    values = view.tolist()
+    for _ in range(view.ndim - 1):
+        values = chain.from_iterable(values)
+    return array("i", values)
+
+
+def get_handles(objects: List["_HandleWrapper"]):
+    """
+    Gathers the backend handles of a sequence of Python objects wrapping a Java object.
+    :param objects: A list of Python objects holding a handle (e.g. variables, constraints, tasks).
+    :return: A list of backend handles, in the same order.
+    """
+    return [o._handle for o in objects]
+
+
+def cached_array(kind: str, objects: List["_HandleWrapper"], build):
+    """
+    Returns a Java array handle for a list of Python objects, from the array cache of their model if
+    it has one (see Model.array_cache_info()).
+    :param kind: The kind of Java array (e.g. "intvar", "boolvar").
+    :param objects: A list of Python objects holding a handle, declared in the same model.
+    :param build: A function building the Java array handle from the objects, on cache misses.
+    :return: A Java array handle.
+    """
+    if len(objects) > 0:
+        cache = getattr(getattr(objects[0], "_model", None), "_array_cache", None)
+        if cache is not None:
+            return cache.get(kind, objects, build)
+    return build(objects)
+
+
 def make_int_array(ints: List[int]):
     """
-    Creates a Java int[] handle from a list of Python ints
-    :param ints: A list of Python ints
+    Creates a Java int[] handle from a list of Python ints, or from any object supporting the buffer protocol
+    (see `as_int_buffer`). The values are transferred to Java with a single backend call.
+    :param ints: A list of Python ints, or a buffer of ints.
     :return: A Java int[] handle.
     """
-    ints_array = backend.create_int_array(len(ints))
-    for i in range(0, len(ints)):
-        backend.int_array_set(ints_array, ints[i], i)
-    return ints_array
+    return backend.create_int_array_from_buffer(as_int_buffer(ints))
+
+
+def get_intvars_bounds(intvars: List["IntVar"]):
+    """
+    Retrieves the bounds of several IntVars with a single backend call.
+    :param intvars: A list of IntVars.
+    :return: An array('i') holding the lower and upper bounds of each variable, one after the other.
+    """
+    bounds = new_int_buffer(2 * len(intvars))
+    backend.get_intvars_bounds(get_handles(intvars), bounds)
+    return bounds
+
+
+def new_int_buffer(length: int, container: str = "array"):
+    """
+    Allocates a zero-filled buffer of `length` native ints.
+    :param length: The number of ints.
+    :param container: "array" (or "list") for an array('i'), "numpy" for a NumPy int32 array.
+    :return: A writable buffer of native ints.
+    """
+    assert container in ("list", "array", "numpy"), '[new_int_buffer] container must be in ["list", "array", "numpy"]'
+    if container == "numpy":
+        import numpy
+        return numpy.zeros(length, dtype=numpy.intc)
+    return array("i", [0]) * length
 
 
-def get_int_array(handle):
+def get_int_array(handle, container: str = "list"):
     """
-    Return a Python int list from a Java int[] handle.
+    Return the content of a Java int[] handle, copied with a single backend call.
     :param handle: An int[] handle
-    :return: A python int list.
+    :param container: "list" (default) for a Python int list, "array" for an array('i'), "numpy" for a NumPy
+        int32 array.
+    :return: A python int list, an array('i') or a NumPy array.
     """
-    array = []
-    for i in range(0, backend.int_array_length(handle)):
-        array.append(backend.int_array_get(handle, i))
-    return array
+    buffer = new_int_buffer(backend.int_array_length(handle), container)
+    get_int_array_into(handle, buffer)
+    if container == "list":
+        return buffer.tolist()
+    return buffer
 
 
-def make_int_2d_array(arrays: List[List[int]]):
+def get_int_array_into(handle, out) -> int:
+    """
+    Copy the content of a Java int[] handle into a caller-provided buffer, with a single backend call.
+    If `out` is too small, only its first elements are filled.
+    :param handle: An int[] handle
+    :param out: A writable, C-contiguous buffer of native ints (e.g. array('i'), NumPy int32 array).
+    :return: The length of the Java int[] (which may be greater than the size of `out`).
     """
-    Creates a Java int[][] handle from a list of Python int lists.
-    :param arrays: A 2d int matrix.
+    view = memoryview(out)
+    if view.itemsize != _INT_SIZE or view.format.lstrip("@=") not in ("i", "l"):
+        raise ValueError("[get_int_array_into] out must be a buffer of native ints, got format '{}'"
+                         .format(view.format))
+    return backend.int_array_to_buffer(handle, view)
+
+
+def make_int_2d_array(arrays: List[List[int]], arity: Union[int, None] = None):
+    """
+    Creates a Java int[][] handle from a list of Python int lists, or from a row-major buffer of ints:
+    either a 2D buffer (e.g. a 2D NumPy array), or a flat buffer whose rows are `arity` ints long.
+    When all rows have the same length, the values are transferred to Java with a single backend call.
+    :param arrays: A 2d int matrix, or a buffer of ints.
+    :param arity: The length of the rows (required for flat buffers). If not None, every row must have this length.
     :return: A Java int[][] handle.
     """
-    int_2d_array = backend.create_int_2d_array(len(arrays))
-    for i in range(0, len(arrays)):
-        handle = make_int_array(arrays[i])
-        backend.int_2d_array_set(int_2d_array, handle, i)
-    return int_2d_array
+    try:
+        view = memoryview(arrays)
+    except TypeError:
+        lengths = set(len(row) for row in arrays)
+        if len(lengths) != 1 or 0 in lengths:
+            # Ragged or empty rows, one backend call per row
+            assert arity is None or lengths <= {arity}, \
+                "[make_int_2d_array] All rows must have {} elements".format(arity)
+            int_2d_array = backend.create_int_2d_array(len(arrays))
+            for i in range(0, len(arrays)):
+                handle = make_int_array(arrays[i])
+                backend.int_2d_array_set(int_2d_array, handle, i)
+            return int_2d_array
+        row_length = lengths.pop()
+        assert arity is None or row_length == arity, \
+            "[make_int_2d_array] All rows must have {} elements".format(arity)
+        buffer = array("i", chain.from_iterable(arrays))
+        return backend.create_int_2d_array_from_buffer(buffer, row_length)
+    if view.ndim == 2:
+        assert arity is None or view.shape[1] == arity, \
+            "[make_int_2d_array] All rows must have {} elements".format(arity)
+        arity = view.shape[1]
+    else:
+        assert view.ndim == 1, "[make_int_2d_array] Buffers must have one or two dimensions"
+        assert arity is not None, "[make_int_2d_array] The arity of a flat buffer must be given"
+    assert arity > 0, "[make_int_2d_array] Rows must not be empty"
+    buffer = as_int_buffer(view)
+    assert len(buffer) % arity == 0, "[make_int_2d_array] The buffer length must be a multiple of {}".format(arity)
+    return backend.create_int_2d_array_from_buffer(buffer, arity)
 
 
 def make_int_3d_array(arrays: List[List[List[int]]]):
@@ -65,16 +194,24 @@ def make_int_4d_array(arrays: List[List[List[List[int]]]]):
     return int_4d_array
 
 
-def make_intvar_array(intvars: List["IntVar"]):
+def make_intvar_array(intvars: List["IntVar"], cached: bool = True):
     """
     Creates a Java IntVar[] handle from a list of Python IntVars
     :param intvars: A list of Python IntVars
+    :param cached: If True, use (and feed) the array cache of the model.
     :return: A Java IntVar[] handle.
     """
-    vars_array = backend.create_intvar_array(len(intvars))
-    for i in range(0, len(intvars)):
-        backend.intvar_array_set(vars_array, intvars[i]._handle, i)
-    return vars_array
+    from pychoco.variables.intvar_array import IntVarArray
+    if isinstance(intvars, IntVarArray):
+        assert intvars.ndim == 1, "[make_intvar_array] Expected a 1D array of variables"
+        return intvars._handle
+    if cached:
+        return cached_array("intvar", intvars, _build_intvar_array)
+    return _build_intvar_array(intvars)
+
+
+def _build_intvar_array(intvars: List["IntVar"]):
+    return backend.create_intvar_array_from_handles(get_handles(intvars))
 
 
 def make_intvar_2d_array(arrays: List[List["IntVar"]]):
@@ -83,23 +220,34 @@ def make_intvar_2d_array(arrays: List[List["IntVar"]]):
     :param arrays: A list of Intvar lists.
     :return: A Java IntVar[][] handle.
     """
+    from pychoco.variables.intvar_array import IntVarArray
+    if isinstance(arrays, IntVarArray):
+        return arrays._get_matrix_handle()
     intvar_2d_array = backend.create_intvar_2d_array(len(arrays))
     for i in range(0, len(arrays)):
-        handle = make_intvar_array(arrays[i])
+        handle = make_intvar_array(arrays[i], cached=False)
         backend.intvar_2d_array_set(intvar_2d_array, handle, i)
     return intvar_2d_array
 
 
-def make_boolvar_array(boolvars: List["BoolVar"]):
+def make_boolvar_array(boolvars: List["BoolVar"], cached: bool = True):
     """
     Creates a Java BoolVar[] handle from a list of Python BoolVars
     :param boolvars: A list of Python BoolVars
+    :param cached: If True, use (and feed) the array cache of the model.
     :return: A Java BoolVars[] handle.
     """
-    vars_array = backend.create_boolvar_array(len(boolvars))
-    for i in range(0, len(boolvars)):
-        backend.boolvar_array_set(vars_array, boolvars[i]._handle, i)
-    return vars_array
+    from pychoco.variables.intvar_array import BoolVarArray
+    if isinstance(boolvars, BoolVarArray):
+        assert boolvars.ndim == 1, "[make_boolvar_array] Expected a 1D array of variables"
+        return boolvars._handle
+    if cached:
+        return cached_array("boolvar", boolvars, _build_boolvar_array)
+    return _build_boolvar_array(boolvars)
+
+
+def _build_boolvar_array(boolvars: List["BoolVar"]):
+    return backend.create_boolvar_array_from_handles(get_handles(boolvars))
 
 
 def make_boolvar_2d_array(arrays: List[List["BoolVar"]]):
@@ -108,9 +256,12 @@ def make_boolvar_2d_array(arrays: List[List["BoolVar"]]):
     :param arrays: A list of BoolVar lists.
     :return: A Java BoolVar[][] handle.
     """
+    from pychoco.variables.intvar_array import BoolVarArray
+    if isinstance(arrays, BoolVarArray):
+        return arrays._get_matrix_handle()
     boolvar_2d_array = backend.create_boolvar_2d_array(len(arrays))
     for i in range(0, len(arrays)):
-        handle = make_boolvar_array(arrays[i])
+        handle = make_boolvar_array(arrays[i], cached=False)
         backend.boolvar_2d_array_set(boolvar_2d_array, handle, i)
     return boolvar_2d_array
 
@@ -130,40 +281,52 @@ def get_boolvar_array(handle, model):
     return array
 
 
-def make_setvar_array(setvars: List["SetVar"]):
+def make_setvar_array(setvars: List["SetVar"], cached: bool = True):
     """
     Creates a Java SetVar[] handle from a list of Python SetVars
     :param setvars: A list of Python SetVars
+    :param cached: If True, use (and feed) the array cache of the model.
     :return: A Java SetVar[] handle.
     """
-    vars_array = backend.create_setvar_array(len(setvars))
-    for i in range(0, len(setvars)):
-        backend.setvar_array_set(vars_array, setvars[i]._handle, i)
-    return vars_array
+    if cached:
+        return cached_array("setvar", setvars, _build_setvar_array)
+    return _build_setvar_array(setvars)
+
+
+def _build_setvar_array(setvars: List["SetVar"]):
+    return backend.create_setvar_array_from_handles(get_handles(setvars))
 
 
-def make_graphvar_array(graphvars: List["GraphVar"]):
+def make_graphvar_array(graphvars: List["GraphVar"], cached: bool = True):
     """
     Creates a Java GraphVar[] handle from a list of Python GraphVars
     :param graphvars: A list of Python GraphVars
+    :param cached: If True, use (and feed) the array cache of the model.
     :return: A Java GraphVar[] handle.
     """
-    vars_array = backend.create_graphvar_array(len(graphvars))
-    for i in range(0, len(graphvars)):
-        backend.graphvar_array_set(vars_array, graphvars[i]._handle, i)
-    return vars_array
+    if cached:
+        return cached_array("graphvar", graphvars, _build_graphvar_array)
+    return _build_graphvar_array(graphvars)
 
 
-def make_task_array(tasks: List["Task"]):
+def _build_graphvar_array(graphvars: List["GraphVar"]):
+    return backend.create_graphvar_array_from_handles(get_handles(graphvars))
+
+
+def make_task_array(tasks: List["Task"], cached: bool = True):
     """
     Creates a Java Task[] handle from a list of Python Tasks
     :param tasks: A list of Python Tasks
+    :param cached: If True, use (and feed) the array cache of the model.
     :return: A Java Task[] handle.
     """
-    task_array = backend.create_task_array(len(tasks))
-    for i in range(0, len(tasks)):
-        backend.task_array_set(task_array, tasks[i]._handle, i)
-    return task_array
+    if cached:
+        return cached_array("task", tasks, _build_task_array)
+    return _build_task_array(tasks)
+
+
+def _build_task_array(tasks: List["Task"]):
+    return backend.create_task_array_from_handles(get_handles(tasks))
 
 
 def make_constraint_array(constraints: List["Constraint"]):
@@ -172,10 +335,7 @@ def make_constraint_array(constraints: List["Constraint"]):
     :param constraints: A list of Python Constraint
     :return: A Java Constraint[] handle.
     """
-    cons_array = backend.create_constraint_array(len(constraints))
-    for i in range(0, len(constraints)):
-        backend.constraint_array_set(cons_array, constraints[i]._handle, i)
-    return cons_array
+    return backend.create_constraint_array_from_handles(get_handles(constraints))
 
 
 def make_criterion_var_array(criterion):
@@ -221,10 +381,14 @@ def make_supportable_2d_array(arrays: List[List["Supportable"]]):
     return array
 
 
-def extract_solutions(solution_list_handle) -> List["Solution"]:
+def extract_solutions(solution_list_handle, projection: "_Projection" = None,
+                      model: "_Model" = None) -> List["Solution"]:
     """
     Convert a Java List<Solution> handler into a Python list of Solutions.
     :param solution_list_handle: Java List<Solution> handle.
+    :param projection: If not None, the solutions are converted into ProjectedSolutions (and the Java
+        solutions are released one after the other).
+    :param model: The model of the solutions (optional), which releases them when it is closed.
     :return: a list of Solutions.
     """
     from pychoco.solution import Solution
@@ -232,5 +396,48 @@ def extract_solutions(solution_list_handle) -> List["Solution"]:
     size = backend.list_size(solution_list_handle)
     for i in range(0, size):
         sol_handle = backend.list_solution_get(solution_list_handle, i)
-        solutions.append(Solution(sol_handle))
+        if projection is None:
+            solutions.append(Solution(sol_handle, model))
+        else:
+            solutions.append(projection.extract(Solution(sol_handle)))
     return solutions
+
+
+def get_solution_matrix(solution_list_handle, intvars: List["IntVar"], container: str = "list"):
+    """
+    Return the values of some variables in all the solutions of a Java List<Solution>, as a
+    (nb solutions x nb variables) matrix filled with a single backend call.
+    :param solution_list_handle: Java List<Solution> handle.
+    :param intvars: A list (or IntVarArray) of IntVars (the columns of the matrix).
+    :param container: "list" (default) for a list of int lists, "array" for a 2D memoryview over an array('i'),
+        "numpy" for a 2D NumPy int32 array. If there is no solution, the matrix is an empty list (memoryviews cannot
+        have an empty dimension), or a (0, nb variables) NumPy array.
+    :return: The solution matrix.
+    """
+    nb_solutions = backend.list_size(solution_list_handle)
+    nb_vars = len(intvars)
+    values = new_int_buffer(nb_solutions * nb_vars, "numpy" if container == "numpy" else "array")
+    backend.list_solution_int_matrix(solution_list_handle, make_intvar_array(intvars), values)
+    return shape_int_matrix(values, nb_solutions, nb_vars, container)
+
+
+def shape_int_matrix(values, nb_rows: int, nb_cols: int, container: str = "list"):
+    """
+    Return a (nb_rows x nb_cols) matrix over a flat buffer of ints, stored row by row.
+    :param values: An array('i') (or a NumPy int32 array if `container` is "numpy").
+    :param nb_rows: The number of rows.
+    :param nb_cols: The number of columns.
+    :param container: "list" (default) for a list of int lists, "array" for a 2D memoryview over `values`,
+        "numpy" for a 2D NumPy int32 array. If there is no row, the matrix is an empty list, or a (0, nb_cols)
+        NumPy array.
+    :return: The matrix.
+    """
+    if container == "numpy":
+        return values.reshape(nb_rows, nb_cols)
+    if container == "list":
+        return [values[i * nb_cols:(i + 1) * nb_cols].tolist() for i in range(0, nb_rows)]
+    if nb_rows == 0:
+        return []
+    if nb_cols == 0:
+        return [[] for _ in range(0, nb_rows)]
+    return memoryview(values).cast("B").cast("i", (nb_rows, nb_cols))
@@ -1,5 +1,6 @@
 #include <stdlib.h>
 #include <stdio.h>
+#include <string.h>
 
 #include <libchoco_capi.h>
 #include <graal_isolate.h>
@@ -7,39 +8,105 @@
 #ifdef _WIN32
 #define THREAD_LOCAL __declspec( thread )
 #else
+#include <pthread.h>
 #define THREAD_LOCAL __thread 
 #endif
 
-// single graalVM isolate
-static graal_isolate_t *isolate = NULL;
+// pool of graalVM isolates (each isolate has its own heap and garbage collector). Isolates are only ever added,
+// at indices 0 .. nb_isolates - 1: isolate 0 is the one created by chocosolver_init.
+#define MAX_ISOLATES 64
+static graal_isolate_t *isolates[MAX_ISOLATES];
+static int nb_isolates = 0;
 
-// thread local variable
-static THREAD_LOCAL graal_isolatethread_t *thread = NULL;
+// thread local variables: the isolate the calling thread currently works with, and its isolate threads
+static THREAD_LOCAL int current_isolate = 0;
+static THREAD_LOCAL graal_isolatethread_t *isolate_threads[MAX_ISOLATES];
 
-// library init
+#define isolate (isolates[current_isolate])
+#define thread (isolate_threads[current_isolate])
+
+void chocosolver_init();
+
+#ifndef _WIN32
+// detaches the threads that exit while attached to isolates (through a thread-specific key destructor)
+static pthread_key_t detach_key;
+static pthread_once_t detach_key_once = PTHREAD_ONCE_INIT;
+
+static void detach_at_exit(void* isolateThreads) {
+    graal_isolatethread_t **threads = (graal_isolatethread_t**) isolateThreads;
+    for (int i = 0; i < nb_isolates; i++) {
+        if (threads[i] != NULL) {
+            graal_detach_thread(threads[i]);
+            threads[i] = NULL;
+        }
+    }
+}
+
+static void create_detach_key() {
+    pthread_key_create(&detach_key, detach_at_exit);
+}
+#endif
+
+static void register_detach_at_exit() {
+#ifndef _WIN32
+    pthread_once(&detach_key_once, create_detach_key);
+    pthread_setspecific(detach_key, isolate_threads);
+#endif
+}
+
+// attaches the calling OS thread to its current isolate. The default isolate is created on the first backend call,
+// which holds the GIL: search calls (the only ones releasing it) need objects created beforehand.
+static void attach_thread() {
+    if (nb_isolates == 0) {
+        chocosolver_init();
+        return;
+    }
+    if (graal_attach_thread(isolate, &thread) != 0) {
+        fprintf(stderr, "graal_attach_thread error\n");
+        exit(EXIT_FAILURE);
+    }
+    register_detach_at_exit();
+}
+
+// parameters of the isolates created afterwards (see chocosolver_set_isolate_params)
+static int has_isolate_params = 0;
+static graal_create_isolate_params_t isolate_params;
+static char isolate_arg_max_heap[32];
+static char isolate_arg_young_gen[32];
+static char *isolate_argv[3];
+
+// creates a new isolate (the calling thread is attached to it) and returns its index, or -1 on failure
+static int create_isolate() {
+    if (nb_isolates >= MAX_ISOLATES) {
+        return -1;
+    }
+    int index = nb_isolates;
+    if (graal_create_isolate(has_isolate_params ? &isolate_params : NULL, &isolates[index], &isolate_threads[index]) != 0) {
+        return -1;
+    }
+    nb_isolates++;
+    register_detach_at_exit();
+    return index;
+}
+
+// library init: creates the default isolate, if it does not exist yet
 void chocosolver_init() {
     // do we need to synchronize here, or does the GIL protect us?
-    if (isolate == NULL) { 
+    if (nb_isolates == 0) {
         // create isolate and attach thread
-        if (graal_create_isolate(NULL, &isolate, &thread) != 0) {
+        if (create_isolate() != 0) {
             fprintf(stderr, "graal_create_isolate error\n");
             exit(EXIT_FAILURE);
         }
-    } else if (thread == NULL) {
-        // attach thread
-        if (graal_attach_thread(isolate, &thread) != 0) { 
-            fprintf(stderr, "graal_attach_thread error\n");
-            exit(EXIT_FAILURE);
-        }
     }
 }
 
+// attaches the calling OS thread to its current isolate on its first call (creating the default isolate on the very
+// first call). Safe without the GIL (see backend.i): isolate threads are thread-local, and graal_attach_thread is
+// thread-safe.
 #define LAZY_THREAD_ATTACH \
     if (thread == NULL) { \
-        if (graal_attach_thread(isolate, &thread) != 0) {    \
-            fprintf(stderr, "graal_attach_thread error\n");  \
-            exit(EXIT_FAILURE);                              \
-        }                                                    \
+        attach_thread(); \
     }
 
 // library cleanup
@@ -47,8 +114,83 @@ void chocosolver_cleanup() {
     // let the JVM cleanup for itself
 }
 
+// whether the default isolate exists. The calling thread does not need to be attached: it is attached on its next
+// call
 int chocosolver_is_initialized() { 
-    return thread != NULL && isolate != NULL;
+    return nb_isolates > 0;
+}
+
+// Isolates (called with the GIL held, which serializes the creation of isolates)
+
+// sets the parameters of the isolates created afterwards: the size of the address space reserved for their heap,
+// their maximum heap size and the size of their young generation (in bytes, 0 for the GraalVM defaults). Heap
+// sizes are given to the isolates as arguments (-Xmx, -Xmn), which requires parameters of version 3 or higher.
+void chocosolver_set_isolate_params(long long reservedAddressSpace, long long maxHeap, long long youngGen) {
+    memset(&isolate_params, 0, sizeof(isolate_params));
+    isolate_params.version = 3;
+    isolate_params.reserved_address_space_size = (__graal_uword) reservedAddressSpace;
+    int argc = 0;
+    // arguments are parsed as a command line: the first one is the program name
+    isolate_argv[argc++] = "pychoco";
+    if (maxHeap > 0) {
+        snprintf(isolate_arg_max_heap, sizeof(isolate_arg_max_heap), "-Xmx%lld", maxHeap);
+        isolate_argv[argc++] = isolate_arg_max_heap;
+    }
+    if (youngGen > 0) {
+        snprintf(isolate_arg_young_gen, sizeof(isolate_arg_young_gen), "-Xmn%lld", youngGen);
+        isolate_argv[argc++] = isolate_arg_young_gen;
+    }
+    // isolate arguments (argc, argv): GraalVM exposes them as the private fields _reserved_1 and _reserved_2 of the
+    // version 3 parameters. This relies on the layout of graal_create_isolate_params_t in the graal_isolate.h of
+    // GraalVM for JDK 22 (the version the capi is built with, see .github/workflows): check it on upgrades.
+    isolate_params._reserved_1 = argc;
+    isolate_params._reserved_2 = isolate_argv;
+    has_isolate_params = 1;
+}
+
+int chocosolver_create_isolate() {
+    return create_isolate();
+}
+
+int chocosolver_get_nb_isolates() {
+    return nb_isolates;
+}
+
+int chocosolver_get_current_isolate() {
+    return current_isolate;
+}
+
+// the calling thread is attached to the isolate on its next call
+void chocosolver_set_current_isolate(int index) {
+    if (index >= 0 && index < nb_isolates) {
+        current_isolate = index;
+    }
+}
+
+// Threads
+
+void chocosolver_attach_thread() {
+    LAZY_THREAD_ATTACH
+}
+
+// detaches the calling thread from all the isolates
+void chocosolver_detach_thread() {
+#ifndef _WIN32
+    // the key is created when a thread is attached for the first time
+    pthread_once(&detach_key_once, create_detach_key);
+    pthread_setspecific(detach_key, NULL);
+#endif
+    for (int i = 0; i < nb_isolates; i++) {
+        if (isolate_threads[i] != NULL) {
+            graal_detach_thread(isolate_threads[i]);
+            isolate_threads[i] = NULL;
+        }
+    }
+}
+
+// whether the calling thread is attached to its current isolate
+int chocosolver_is_thread_attached() {
+    return thread != NULL;
 }
 
 // Model API
@@ -276,6 +418,40 @@ void* get_set_val(void* solutionHandle, void* setVarHandle) {
     LAZY_THREAD_ATTACH
     return Java_org_chocosolver_capi_SolutionApi_getSetVal(thread, solutionHandle, setVarHandle);
 }
+int get_int_vals(void* solutionHandle, void* intVarArrayHandle, int* values, int capacity) {
+    LAZY_THREAD_ATTACH
+    int length = Java_org_chocosolver_capi_ArrayApi_intVar_length(thread, intVarArrayHandle);
+    for (int i = 0; i < length && i < capacity; i++) {
+        void* varHandle = Java_org_chocosolver_capi_ArrayApi_intVar_get(thread, intVarArrayHandle, i);
+        values[i] = Java_org_chocosolver_capi_SolutionApi_getIntVal(thread, solutionHandle, varHandle);
+        Java_org_chocosolver_capi_HandlesApi_destroy(thread, varHandle);
+    }
+    return length;
+}
+// Values of set variables in a solution, packed in a CSR-like layout: the (length + 1) offsets of the sets in the
+// values, followed by the values. Returns the size of the whole layout (values are only written up to capacity).
+int get_set_vals(void* solutionHandle, void** setVarHandles, int length, int* values, int capacity) {
+    LAZY_THREAD_ATTACH
+    int offset = length + 1;
+    for (int i = 0; i < length; i++) {
+        if (i < capacity) {
+            values[i] = offset;
+        }
+        void* setHandle = Java_org_chocosolver_capi_SolutionApi_getSetVal(thread, solutionHandle, setVarHandles[i]);
+        int size = Java_org_chocosolver_capi_ArrayApi_int_length(thread, setHandle);
+        for (int k = 0; k < size; k++) {
+            if (offset + k < capacity) {
+                values[offset + k] = Java_org_chocosolver_capi_ArrayApi_int_get(thread, setHandle, k);
+            }
+        }
+        Java_org_chocosolver_capi_HandlesApi_destroy(thread, setHandle);
+        offset += size;
+    }
+    if (length < capacity) {
+        values[length] = offset;
+    }
+    return offset;
+}
 
 // Variable (generic)
 
@@ -338,6 +514,14 @@ int get_intvar_ub(void* varHandle) {
     LAZY_THREAD_ATTACH
     return Java_org_chocosolver_capi_IntVarApi_getUB(thread, varHandle);
 }
+// Bounds of several IntVars, written as (lb, ub) pairs (up to capacity).
+void get_intvars_bounds(void** varHandles, int length, int* bounds, int capacity) {
+    LAZY_THREAD_ATTACH
+    for (int i = 0; i < length && 2 * i + 1 < capacity; i++) {
+        bounds[2 * i] = Java_org_chocosolver_capi_IntVarApi_getLB(thread, varHandles[i]);
+        bounds[2 * i + 1] = Java_org_chocosolver_capi_IntVarApi_getUB(thread, varHandles[i]);
+    }
+}
 int get_intvar_value(void* varHandle) {
     LAZY_THREAD_ATTACH
     return Java_org_chocosolver_capi_IntVarApi_getValue(thread, varHandle);
@@ -373,6 +557,104 @@ void* boolvar_sb(void* modelHandle, char* name, int value) {
     return Java_org_chocosolver_capi_BoolVarApi_boolVar_sb(thread, modelHandle, name, value);
 }
 
+// Variable arrays (bulk creation)
+
+// Formats the name of the index-th variable of an array: prefix_i, or prefix_r,c if ncols > 0.
+static void array_var_name(char* name, size_t size, char* prefix, int index, int ncols) {
+    if (ncols > 0) {
+        snprintf(name, size, "%s_%d,%d", prefix, index / ncols, index % ncols);
+    } else {
+        snprintf(name, size, "%s_%d", prefix, index);
+    }
+}
+
+#define ARRAY_VAR_NAME_SIZE(prefix) (prefix == NULL ? 0 : strlen(prefix) + 32)
+
+void* intvars_ii(void* modelHandle, char* prefix, int ncols, int size, int lb, int ub, int boundedDomain) {
+    LAZY_THREAD_ATTACH
+    void* arrayHandle = Java_org_chocosolver_capi_ArrayApi_intVar_create(thread, size);
+    size_t nameSize = ARRAY_VAR_NAME_SIZE(prefix);
+    char* name = prefix == NULL ? NULL : malloc(nameSize);
+    for (int i = 0; i < size; i++) {
+        void* varHandle;
+        if (name != NULL) {
+            array_var_name(name, nameSize, prefix, i, ncols);
+            varHandle = boundedDomain < 0
+                ? Java_org_chocosolver_capi_IntVarApi_intVar_sii(thread, modelHandle, name, lb, ub)
+                : Java_org_chocosolver_capi_IntVarApi_intVar_siib(thread, modelHandle, name, lb, ub, boundedDomain);
+        } else {
+            varHandle = boundedDomain < 0
+                ? Java_org_chocosolver_capi_IntVarApi_intVar_ii(thread, modelHandle, lb, ub)
+                : Java_org_chocosolver_capi_IntVarApi_intVar_iib(thread, modelHandle, lb, ub, boundedDomain);
+        }
+        Java_org_chocosolver_capi_ArrayApi_intVar_set(thread, arrayHandle, varHandle, i);
+        Java_org_chocosolver_capi_HandlesApi_destroy(thread, varHandle);
+    }
+    free(name);
+    return arrayHandle;
+}
+void* intvars_i(void* modelHandle, char* prefix, int ncols, int* values, int length) {
+    LAZY_THREAD_ATTACH
+    void* arrayHandle = Java_org_chocosolver_capi_ArrayApi_intVar_create(thread, length);
+    size_t nameSize = ARRAY_VAR_NAME_SIZE(prefix);
+    char* name = prefix == NULL ? NULL : malloc(nameSize);
+    for (int i = 0; i < length; i++) {
+        void* varHandle;
+        if (name != NULL) {
+            array_var_name(name, nameSize, prefix, i, ncols);
+            varHandle = Java_org_chocosolver_capi_IntVarApi_intVar_si(thread, modelHandle, name, values[i]);
+        } else {
+            varHandle = Java_org_chocosolver_capi_IntVarApi_intVar_i(thread, modelHandle, values[i]);
+        }
+        Java_org_chocosolver_capi_ArrayApi_intVar_set(thread, arrayHandle, varHandle, i);
+        Java_org_chocosolver_capi_HandlesApi_destroy(thread, varHandle);
+    }
+    free(name);
+    return arrayHandle;
+}
+void* boolvars_b(void* modelHandle, char* prefix, int ncols, int size, int value) {
+    LAZY_THREAD_ATTACH
+    void* arrayHandle = Java_org_chocosolver_capi_ArrayApi_boolVar_create(thread, size);
+    size_t nameSize = ARRAY_VAR_NAME_SIZE(prefix);
+    char* name = prefix == NULL ? NULL : malloc(nameSize);
+    for (int i = 0; i < size; i++) {
+        void* varHandle;
+        if (name != NULL) {
+            array_var_name(name, nameSize, prefix, i, ncols);
+            varHandle = value < 0
+                ? Java_org_chocosolver_capi_BoolVarApi_boolVar_s(thread, modelHandle, name)
+                : Java_org_chocosolver_capi_BoolVarApi_boolVar_sb(thread, modelHandle, name, value);
+        } else {
+            varHandle = value < 0
+                ? Java_org_chocosolver_capi_BoolVarApi_boolVar(thread, modelHandle)
+                : Java_org_chocosolver_capi_BoolVarApi_boolVar_b(thread, modelHandle, value);
+        }
+        Java_org_chocosolver_capi_ArrayApi_boolVar_set(thread, arrayHandle, varHandle, i);
+        Java_org_chocosolver_capi_HandlesApi_destroy(thread, varHandle);
+    }
+    free(name);
+    return arrayHandle;
+}
+void* boolvars_arr(void* modelHandle, char* prefix, int ncols, int* values, int length) {
+    LAZY_THREAD_ATTACH
+    void* arrayHandle = Java_org_chocosolver_capi_ArrayApi_boolVar_create(thread, length);
+    size_t nameSize = ARRAY_VAR_NAME_SIZE(prefix);
+    char* name = prefix == NULL ? NULL : malloc(nameSize);
+    for (int i = 0; i < length; i++) {
+        void* varHandle;
+        if (name != NULL) {
+            array_var_name(name, nameSize, prefix, i, ncols);
+            varHandle = Java_org_chocosolver_capi_BoolVarApi_boolVar_sb(thread, modelHandle, name, values[i]);
+        } else {
+            varHandle = Java_org_chocosolver_capi_BoolVarApi_boolVar_b(thread, modelHandle, values[i]);
+        }
+        Java_org_chocosolver_capi_ArrayApi_boolVar_set(thread, arrayHandle, varHandle, i);
+        Java_org_chocosolver_capi_HandlesApi_destroy(thread, varHandle);
+    }
+    free(name);
+    return arrayHandle;
+}
+
 // SetVars
 
 void* setvar_s_iviv(void* modelHandle, char* name, void* lbHandle, void* ubHandle) {
@@ -1604,6 +1886,14 @@ void* create_intvar_array(int size) {
     LAZY_THREAD_ATTACH
     return Java_org_chocosolver_capi_ArrayApi_intVar_create(thread, size);
 }
+void* create_intvar_array_from_handles(void** handles, int length) {
+    LAZY_THREAD_ATTACH
+    void* arrayHandle = Java_org_chocosolver_capi_ArrayApi_intVar_create(thread, length);
+    for (int i = 0; i < length; i++) {
+        Java_org_chocosolver_capi_ArrayApi_intVar_set(thread, arrayHandle, handles[i], i);
+    }
+    return arrayHandle;
+}
 
 int intvar_array_length(void* arrayHandle) {
     LAZY_THREAD_ATTACH
@@ -1617,6 +1907,88 @@ void* intvar_array_get(void* arrayHandle, int index) {
     LAZY_THREAD_ATTACH
     return Java_org_chocosolver_capi_ArrayApi_intVar_get(thread, arrayHandle, index);
 }
+void intvar_array_get_all(void* arrayHandle, void** handles, int length) {
+    LAZY_THREAD_ATTACH
+    for (int i = 0; i < length; i++) {
+        handles[i] = Java_org_chocosolver_capi_ArrayApi_intVar_get(thread, arrayHandle, i);
+    }
+}
+int intvar_array_values(void* arrayHandle, int* values, int capacity) {
+    LAZY_THREAD_ATTACH
+    int length = Java_org_chocosolver_capi_ArrayApi_intVar_length(thread, arrayHandle);
+    for (int i = 0; i < length && i < capacity; i++) {
+        void* varHandle = Java_org_chocosolver_capi_ArrayApi_intVar_get(thread, arrayHandle, i);
+        values[i] = Java_org_chocosolver_capi_IntVarApi_getValue(thread, varHandle);
+        Java_org_chocosolver_capi_HandlesApi_destroy(thread, varHandle);
+    }
+    return length;
+}
+// Domains of the variables of an IntVar[], packed as 5 rows of length ints: lower bounds, upper bounds, domain sizes,
+// instantiated flags and enumerated flags. If withValues, the rows are followed by the (length + 1) offsets of the
+// domains in the values, and the values of the domains. Returns the size of the whole layout (values are only
+// written up to capacity).
+int intvar_array_snapshot(void* arrayHandle, int withValues, int* values, int capacity) {
+    LAZY_THREAD_ATTACH
+    int length = Java_org_chocosolver_capi_ArrayApi_intVar_length(thread, arrayHandle);
+    int valuesStart = 5 * length + (withValues ? length + 1 : 0);
+    int end = valuesStart;
+    for (int i = 0; i < length; i++) {
+        void* varHandle = Java_org_chocosolver_capi_ArrayApi_intVar_get(thread, arrayHandle, i);
+        int lb = Java_org_chocosolver_capi_IntVarApi_getLB(thread, varHandle);
+        int ub = Java_org_chocosolver_capi_IntVarApi_getUB(thread, varHandle);
+        int enumerated = Java_org_chocosolver_capi_IntVarApi_hasEnumeratedDomain(thread, varHandle);
+        void* domainHandle = NULL;
+        int size = ub - lb + 1;
+        // the C API has no domain size accessor: the values of an enumerated domain are only read if they are
+        // requested, or if its size cannot be deduced from its bounds (both bounds belong to the domain)
+        if (enumerated && (withValues || size > 2)) {
+            domainHandle = Java_org_chocosolver_capi_IntVarApi_getDomainValues(thread, varHandle);
+            size = Java_org_chocosolver_capi_ArrayApi_int_length(thread, domainHandle);
+        }
+        int row[5] = {lb, ub, size, Java_org_chocosolver_capi_VariableApi_isInstantiated(thread, varHandle), enumerated};
+        for (int r = 0; r < 5; r++) {
+            if (r * length + i < capacity) {
+                values[r * length + i] = row[r];
+            }
+        }
+        if (withValues) {
+            if (5 * length + i < capacity) {
+                values[5 * length + i] = end - valuesStart;
+            }
+            if (enumerated) {
+                for (int k = 0; k < size && end + k < capacity; k++) {
+                    values[end + k] = (int) Java_org_chocosolver_capi_ArrayApi_int_get(thread, domainHandle, k);
+                }
+                end += size;
+            } else {
+                // bounded domain: the [lb, ub] interval
+                if (end + 1 < capacity) {
+                    values[end] = lb;
+                    values[end + 1] = ub;
+                }
+                end += 2;
+            }
+        }
+        if (domainHandle != NULL) {
+            Java_org_chocosolver_capi_HandlesApi_destroy(thread, domainHandle);
+        }
+        Java_org_chocosolver_capi_HandlesApi_destroy(thread, varHandle);
+    }
+    if (withValues && 6 * length < capacity) {
+        values[6 * length] = end - valuesStart;
+    }
+    return end;
+}
+void* intvar_array_slice(void* arrayHandle, int start, int step, int length) {
+    LAZY_THREAD_ATTACH
+    void* sliceHandle = Java_org_chocosolver_capi_ArrayApi_intVar_create(thread, length);
+    for (int i = 0; i < length; i++) {
+        void* varHandle = Java_org_chocosolver_capi_ArrayApi_intVar_get(thread, arrayHandle, start + i * step);
+        Java_org_chocosolver_capi_ArrayApi_intVar_set(thread, sliceHandle, varHandle, i);
+        Java_org_chocosolver_capi_HandlesApi_destroy(thread, varHandle);
+    }
+    return sliceHandle;
+}
 
 // IntVar[][]
 
@@ -1639,6 +2011,14 @@ void* create_task_array(int size) {
     LAZY_THREAD_ATTACH
     return Java_org_chocosolver_capi_ArrayApi_task_create(thread, size);
 }
+void* create_task_array_from_handles(void** handles, int length) {
+    LAZY_THREAD_ATTACH
+    void* arrayHandle = Java_org_chocosolver_capi_ArrayApi_task_create(thread, length);
+    for (int i = 0; i < length; i++) {
+        Java_org_chocosolver_capi_ArrayApi_task_set(thread, arrayHandle, handles[i], i);
+    }
+    return arrayHandle;
+}
 int task_array_length(void* arrayHandle) {
     LAZY_THREAD_ATTACH
     return Java_org_chocosolver_capi_ArrayApi_task_length(thread, arrayHandle);
@@ -1654,10 +2034,30 @@ void* create_boolvar_array(int size) {
     LAZY_THREAD_ATTACH
     return Java_org_chocosolver_capi_ArrayApi_boolVar_create(thread, size);
 }
+void* create_boolvar_array_from_handles(void** handles, int length) {
+    LAZY_THREAD_ATTACH
+    void* arrayHandle = Java_org_chocosolver_capi_ArrayApi_boolVar_create(thread, length);
+    for (int i = 0; i < length; i++) {
+        Java_org_chocosolver_capi_ArrayApi_boolVar_set(thread, arrayHandle, handles[i], i);
+    }
+    return arrayHandle;
+}
 void boolvar_array_set(void* arrayHandle, void* boolVarHandle, int index) {
     LAZY_THREAD_ATTACH
     return Java_org_chocosolver_capi_ArrayApi_boolVar_set(thread, arrayHandle, boolVarHandle, index);
 }
+void* boolvar_array_slice(void* arrayHandle, int start, int step, int length) {
+    LAZY_THREAD_ATTACH
+    void* sliceHandle = Java_org_chocosolver_capi_ArrayApi_boolVar_create(thread, length);
+    // The capi has no BoolVar[] accessor: as a BoolVar[] is an IntVar[] in Java, intVar_get returns a handle to the
+    // BoolVar itself, which boolVar_set accepts.
+    for (int i = 0; i < length; i++) {
+        void* varHandle = Java_org_chocosolver_capi_ArrayApi_intVar_get(thread, arrayHandle, start + i * step);
+        Java_org_chocosolver_capi_ArrayApi_boolVar_set(thread, sliceHandle, varHandle, i);
+        Java_org_chocosolver_capi_HandlesApi_destroy(thread, varHandle);
+    }
+    return sliceHandle;
+}
 
 // BoolVar[][]
 
@@ -1676,6 +2076,14 @@ void* create_setvar_array(int size) {
     LAZY_THREAD_ATTACH
     return Java_org_chocosolver_capi_ArrayApi_setVar_create(thread, size);
 }
+void* create_setvar_array_from_handles(void** handles, int length) {
+    LAZY_THREAD_ATTACH
+    void* arrayHandle = Java_org_chocosolver_capi_ArrayApi_setVar_create(thread, length);
+    for (int i = 0; i < length; i++) {
+        Java_org_chocosolver_capi_ArrayApi_setVar_set(thread, arrayHandle, handles[i], i);
+    }
+    return arrayHandle;
+}
 int setvar_array_length(void* arrayHandle) {
     LAZY_THREAD_ATTACH
     return Java_org_chocosolver_capi_ArrayApi_setVar_length(thread, arrayHandle);
@@ -1691,6 +2099,14 @@ void* create_graphvar_array(int size) {
     LAZY_THREAD_ATTACH
     return Java_org_chocosolver_capi_ArrayApi_graphVar_create(thread, size);
 }
+void* create_graphvar_array_from_handles(void** handles, int length) {
+    LAZY_THREAD_ATTACH
+    void* arrayHandle = Java_org_chocosolver_capi_ArrayApi_graphVar_create(thread, length);
+    for (int i = 0; i < length; i++) {
+        Java_org_chocosolver_capi_ArrayApi_graphVar_set(thread, arrayHandle, handles[i], i);
+    }
+    return arrayHandle;
+}
 void graphvar_array_set(void* arrayHandle, void* graphVarHandle, int index) {
     LAZY_THREAD_ATTACH
     return Java_org_chocosolver_capi_ArrayApi_graphVar_set(thread, arrayHandle, graphVarHandle, index);
@@ -1702,6 +2118,14 @@ void* create_constraint_array(int size) {
     LAZY_THREAD_ATTACH
     return Java_org_chocosolver_capi_ArrayApi_constraint_create(thread, size);
 }
+void* create_constraint_array_from_handles(void** handles, int length) {
+    LAZY_THREAD_ATTACH
+    void* arrayHandle = Java_org_chocosolver_capi_ArrayApi_constraint_create(thread, length);
+    for (int i = 0; i < length; i++) {
+        Java_org_chocosolver_capi_ArrayApi_constraint_set(thread, arrayHandle, handles[i], i);
+    }
+    return arrayHandle;
+}
 void constraint_array_set(void* arrayHandle, void* constraintHandle, int index) {
     LAZY_THREAD_ATTACH
     return Java_org_chocosolver_capi_ArrayApi_constraint_set(thread, arrayHandle, constraintHandle, index);
@@ -1713,6 +2137,14 @@ void* create_int_array(int size) {
     LAZY_THREAD_ATTACH
     return Java_org_chocosolver_capi_ArrayApi_int_create(thread, size);
 }
+void* create_int_array_from_buffer(int* values, int length) {
+    LAZY_THREAD_ATTACH
+    void* intArrayHandle = Java_org_chocosolver_capi_ArrayApi_int_create(thread, length);
+    for (int i = 0; i < length; i++) {
+        Java_org_chocosolver_capi_ArrayApi_int_set(thread, intArrayHandle, values[i], i);
+    }
+    return intArrayHandle;
+}
 int int_array_length(void* intArrayHandle) {
     LAZY_THREAD_ATTACH
     return Java_org_chocosolver_capi_ArrayApi_int_length(thread, intArrayHandle);
@@ -1725,6 +2157,15 @@ int int_array_get(void* arrayHandle, int index) {
     LAZY_THREAD_ATTACH
     return Java_org_chocosolver_capi_ArrayApi_int_get(thread, arrayHandle, index);
 }
+int int_array_to_buffer(void* arrayHandle, int* values, int capacity) {
+    LAZY_THREAD_ATTACH
+    int length = Java_org_chocosolver_capi_ArrayApi_int_length(thread, arrayHandle);
+    int nb = length < capacity ? length : capacity;
+    for (int i = 0; i < nb; i++) {
+        values[i] = Java_org_chocosolver_capi_ArrayApi_int_get(thread, arrayHandle, i);
+    }
+    return length;
+}
 
 // int[][]
 
@@ -1732,6 +2173,19 @@ void* create_int_2d_array(int size) {
     LAZY_THREAD_ATTACH
     return Java_org_chocosolver_capi_ArrayApi_int_2d_array_create(thread, size);
 }
+void* create_int_2d_array_from_buffer(int* values, int length, int arity) {
+    LAZY_THREAD_ATTACH
+    int nbRows = arity > 0 ? length / arity : 0;
+    void* arrayHandle = Java_org_chocosolver_capi_ArrayApi_int_2d_array_create(thread, nbRows);
+    for (int i = 0; i < nbRows; i++) {
+        void* rowHandle = Java_org_chocosolver_capi_ArrayApi_int_create(thread, arity);
+        for (int j = 0; j < arity; j++) {
+            Java_org_chocosolver_capi_ArrayApi_int_set(thread, rowHandle, values[i * arity + j], j);
+        }
+        Java_org_chocosolver_capi_ArrayApi_int_2d_array_set(thread, arrayHandle, rowHandle, i);
+    }
+    return arrayHandle;
+}
 int int_2d_array_length(void* arrayHandle) {
     LAZY_THREAD_ATTACH
     return Java_org_chocosolver_capi_ArrayApi_int_2d_array_length(thread, arrayHandle);
@@ -1832,6 +2286,29 @@ void* list_solution_get(void* listHandle, int index) {
     LAZY_THREAD_ATTACH
     return Java_org_chocosolver_capi_ListApi_solution_get(thread, listHandle, index);
 }
+// Values of the variables of an IntVar[] in every solution of a List<Solution>, as a row-major
+// (nb solutions x nb variables) matrix. Returns the size of the matrix (values are only written up to capacity).
+int list_solution_int_matrix(void* listHandle, void* intVarArrayHandle, int* values, int capacity) {
+    LAZY_THREAD_ATTACH
+    int nbSolutions = Java_org_chocosolver_capi_ListApi_size(thread, listHandle);
+    int nbVars = Java_org_chocosolver_capi_ArrayApi_intVar_length(thread, intVarArrayHandle);
+    void** varHandles = malloc((nbVars > 0 ? nbVars : 1) * sizeof(void*));
+    for (int j = 0; j < nbVars; j++) {
+        varHandles[j] = Java_org_chocosolver_capi_ArrayApi_intVar_get(thread, intVarArrayHandle, j);
+    }
+    for (int i = 0; i < nbSolutions && i * nbVars < capacity; i++) {
+        void* solutionHandle = Java_org_chocosolver_capi_ListApi_solution_get(thread, listHandle, i);
+        for (int j = 0; j < nbVars && i * nbVars + j < capacity; j++) {
+            values[i * nbVars + j] = Java_org_chocosolver_capi_SolutionApi_getIntVal(thread, solutionHandle, varHandles[j]);
+        }
+        Java_org_chocosolver_capi_HandlesApi_destroy(thread, solutionHandle);
+    }
+    for (int j = 0; j < nbVars; j++) {
+        Java_org_chocosolver_capi_HandlesApi_destroy(thread, varHandles[j]);
+    }
+    free(varHandles);
+    return nbSolutions * nbVars;
+}
 
 // Search
 
@@ -2409,3 +2886,14 @@ void chocosolver_handles_destroy(void* handle) {
     return Java_org_chocosolver_capi_HandlesApi_destroy(thread, handle);
 }
 
+// destroys handles of the isolate at the given index, whatever the current isolate of the calling thread
+void chocosolver_handles_destroy_all(int isolateIndex, void** handles, int length) {
+    int previous = current_isolate;
+    current_isolate = isolateIndex;
+    LAZY_THREAD_ATTACH
+    for (int i = 0; i < length; i++) {
+        Java_org_chocosolver_capi_HandlesApi_destroy(thread, handles[i]);
+    }
+    current_isolate = previous;
+}
+
@@ -11,6 +11,20 @@ void chocosolver_init();
 void chocosolver_cleanup();
 int chocosolver_is_initialized();
 
+// Isolates
+
+void chocosolver_set_isolate_params(long long, long long, long long);
+int chocosolver_create_isolate();
+int chocosolver_get_nb_isolates();
+int chocosolver_get_current_isolate();
+void chocosolver_set_current_isolate(int);
+
+// Threads
+
+void chocosolver_attach_thread();
+void chocosolver_detach_thread();
+int chocosolver_is_thread_attached();
+
 // Model API
 
 void* create_model();
@@ -68,6 +82,8 @@ char* get_search_state(void*);
 
 int get_int_val(void*, void*);
 void* get_set_val(void*, void*);
+int get_int_vals(void*, void*, int* INT_BUFFER_OUT, int CAPACITY);
+int get_set_vals(void*, void** HANDLES, int LENGTH, int* INT_BUFFER_OUT, int CAPACITY);
 
 // Criterion API
 
@@ -97,6 +113,7 @@ void* intvar_si(void*, char*, int);
 char* get_intvar_name(void*);
 int get_intvar_lb(void*);
 int get_intvar_ub(void*);
+void get_intvars_bounds(void** HANDLES, int LENGTH, int* INT_BUFFER_OUT, int CAPACITY);
 int get_intvar_value(void*);
 int has_enumerated_domain(void*);
 void* get_domain_values(void*);
@@ -108,6 +125,13 @@ void* boolvar(void*);
 void* boolvar_b(void*, int);
 void* boolvar_sb(void*, char*, int);
 
+// Variable arrays (bulk creation)
+
+void* intvars_ii(void*, char*, int, int, int, int, int);
+void* intvars_i(void*, char*, int, int* INT_BUFFER, int LENGTH);
+void* boolvars_b(void*, char*, int, int, int);
+void* boolvars_arr(void*, char*, int, int* INT_BUFFER, int LENGTH);
+
 // SetVars
 
 void* setvar_s_iviv(void*, char*, void*, void*);
@@ -373,9 +397,14 @@ void* graph_union_view(void*);
 // IntVar
 
 void* create_intvar_array(int);
+void* create_intvar_array_from_handles(void** HANDLES, int LENGTH);
 int intvar_array_length(void*);
 void intvar_array_set(void*, void*, int);
 void* intvar_array_get(void*, int);
+void intvar_array_get_all(void*, void** HANDLES_OUT, int LENGTH);
+int intvar_array_values(void*, int* INT_BUFFER_OUT, int CAPACITY);
+int intvar_array_snapshot(void*, int, int* INT_BUFFER_OUT, int CAPACITY);
+void* intvar_array_slice(void*, int, int, int);
 
 // IntVar[][]
 
@@ -386,13 +415,16 @@ void intvar_2d_array_set(void*, void*, int);
 // Tasks
 
 void* create_task_array(int);
+void* create_task_array_from_handles(void** HANDLES, int LENGTH);
 int task_array_length(void*);
 void task_array_set(void*, void*, int);
 
 // BoolVar
 
 void* create_boolvar_array(int);
+void* create_boolvar_array_from_handles(void** HANDLES, int LENGTH);
 void boolvar_array_set(void*, void*, int);
+void* boolvar_array_slice(void*, int, int, int);
 
 // BoolVar[][]
 
@@ -402,30 +434,36 @@ void boolvar_2d_array_set(void*, void*, int);
 // SetVar
 
 void* create_setvar_array(int);
+void* create_setvar_array_from_handles(void** HANDLES, int LENGTH);
 int setvar_array_length(void*);
 void setvar_array_set(void*, void*, int);
 
 // GraphVar
 
 void* create_graphvar_array(int);
+void* create_graphvar_array_from_handles(void** HANDLES, int LENGTH);
 void graphvar_array_set(void*, void*, int);
 
 
 // Constraint
 
 void* create_constraint_array(int);
+void* create_constraint_array_from_handles(void** HANDLES, int LENGTH);
 void constraint_array_set(void*, void*, int);
 
 // int[]
 
 void* create_int_array(int);
+void* create_int_array_from_buffer(int* INT_BUFFER, int LENGTH);
 int int_array_length(void*);
 void int_array_set(void*, int, int);
 int int_array_get(void*, int);
+int int_array_to_buffer(void*, int* INT_BUFFER_OUT, int CAPACITY);
 
 // int[][]
 
 void* create_int_2d_array(int);
+void* create_int_2d_array_from_buffer(int* INT_BUFFER, int LENGTH, int);
 int int_2d_array_length(void*);
 void int_2d_array_set(void*, void*, int);
 
@@ -469,6 +507,7 @@ int list_size(void*);
 // Solution
 
 void* list_solution_get(void*, int);
+int list_solution_int_matrix(void*, void*, int* INT_BUFFER_OUT, int CAPACITY);
 
 // Search
 
@@ -629,6 +668,7 @@ void* get_best_solution(void*);
 // Handle API
 
 void chocosolver_handles_destroy(void*);
+void chocosolver_handles_destroy_all(int, void** HANDLES, int LENGTH);
 
 #if defined(__cplusplus)
 }
@@ -4,6 +4,118 @@
 #define SWIG_FILE_WITH_INIT
 #include "backend.h"
 %}
+
+// read-only view over any C-contiguous buffer of native ints (array('i'), bytes, memoryview, numpy int32...),
+// passed to C as a pointer and a number of elements, without copying it. The buffer is held until the call returns.
+%typemap(in) (int* INT_BUFFER, int LENGTH) (Py_buffer view, int has_view = 0) {
+    if (PyObject_GetBuffer($input, &view, PyBUF_C_CONTIGUOUS) != 0) {
+        SWIG_fail;
+    }
+    has_view = 1;
+    if (view.len % sizeof(int) != 0) {
+        SWIG_exception_fail(SWIG_ValueError, "in method '" "$symname" "', argument "
+                   "$argnum"" must be a buffer of native ints");
+    }
+    $1 = (int*) view.buf;
+    $2 = (int) (view.len / sizeof(int));
+}
+
+%typemap(freearg) (int* INT_BUFFER, int LENGTH) {
+    if (has_view$argnum) {
+        PyBuffer_Release(&view$argnum);
+    }
+}
+
+// writable view over a C-contiguous buffer of native ints, that C code fills up to CAPACITY elements. The buffer is
+// held until the call returns.
+%typemap(in) (int* INT_BUFFER_OUT, int CAPACITY) (Py_buffer view, int has_view = 0) {
+    if (PyObject_GetBuffer($input, &view, PyBUF_C_CONTIGUOUS | PyBUF_WRITABLE) != 0) {
+        SWIG_fail;
+    }
+    has_view = 1;
+    if (view.len % sizeof(int) != 0) {
+        SWIG_exception_fail(SWIG_ValueError, "in method '" "$symname" "', argument "
+                   "$argnum"" must be a writable buffer of native ints");
+    }
+    $1 = (int*) view.buf;
+    $2 = (int) (view.len / sizeof(int));
+}
+
+%typemap(freearg) (int* INT_BUFFER_OUT, int CAPACITY) {
+    if (has_view$argnum) {
+        PyBuffer_Release(&view$argnum);
+    }
+}
+
+// C array of the backend object handles held by a Python sequence (of handles, as returned by the backend).
+%typemap(in) (void** HANDLES, int LENGTH) {
+    PyObject* seq = PySequence_Fast($input, "in method '" "$symname" "', argument "
+                                    "$argnum"" must be a sequence of handles");
+    if (seq == NULL) {
+        SWIG_fail;
+    }
+    Py_ssize_t size = PySequence_Fast_GET_SIZE(seq);
+    $1 = (void**) malloc((size > 0 ? size : 1) * sizeof(void*));
+    $2 = (int) size;
+    for (Py_ssize_t i = 0; i < size; i++) {
+        if (!SWIG_IsOK(SWIG_ConvertPtr(PySequence_Fast_GET_ITEM(seq, i), &$1[i], 0, 0))) {
+            Py_DECREF(seq);
+            SWIG_exception_fail(SWIG_TypeError, "in method '" "$symname" "', argument "
+                       "$argnum"" must be a sequence of handles");
+        }
+    }
+    Py_DECREF(seq);
+}
+
+%typemap(freearg) (void** HANDLES, int LENGTH) {
+    free($1);
+}
+
+// Python list of LENGTH backend handles, filled by the C function.
+%typemap(in) (void** HANDLES_OUT, int LENGTH) {
+    long size = PyLong_AsLong($input);
+    if (size == -1 && PyErr_Occurred()) {
+        SWIG_fail;
+    }
+    if (size < 0) {
+        SWIG_exception_fail(SWIG_ValueError, "in method '" "$symname" "', argument "
+                   "$argnum"" must be a non-negative length");
+    }
+    $1 = (void**) malloc((size > 0 ? size : 1) * sizeof(void*));
+    $2 = (int) size;
+}
+
+%typemap(argout) (void** HANDLES_OUT, int LENGTH) {
+    PyObject* list = PyList_New($2);
+    for (int i = 0; i < $2; i++) {
+        PyList_SET_ITEM(list, i, SWIG_NewPointerObj($1[i], SWIGTYPE_p_void, 0));
+    }
+    $result = SWIG_AppendOutput($result, list);
+}
+
+%typemap(freearg) (void** HANDLES_OUT, int LENGTH) {
+    free($1);
+}
+
+// search calls release the GIL while the isolate runs, so that other Python threads (including ones solving
+// other models) keep running meanwhile. Each OS thread attaches itself to its current isolate on its first call.
+%define RELEASE_GIL(function)
+%exception function {
+    Py_BEGIN_ALLOW_THREADS
+    $action
+    Py_END_ALLOW_THREADS
+}
+%enddef
+
+RELEASE_GIL(solve)
+RELEASE_GIL(find_solution)
+RELEASE_GIL(find_all_solutions)
+RELEASE_GIL(find_optimal_solution)
+RELEASE_GIL(find_all_optimal_solutions)
+RELEASE_GIL(propagate)
+RELEASE_GIL(pf_solve)
+RELEASE_GIL(get_best_solution)
+
 %include "backend.h"
 
 %include <typemaps.i>
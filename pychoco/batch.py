@@ -0,0 +1,117 @@
+import os
+import threading
+from collections import deque, namedtuple
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Iterable, Iterator, Union
+
+BatchResult = namedtuple("BatchResult", ["index", "input", "result", "statistics", "error"])
+BatchResult.__doc__ = """
+The outcome of one instance of a batch: its index and input, the value returned by the solve function (None if an
+error occurred), the search statistics (None if the model could not be built) and the exception raised, if any.
+"""
+
+
+def solver_statistics(solver: "Solver") -> Dict[str, Any]:
+    """
+    :param solver: A Solver.
+    :return: The statistics of the last search of `solver`, as a dict.
+    """
+    return {
+        "search_state": solver.get_search_state(),
+        "solution_count": solver.get_solution_count(),
+        "time_count": solver.get_time_count(),
+        "node_count": solver.get_node_count(),
+        "backtrack_count": solver.get_backtrack_count(),
+        "fail_count": solver.get_fail_count(),
+        "restart_count": solver.get_restart_count(),
+    }
+
+
+def solve_many(build_fn: Callable[[Any], "Model"],
+               inputs: Iterable[Any],
+               workers: Union[None, int] = None,
+               limits: Union[None, Dict[str, Any]] = None,
+               ordered: bool = True,
+               solve_fn: Union[None, Callable[["Solver"], Any]] = None) -> Iterator[BatchResult]:
+    """
+    Builds and solves independent models on a pool of threads. The GIL is released during search, so that the
+    searches of several instances run in parallel. Solvers are made interruptible: if the iteration is stopped early
+    (e.g. with `break`), the running searches are interrupted and the instances that are not started yet are dropped.
+
+    :param build_fn: A function building the model of an input (called in a worker thread).
+    :param inputs: The inputs of the instances (e.g. an iterable over instance descriptions).
+    :param workers: The number of worker threads (None for the number of CPUs).
+    :param limits: The search limits given to Solver.find_solution() by the default solve function (e.g.
+        {"time_limit": "10s"}).
+    :param ordered: If True (default), results are yielded in the order of the inputs, otherwise as soon as they
+        are available.
+    :param solve_fn: A function solving the model of an instance, given its solver, and returning the result of the
+        instance (called in the worker thread). By default, the solution returned by find_solution(**limits).
+    :return: An iterator over the BatchResults of the instances. Inputs are consumed as results are retrieved,
+        a few instances ahead.
+    """
+    limits = {} if limits is None else limits
+    if solve_fn is None:
+        solve_fn = lambda solver: solver.find_solution(**limits)
+
+    # Solvers of the running instances, interrupted if the iteration is stopped early.
+    running = set()
+    lock = threading.Lock()
+    stopped = threading.Event()
+
+    def run(index, instance_input):
+        try:
+            solver = build_fn(instance_input).get_solver()
+        except Exception as e:
+            return BatchResult(index, instance_input, None, None, e)
+        solver.set_interruptible()
+        with lock:
+            if stopped.is_set():
+                solver.interrupt()
+            running.add(solver)
+        try:
+            result, error = solve_fn(solver), None
+        except Exception as e:
+            result, error = None, e
+        finally:
+            with lock:
+                running.discard(solver)
+        return BatchResult(index, instance_input, result, solver_statistics(solver), error)
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    # Bounds the number of submitted instances, so that results are not accumulated faster than consumed.
+    window = 4 * workers
+    instances = enumerate(inputs)
+    pending = deque() if ordered else set()
+    executor = ThreadPoolExecutor(workers)
+
+    def submit():
+        for index, instance_input in instances:
+            future = executor.submit(run, index, instance_input)
+            if ordered:
+                pending.append(future)
+            else:
+                pending.add(future)
+            if len(pending) >= window:
+                return
+
+    try:
+        submit()
+        while len(pending) > 0:
+            if ordered:
+                done = [pending.popleft()]
+            else:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                pending.difference_update(done)
+            for future in done:
+                yield future.result()
+            submit()
+    finally:
+        # If the iteration is stopped early, the running searches are interrupted and the instances that are not
+        # started yet are dropped. Worker threads are not waited for: a solve function may run several searches.
+        stopped.set()
+        with lock:
+            for solver in running:
+                solver.interrupt()
+        executor.shutdown(wait=False, cancel_futures=True)
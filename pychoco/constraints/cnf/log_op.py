@@ -4,6 +4,7 @@ from pychoco import backend
 from pychoco._handle_wrapper import _HandleWrapper
 from pychoco._utils import make_logical_array
 from pychoco.variables.boolvar import BoolVar
+from pychoco.variables.intvar_array import IntVarArray
 
 
 class LogOp(_HandleWrapper):
@@ -11,6 +12,8 @@ class LogOp(_HandleWrapper):
     Logical operator, to ease clause definition
     """
 
+    __slots__ = ()
+
     def __init__(self, handle: "SwigPyObject"):
         super().__init__(handle)
 
@@ -20,7 +23,7 @@ def and_op(*logops: List[Union[LogOp, BoolVar]]):
     Create a conjunction, results in true if all of its operands are true.
     :param logops: A list of LogOp/Boolvar.
     """
-    if len(logops) == 1 and isinstance(logops[0], list):
+    if len(logops) == 1 and isinstance(logops[0], (list, IntVarArray)):
         logs = logops[0]
     else:
         logs = logops
@@ -75,7 +78,7 @@ def or_op(*logops: List[Union[LogOp, BoolVar]]):
     Create a disjunction, results in true whenever one or more of its operands are true.
     :param logops: A list of LogOp/Boolvar.
     """
-    if len(logops) == 1 and isinstance(logops[0], list):
+    if len(logops) == 1 and isinstance(logops[0], (list, IntVarArray)):
         logs = logops[0]
     else:
         logs = logops
@@ -89,7 +92,7 @@ def nand_op(*logops: List[Union[LogOp, BoolVar]]):
     Create an alternative denial, results in if at least one of its operands is false.
     :param logops: A list of LogOp/Boolvar.
     """
-    if len(logops) == 1 and isinstance(logops[0], list):
+    if len(logops) == 1 and isinstance(logops[0], (list, IntVarArray)):
         logs = logops[0]
     else:
         logs = logops
@@ -103,7 +106,7 @@ def nor_op(*logops: List[Union[LogOp, BoolVar]]):
     Create a joint denial, results in `true` if all of its operands are false.
     :param logops: A list of LogOp/Boolvar.
     """
-    if len(logops) == 1 and isinstance(logops[0], list):
+    if len(logops) == 1 and isinstance(logops[0], (list, IntVarArray)):
         logs = logops[0]
     else:
         logs = logops
@@ -18,11 +18,13 @@ class Constraint(_HandleWrapper):
     To be effective, a constraint must be either posted or reified.
     """
 
+    __slots__ = ("_model",)
+
     def __init__(self, handle: "SwigPyObject", model: "_Model"):
         """
         Warning: Not intended to be used by users, use a Model object to instantiate constraints instead.
         """
-        super().__init__(handle)
+        super().__init__(handle, model)
         self._model = model
 
     def get_name(self):
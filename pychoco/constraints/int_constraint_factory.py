@@ -1,18 +1,22 @@
 from abc import ABC, abstractmethod
-from typing import Union, List
+from typing import TYPE_CHECKING, Union, List
 
 from pychoco import backend
 from pychoco._utils import make_int_array, make_intvar_array, make_int_2d_array, make_boolvar_array, \
     make_constraint_array, make_task_array, make_intvar_2d_array, make_supportable_2d_array
 from pychoco.constraints.constraint import Constraint
 from pychoco.constraints.extension.hybrid.supportable import Supportable
-from pychoco.objects.automaton.cost_automaton import CostAutomaton
-from pychoco.objects.automaton.finite_automaton import FiniteAutomaton
-from pychoco.objects.graphs.multivalued_decision_diagram import MultivaluedDecisionDiagram
 from pychoco.variables.boolvar import BoolVar
 from pychoco.variables.intvar import IntVar
+from pychoco.variables.intvar_array import IntVarArray
 from pychoco.variables.task import Task
 
+if TYPE_CHECKING:
+    # Imported on first use by the lazy package (see pychoco/__init__.py): only needed by annotations here
+    from pychoco.objects.automaton.cost_automaton import CostAutomaton
+    from pychoco.objects.automaton.finite_automaton import FiniteAutomaton
+    from pychoco.objects.graphs.multivalued_decision_diagram import MultivaluedDecisionDiagram
+
 
 class IntConstraintFactory(ABC):
     """
@@ -287,7 +291,9 @@ class IntConstraintFactory(ABC):
         - STR2+: Arc Consistency version STR2 for allowed tuples,
         
         :param intvars: integer variables forming the tuples.
-        :param tuples: the relation between the variables (list of allowed/forbidden tuples)
+        :param tuples: the relation between the variables (list of allowed/forbidden tuples). Tuples can also be
+            given as a row-major buffer of ints, either 2D (e.g. a 2D NumPy array) or flat, in which case each
+            tuple spans len(intvars) consecutive values.
         :param feasible: if True, the tuples describe allowed tuples, otherwise forbidden tuples.
         :param algo: filtering algorithm, to choose among: "CT+", "STR2+". Default is "CT+".
         :param uvalue: the value used to encode universal quantification in the tuples. This value must not be in the domain of any variable in intvars.
@@ -298,7 +304,7 @@ class IntConstraintFactory(ABC):
         if not feasible:
             algo = "CT"
         vars_handle = make_intvar_array(intvars)
-        tuples_handle = make_int_2d_array(tuples)
+        tuples_handle = make_int_2d_array(tuples, len(intvars))
         if uvalue is None:
             constraint_handle = backend.table(self._handle, vars_handle, tuples_handle, feasible, algo)
         else:
@@ -360,7 +366,7 @@ class IntConstraintFactory(ABC):
         constraint_hande = backend.max_iv_ivarray(self._handle, x._handle, int_var_array_handle)
         return Constraint(constraint_hande, self)
 
-    def mddc(self, intvars: List[IntVar], mdd: MultivaluedDecisionDiagram):
+    def mddc(self, intvars: List[IntVar], mdd: "MultivaluedDecisionDiagram"):
         """
         Create a constraint where solutions (tuples) are encoded by a multi-valued decision diagram.
         The order of the variables in vars is important and must refer to the MDD.
@@ -385,7 +391,7 @@ class IntConstraintFactory(ABC):
         constraint_hande = backend.min_iv_ivarray(self._handle, x._handle, int_var_array_handle)
         return Constraint(constraint_hande, self)
 
-    def multi_cost_regular(self, intvars: List[IntVar], costs: List[IntVar], cost_automaton: CostAutomaton):
+    def multi_cost_regular(self, intvars: List[IntVar], costs: List[IntVar], cost_automaton: "CostAutomaton"):
         """
         Creates a regular constraint that supports a multiple cost function.
         Ensures that the assignment of a sequence of `intvars` is recognized by `cost_automaton`, a deterministic finite
@@ -607,7 +613,7 @@ class IntConstraintFactory(ABC):
         constraint_handle = backend.circuit(self._handle, intvars_handle, offset, conf)
         return Constraint(constraint_handle, self)
 
-    def cost_regular(self, intvars: List[IntVar], cost: IntVar, cost_automaton: CostAutomaton):
+    def cost_regular(self, intvars: List[IntVar], cost: IntVar, cost_automaton: "CostAutomaton"):
         """
         Creates a regular constraint that supports a cost function.
         Ensures that the assignment of a sequence of variables is recognized by costAutomaton, a deterministic
@@ -839,7 +845,7 @@ class IntConstraintFactory(ABC):
         :param intvars: A 2D list of IntVars.
         :return: A lex_chain_less constraint.
         """
-        if len(intvars) == 1 and isinstance(intvars[0], list):
+        if len(intvars) == 1 and (isinstance(intvars[0], list) or _is_matrix(intvars[0])):
             vars = intvars[0]
         else:
             vars = intvars
@@ -856,7 +862,7 @@ class IntConstraintFactory(ABC):
         :param intvars: A 2D list of IntVars.
         :return: A lex_chain_less_eq constraint.
         """
-        if len(intvars) == 1 and isinstance(intvars[0], list):
+        if len(intvars) == 1 and (isinstance(intvars[0], list) or _is_matrix(intvars[0])):
             vars = intvars[0]
         else:
             vars = intvars
@@ -972,7 +978,7 @@ class IntConstraintFactory(ABC):
         constraint_handle = backend.path(self._handle, intvars_handle, start._handle, end._handle, offset)
         return Constraint(constraint_handle, self)
 
-    def regular(self, intvars: List[IntVar], automaton: FiniteAutomaton):
+    def regular(self, intvars: List[IntVar], automaton: "FiniteAutomaton"):
         """
         Creates a regular constraint.
         Enforces the sequence of vars to be a word
@@ -1132,3 +1138,10 @@ class IntConstraintFactory(ABC):
         successors_handle = make_intvar_array(successors)
         constraint_handle = backend.tree(self._handle, successors_handle, nb_trees._handle, offset)
         return Constraint(constraint_handle, self)
+
+
+def _is_matrix(intvars):
+    """
+    :return: True if `intvars` is a 2D IntVarArray.
+    """
+    return isinstance(intvars, IntVarArray) and intvars.ndim == 2
@@ -0,0 +1,309 @@
+"""
+GraalVM isolates running Choco, and attachment of the Python threads to them.
+
+A thread is attached to the isolate on its first backend call, and detached when it exits. Thread pools that keep
+their threads alive but only use pychoco occasionally can detach them explicitly in the meantime: a detached thread
+is attached again on its next backend call.
+
+The default isolate (index 0) is created on the first backend call, with the parameters given to init() or by the
+PYCHOCO_MAX_HEAP, PYCHOCO_YOUNG_GEN and PYCHOCO_RESERVED_ADDRESS_SPACE environment variables (sizes in bytes, or with
+a k, m or g suffix). By default, every model lives in this isolate, and thus shares its heap and garbage collector.
+Additional isolates can be created with create_isolate(), and each model bound to one of them when it is created
+(see the `isolate` parameter of Model). The methods of an object run in its isolate, whatever the current isolate
+of the calling thread. Objects of different isolates cannot be mixed: passing an object to a method of an object of
+another isolate (e.g. declaring a constraint of a model over the variables of another one) raises a RuntimeError.
+"""
+import functools
+import itertools
+import os
+import threading
+import types
+import weakref
+from contextlib import contextmanager
+from typing import Any, Dict, List, Union
+
+from pychoco import backend
+
+# Whether more than one isolate exists (isolate checks are skipped otherwise).
+_multiple = False
+# Current isolate of each thread (mirrors the thread-local current isolate of the backend).
+_current = threading.local()
+_round_robin = itertools.count()
+# Live models of each isolate.
+_models = [weakref.WeakSet()]
+# Classes of the objects holding a handle (see _run_in_isolate()), and the lock guarding their wrapping.
+_classes = []
+_lock = threading.Lock()
+# Parameters of the isolates (see init()).
+_params = {"max_heap": None, "young_gen": None, "reserved_address_space": None}
+_ENVIRONMENT_VARIABLES = {
+    "max_heap": "PYCHOCO_MAX_HEAP",
+    "young_gen": "PYCHOCO_YOUNG_GEN",
+    "reserved_address_space": "PYCHOCO_RESERVED_ADDRESS_SPACE",
+}
+_SIZE_UNITS = {"k": 1 << 10, "m": 1 << 20, "g": 1 << 30}
+
+
+def parse_size(size: Union[int, str]) -> int:
+    """
+    :param size: A size in bytes, as an int or a string, optionally with a k, m or g suffix (e.g. "512m").
+    :return: The size in bytes.
+    """
+    if isinstance(size, int):
+        value = size
+    else:
+        size = size.strip().lower()
+        unit = _SIZE_UNITS.get(size[-1:], 1)
+        value = int(size[:-1] if unit > 1 else size) * unit
+    assert value > 0, "[parse_size] A size must be positive"
+    return value
+
+
+def init(max_heap: Union[None, int, str] = None,
+         young_gen: Union[None, int, str] = None,
+         reserved_address_space: Union[None, int, str] = None):
+    """
+    Creates the default isolate with the given parameters, which also apply to the isolates created afterwards
+    (see create_isolate()). Parameters that are not given are read from the environment variables, or left to the
+    GraalVM defaults. Must be called before any other use of pychoco (e.g. creating a model).
+
+    :param max_heap: The maximum heap size of each isolate (in bytes, or with a k, m or g suffix, e.g. "2g").
+    :param young_gen: The size of the young generation of each isolate.
+    :param reserved_address_space: The size of the address space reserved for the heap of each isolate.
+    """
+    if backend.chocosolver_is_initialized():
+        raise RuntimeError("[init] pychoco is already initialized: init() must be called before any other use")
+    _configure(max_heap=max_heap, young_gen=young_gen, reserved_address_space=reserved_address_space)
+    backend.chocosolver_init()
+
+
+def isolate_stats() -> Dict[str, Any]:
+    """
+    Reports the parameters and the load of the isolates. The backend does not expose heap usage and garbage
+    collection counts: the number of live objects in each isolate is reported instead (see isolate_info()).
+
+    :return: A dict with the parameters of the isolates (None for the GraalVM defaults), the number of isolates, and
+        their isolate_info().
+    """
+    stats = dict(_params)
+    stats["nb_isolates"] = get_nb_isolates()
+    stats["isolates"] = isolate_info()
+    return stats
+
+
+def _configure(**params):
+    # Sets the parameters of the isolates created afterwards, completed by the environment variables.
+    for name, variable in _ENVIRONMENT_VARIABLES.items():
+        value = params.get(name)
+        if value is None:
+            value = os.environ.get(variable)
+        _params[name] = None if value is None else parse_size(value)
+    if any(value is not None for value in _params.values()):
+        backend.chocosolver_set_isolate_params(*[_params[name] or 0
+                                                 for name in ("reserved_address_space", "max_heap", "young_gen")])
+
+
+def attach_thread():
+    """
+    Attaches the calling thread to its current isolate (if it is not already attached).
+    """
+    backend.chocosolver_attach_thread()
+
+
+def detach_thread():
+    """
+    Detaches the calling thread from all the isolates (if it is attached). The objects created in this thread remain
+    valid, and can be used from any other thread.
+    """
+    backend.chocosolver_detach_thread()
+
+
+def is_thread_attached() -> bool:
+    """
+    :return: True if the calling thread is attached to its current isolate.
+    """
+    return bool(backend.chocosolver_is_thread_attached())
+
+
+@contextmanager
+def attached_thread():
+    """
+    Context manager attaching the calling thread to its current isolate, and detaching it on exit (unless it was already
+    attached before).
+    """
+    was_attached = is_thread_attached()
+    attach_thread()
+    try:
+        yield
+    finally:
+        if not was_attached:
+            detach_thread()
+
+
+def create_isolate() -> int:
+    """
+    Creates a new isolate, with its own heap and garbage collector. The calling thread is attached to it, but its
+    current isolate does not change.
+
+    :return: The index of the new isolate.
+    """
+    global _multiple
+    backend.chocosolver_init()
+    index = backend.chocosolver_create_isolate()
+    if index < 0:
+        raise RuntimeError("[create_isolate] The isolate could not be created")
+    _models.append(weakref.WeakSet())
+    with _lock:
+        if not _multiple:
+            for cls in _classes:
+                _run_in_isolate(cls)
+            _multiple = True
+    return index
+
+
+def get_nb_isolates() -> int:
+    """
+    :return: The number of isolates (including the default one, even if it is not created yet).
+    """
+    return max(1, backend.chocosolver_get_nb_isolates())
+
+
+def get_current_isolate() -> int:
+    """
+    :return: The index of the current isolate of the calling thread, in which its new objects are created.
+    """
+    return getattr(_current, "index", 0)
+
+
+def set_current_isolate(index: int):
+    """
+    :param index: The index of the isolate becoming the current isolate of the calling thread.
+    """
+    assert 0 <= index < get_nb_isolates(), "[set_current_isolate] There is no isolate at index {}".format(index)
+    backend.chocosolver_set_current_isolate(index)
+    _current.index = index
+
+
+@contextmanager
+def use_isolate(index: int):
+    """
+    Context manager making an isolate the current one of the calling thread, and restoring the previous one on exit.
+
+    :param index: The index of the isolate.
+    """
+    previous = get_current_isolate()
+    set_current_isolate(index)
+    try:
+        yield
+    finally:
+        set_current_isolate(previous)
+
+
+def next_isolate() -> int:
+    """
+    :return: The index of the next isolate in a round-robin over all the isolates.
+    """
+    return next(_round_robin) % get_nb_isolates()
+
+
+def isolate_info() -> List[Dict[str, Any]]:
+    """
+    Reports the load of each isolate. The backend does not expose the heap usage of isolates: the number of
+    live objects of their models is reported instead.
+
+    :return: For each isolate, a dict with its index, its number of live models, and the number of live objects
+        (variables, constraints, ...) created through them.
+    """
+    info = []
+    for index, models in enumerate(_models):
+        models = list(models)
+        info.append({
+            "index": index,
+            "models": len(models),
+            "objects": sum(len(model._tracked) for model in models),
+        })
+    return info
+
+
+def _resolve_isolate(isolate: Union[None, int, str]) -> int:
+    if isolate is None:
+        return get_current_isolate()
+    if isolate == "round_robin":
+        return next_isolate()
+    assert isinstance(isolate, int) and 0 <= isolate < get_nb_isolates(), \
+        "[Model] isolate must be None, 'round_robin', or the index of an isolate"
+    return isolate
+
+
+def _enter_isolate(index: int):
+    # Makes an isolate the current one of the calling thread, if it is not already.
+    if getattr(_current, "index", 0) != index:
+        backend.chocosolver_set_current_isolate(index)
+        _current.index = index
+
+
+def _check_isolate(wrapper):
+    # Checks that an object belongs to the current isolate of the calling thread, before its handle is passed to a
+    # backend call (the methods of an object run in its isolate, see _run_in_isolate()).
+    current = getattr(_current, "index", 0)
+    if wrapper._isolate != current:
+        raise RuntimeError("[{}] This object belongs to isolate {}, and cannot be mixed with objects of isolate {}"
+                           .format(type(wrapper).__name__, wrapper._isolate, current))
+
+
+def _register_class(cls):
+    # Registers a class of objects holding a handle, whose methods run in the isolate of their object once several
+    # isolates exist.
+    with _lock:
+        _classes.append(cls)
+        if _multiple:
+            _run_in_isolate(cls)
+
+
+def _run_in_isolate(cls):
+    # Wraps the methods and properties defined by a class and by its pychoco bases (e.g. the constraint factory
+    # mixins), so that they run in the isolate of their object: the backend objects they create (e.g. Java arrays of
+    # ints) belong to it, and the objects of another isolate passed to them are rejected by _check_isolate(). The
+    # previous isolate of the thread is restored on exit.
+    def method(function):
+        @functools.wraps(function)
+        def call(self, *args, **kwargs):
+            index = getattr(self, "_isolate", None)
+            previous = getattr(_current, "index", 0)
+            if index is None or index == previous:
+                return function(self, *args, **kwargs)
+            _enter_isolate(index)
+            try:
+                return function(self, *args, **kwargs)
+            finally:
+                _enter_isolate(previous)
+        call._in_isolate = True
+        return call
+
+    def is_method(function):
+        return isinstance(function, types.FunctionType) and not getattr(function, "_in_isolate", False)
+
+    for base in cls.__mro__:
+        if not base.__module__.startswith("pychoco"):
+            continue
+        for name, attribute in list(vars(base).items()):
+            if name in _UNWRAPPED_ATTRIBUTES:
+                continue
+            if is_method(attribute):
+                setattr(base, name, method(attribute))
+            elif isinstance(attribute, property) and is_method(attribute.fget):
+                setattr(base, name, property(method(attribute.fget),
+                                             attribute.fset and method(attribute.fset),
+                                             attribute.fdel and method(attribute.fdel),
+                                             attribute.__doc__))
+
+
+# Attributes left as they are by _run_in_isolate(): the handle itself, and the methods called on creation, on
+# garbage collection (in any thread) and on attribute access.
+_UNWRAPPED_ATTRIBUTES = {"_handle", "__init__", "__new__", "__init_subclass__", "__del__", "__getattr__",
+                         "__getattribute__", "__setattr__", "__delattr__"}
+
+
+# The default isolate is created on the first backend call, with the parameters given by the environment variables
+# (unless init() is called first).
+_configure()
@@ -1,7 +1,11 @@
-from typing import Any, Optional
+from collections import namedtuple
+from typing import Any, List, Optional, Union
 
-from pychoco import backend
-from pychoco._handle_wrapper import _HandleWrapper
+from pychoco import backend, isolate as _isolates
+from pychoco._array_cache import _ArrayCache
+from pychoco._handle_wrapper import _HandleTable, _HandleWrapper, _RELEASED
+from pychoco._intern_table import _InternTable
+from pychoco._utils import make_intvar_array, new_int_buffer
 from pychoco.constraints.graph_constraint_factory import GraphConstraintFactory
 from pychoco.constraints.int_constraint_factory import IntConstraintFactory
 from pychoco.constraints.sat_factory import SatFactory
@@ -12,6 +16,8 @@ from pychoco.solver import Solver
 from pychoco.variables.variable_factory import VariableFactory
 from pychoco.variables.view_factory import ViewFactory
 
+DomainSnapshot = namedtuple("DomainSnapshot", ["lb", "ub", "size", "instantiated", "enumerated", "values", "offsets"])
+
 
 class Model(VariableFactory, ViewFactory, IntConstraintFactory, SetConstraintFactory, GraphConstraintFactory,
             ReificationFactory, SatFactory, _HandleWrapper):
@@ -37,41 +43,62 @@ class Model(VariableFactory, ViewFactory, IntConstraintFactory, SetConstraintFac
                  swap_prop_on_passive: bool = True,
                  print_undeclared_constraints: bool = False,
                  max_learnt_clauses: int = 100000,
+                 array_cache_size: int = 128,
+                 isolate: Union[None, int, str] = None,
                  **kwargs: Any) -> None:
         """
         Choco Model constructor.
 
         :param name: The name of the model (optional).
         :param settings: The settings for the model (optional).
+        :param array_cache_size: Maximum number of Java arrays of variables (or tasks) kept by the model, to be
+            reused when the same variables are given again to constraints or search strategies (0 to disable).
+        :param isolate: The isolate in which the model is created (see pychoco.isolate): the index of an isolate,
+            "round_robin" to pick the next one in a round-robin, or None (default) for the current isolate of the
+            calling thread.
         """
+        # Handles of the live objects created through this model, released by close().
+        self._tracked = _HandleTable()
+        self._array_cache = _ArrayCache(array_cache_size)
+        # As declared views are checked, Choco returns the same view when it is declared again: so does the model.
+        self._interned = _InternTable() if check_views and "_handle" not in kwargs else None
+        self._solver = None
+        self._isolate = _isolates._resolve_isolate(isolate)
+        # The model is created in its isolate, the current isolate of the thread is restored afterwards.
+        previous = _isolates.get_current_isolate()
+        _isolates._enter_isolate(self._isolate)
+        try:
+            _isolates._models[self._isolate].add(self)
+
+            if "_handle" in kwargs:
+                super(Model, self).__init__(kwargs["_handle"])
+            else:
+                settings = Settings()
+                settings.set_lcg(lcg)
+                settings.set_warn_user(warn_user)
+                settings.set_check_declared_constraints(check_constraints)
+                settings.set_check_declared_views(check_views)
+                settings.set_check_declared_monitors(check_monitors)
+                settings.set_max_dom_size_for_enumerated(max_dom_size_for_enum)
+                settings.set_min_cardinality_for_sum_decomposition(min_card_size_for_sum_decomp)
+                settings.set_enable_table_substitution(table_substitution)
+                settings.set_max_tuple_size_for_substitution(max_tuple_size_for_table_decomp)
+                settings.set_max_size_in_mb_to_use_compact_table(max_mem_size_for_compect_table)
+                settings.set_enable_sat(enable_sat)
+                settings.set_swap_on_passivate(swap_prop_on_passive)
+                settings.set_print_all_undeclared_constraints(print_undeclared_constraints)
+                settings.set_nb_max_learnt_clauses(max_learnt_clauses)
 
-        if "_handle" in kwargs:
-            super(Model, self).__init__(kwargs["_handle"])
-        else:
-            settings = Settings()
-            settings.set_lcg(lcg)
-            settings.set_warn_user(warn_user)
-            settings.set_check_declared_constraints(check_constraints)
-            settings.set_check_declared_views(check_views)
-            settings.set_check_declared_monitors(check_monitors)
-            settings.set_max_dom_size_for_enumerated(max_dom_size_for_enum)
-            settings.set_min_cardinality_for_sum_decomposition(min_card_size_for_sum_decomp)
-            settings.set_enable_table_substitution(table_substitution)
-            settings.set_max_tuple_size_for_substitution(max_tuple_size_for_table_decomp)
-            settings.set_max_size_in_mb_to_use_compact_table(max_mem_size_for_compect_table)
-            settings.set_enable_sat(enable_sat)
-            settings.set_swap_on_passivate(swap_prop_on_passive)
-            settings.set_print_all_undeclared_constraints(print_undeclared_constraints)
-            settings.set_nb_max_learnt_clauses(max_learnt_clauses)
-
-            if name is None:
-                name = "Model "+ str(id(self))
-            handle = backend.create_model_s_s(name, settings.handle)
-            super(Model, self).__init__(handle)
+                if name is None:
+                    name = "Model "+ str(id(self))
+                handle = backend.create_model_s_s(name, settings.handle)
+                super(Model, self).__init__(handle)
+        finally:
+            _isolates._enter_isolate(previous)
 
     @property
     def _handle(self):
-        return self._handle_
+        return _HandleWrapper._handle.fget(self)
 
     @property
     def name(self):
@@ -84,8 +111,10 @@ class Model(VariableFactory, ViewFactory, IntConstraintFactory, SetConstraintFac
         """
         :return: The solver associated with this model.
         """
-        solver_handler = backend.get_solver(self._handle)
-        return Solver(solver_handler, self)
+        if self._solver is None:
+            solver_handler = backend.get_solver(self._handle)
+            self._solver = Solver(solver_handler, self)
+        return self._solver
 
     def set_objective(self, objective: "Variable", maximize: bool = True):
         """
@@ -95,5 +124,89 @@ class Model(VariableFactory, ViewFactory, IntConstraintFactory, SetConstraintFac
         """
         backend.set_objective(self._handle, maximize, objective._handle)
 
+    def snapshot_domains(self, intvars: Union[List["IntVar"], "IntVarArray"], enumerated: bool = False):
+        """
+        Retrieves the current domains of several IntVars with a single backend call (unless `enumerated` is True
+        and the domains are larger than expected, in which case a second call is made).
+
+        The result is a named tuple of packed int arrays (memoryviews over a single array('i')), giving for each
+        variable, in the order of `intvars`: its lower bound (`lb`), upper bound (`ub`), domain size (`size`),
+        whether it is instantiated (`instantiated`, 0 or 1) and whether its domain is enumerated (`enumerated`).
+        If `enumerated` is True, the domains are also given in a CSR-like layout: the domain of the i-th variable
+        is `values[offsets[i]:offsets[i + 1]]`, which holds all its values if the domain is enumerated, and its
+        [lb, ub] interval otherwise. If `enumerated` is False, `values` and `offsets` are None.
+
+        :param intvars: A list (or IntVarArray) of IntVars.
+        :param enumerated: If True, also retrieve the values of the enumerated domains.
+        :return: A DomainSnapshot named tuple.
+        """
+        n = len(intvars)
+        array_handle = make_intvar_array(intvars)
+        buffer = new_int_buffer(5 * n + (9 * n + 1 if enumerated else 0))
+        size = backend.intvar_array_snapshot(array_handle, enumerated, buffer)
+        if size > len(buffer):
+            buffer = new_int_buffer(size)
+            backend.intvar_array_snapshot(array_handle, enumerated, buffer)
+        view = memoryview(buffer)
+        rows = [view[r * n:(r + 1) * n] for r in range(0, 5)]
+        if not enumerated:
+            return DomainSnapshot(*rows, None, None)
+        return DomainSnapshot(*rows, view[6 * n + 1:size], view[5 * n:6 * n + 1])
+
+    def array_cache_info(self):
+        """
+        :return: The statistics of the array cache of the model, as a (hits, misses, maxsize, currsize) named tuple.
+        """
+        return self._array_cache.info()
+
+    def clear_array_cache(self):
+        """
+        Empties the array cache of the model, and resets its statistics.
+        """
+        self._array_cache.clear()
+
+    @property
+    def isolate(self) -> int:
+        """
+        :return: The index of the isolate of the model (see pychoco.isolate).
+        """
+        return self._isolate
+
+    @property
+    def closed(self):
+        """
+        True if the model was closed.
+        """
+        return self._handle_ is _RELEASED
+
+    def close(self):
+        """
+        Releases, with a single backend call, the model and every object created through it (variables,
+        constraints, solver, solutions, cached arrays). Using any of them afterwards raises a RuntimeError.
+        Closing a closed model has no effect.
+        """
+        if self.closed:
+            return
+        handles = [handle for handle in self._tracked.handles if handle is not None]
+        self._tracked.closed = True
+        for wrapper in self._array_cache.wrappers() + [self]:
+            if wrapper._handle_ is not None and wrapper._handle_ is not _RELEASED:
+                handles.append(wrapper._handle_)
+            wrapper._handle_ = _RELEASED
+        self._array_cache.clear()
+        if self._interned is not None:
+            self._interned.clear()
+        if backend.chocosolver_is_initialized():
+            backend.chocosolver_handles_destroy_all(self._isolate, handles)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
     def __repr__(self):
+        if self.closed:
+            return "Choco Model (closed)"
         return "Choco Model ('" + self.name + "')"
@@ -17,12 +17,14 @@ class Graph(ABC, _HandleWrapper):
         """
         pass
 
-    def get_nodes(self):
+    def get_nodes(self, container: str = "list"):
         """
+        :param container: "list" (default) for a Python int list, "array" for an array('i'), "numpy" for a NumPy
+            int32 array.
         :return: The nodes of the graph.
         """
         nodes_handle = backend.get_nodes(self._handle)
-        nodes = get_int_array(nodes_handle)
+        nodes = get_int_array(nodes_handle, container)
         return nodes
 
     def add_node(self, node: int):
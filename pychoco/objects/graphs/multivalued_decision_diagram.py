@@ -22,33 +22,20 @@ class MultivaluedDecisionDiagram(_HandleWrapper):
         Create a MDD
 
         :param intvars: A list of IntVars.
-        :param tuples: A List[List[int]] either tuples (allowed).
+        :param tuples: A List[List[int]] either tuples (allowed). Tuples can also be given as a row-major buffer
+            of ints, either 2D (e.g. a 2D NumPy array) or flat, in which case each tuple spans len(intvars)
+            consecutive values.
         :param compact: Either "NEVER", "ONCE", or "EACH".
         :param sort_tuple: A bool.
         :param uvalue: An int or None. If not None, the MDD will be created without a special value for unassigned variables.
         :return: A MDD.
         """
         assert len(tuples) > 0
-        for r in tuples:
-            assert len(r) == len(intvars)
-        handle = backend.create_mdd_tuples(
-            make_intvar_array(intvars), make_int_2d_array(tuples), compact, sort_tuple
-        )
-
+        vars_handle = make_intvar_array(intvars)
+        tuples_handle = make_int_2d_array(tuples, len(intvars))
         if uvalue is not None:
             assert isinstance(uvalue, int)
-            handle = backend.create_mdd_tuples_u(
-                make_intvar_array(intvars),
-                make_int_2d_array(tuples),
-                compact,
-                sort_tuple,
-                uvalue
-            )
+            handle = backend.create_mdd_tuples_u(vars_handle, tuples_handle, compact, sort_tuple, uvalue)
         else:
-            handle = backend.create_mdd_tuples(
-                make_intvar_array(intvars),
-                make_int_2d_array(tuples),
-                compact,
-                sort_tuple
-            )
+            handle = backend.create_mdd_tuples(vars_handle, tuples_handle, compact, sort_tuple)
         super().__init__(handle)
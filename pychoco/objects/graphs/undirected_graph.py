@@ -27,23 +27,25 @@ class UndirectedGraph(Graph):
         """
         if _handle is not None:
             self._model = model
-            super().__init__(_handle)
+            super().__init__(_handle, model)
         else:
             assert node_set_type in ["BITSET", "BIPARTITE_SET", "SMALL_BIPARTITE_SET", "RANGE_SET", "LINKED_LIST"]
             self._model = model
             handle = backend.create_graph(model._handle, nb_max_nodes, node_set_type, edge_set_type, all_node)
-            super().__init__(handle)
+            super().__init__(handle, model)
 
     def is_directed(self):
         return False
 
-    def get_neighbors_of(self, node: int):
+    def get_neighbors_of(self, node: int, container: str = "list"):
         """
         :param node: A node of the graph.
+        :param container: "list" (default) for a Python int list, "array" for an array('i'), "numpy" for a NumPy
+            int32 array.
         :return: The neighbors of the node.
         """
         handle = backend.get_successors_of(self._handle, node)
-        return get_int_array(handle)
+        return get_int_array(handle, container)
 
     def to_networkx_graph(self):
         """
@@ -1,4 +1,4 @@
-from pychoco import Model
+from pychoco import Model, backend
 from pychoco._handle_wrapper import _HandleWrapper
 from pychoco.backend import create_parallel_portfolio, steal_nogoods_on_restarts, add_model_b_b, pf_solve, get_best_model, \
     get_best_solution
@@ -38,6 +38,7 @@ class ParallelPortfolio(_HandleWrapper):
         """
         handle = create_parallel_portfolio()
         super(ParallelPortfolio, self).__init__(handle)
+        self._models = []
 
     def steal_nogoods_on_restarts(self):
         """
@@ -69,6 +70,7 @@ class ParallelPortfolio(_HandleWrapper):
         models. There should be at least one reliable model in a portfolio. Otherwise, solving may be made incomplete.
         """
         add_model_b_b(self._handle, model._handle, unalterable, reliable)
+        self._models.append(model)
 
     def solve(self):
         """
@@ -86,8 +88,14 @@ class ParallelPortfolio(_HandleWrapper):
         or None if no such model exists.
         Note that there can be more than one "finder" in the list, yet, this method returns the index of the first one.
         :return the first model which finds a solution (or the best one) or None if no such model exists.
+            If the models of the portfolio have distinct names, this is the Model object given to add_model().
         """
         handle = get_best_model(self._handle)
+        name = backend.get_model_name(handle)
+        models = [m for m in self._models if m.name == name]
+        if len(models) == 1:
+            backend.chocosolver_handles_destroy(handle)
+            return models[0]
         return Model(_handle=handle)
 
     def find_best_solution(self):
@@ -3,11 +3,12 @@ from abc import ABC, abstractmethod
 
 from pychoco import backend
 from pychoco._utils import make_intvar_array
+from pychoco.variables.intvar_array import IntVarArray
 
 
 def _extract_star_arg(vars):
     assert len(vars) > 0, "No variables were declared for the search"
-    if len(vars) == 1 and isinstance(vars[0], list):
+    if len(vars) == 1 and isinstance(vars[0], (list, IntVarArray)):
         return vars[0]
     else:
         return vars
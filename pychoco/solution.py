@@ -1,6 +1,9 @@
+from array import array
+from typing import List, Union
+
 from pychoco import backend
 from pychoco._handle_wrapper import _HandleWrapper
-from pychoco._utils import get_int_array
+from pychoco._utils import get_int_array, get_handles, make_intvar_array, new_int_buffer
 
 
 class Solution(_HandleWrapper):
@@ -8,11 +11,13 @@ class Solution(_HandleWrapper):
     Solution to a Choco problem. This object can be used to retrieve the value of variables in the solution.
     """
 
-    def __init__(self, handle):
+    __slots__ = ()
+
+    def __init__(self, handle, model: "_Model" = None):
         """
         Warning: Not intended to be used by users, use a Model object to instantiate constraints instead.
         """
-        super().__init__(handle)
+        super().__init__(handle, model)
 
     def get_int_val(self, x: "IntVar"):
         """
@@ -32,5 +37,127 @@ class Solution(_HandleWrapper):
         val = get_int_array(val_handle)
         return set(val)
 
+    def get_int_vals(self, intvars: Union[List["IntVar"], "IntVarArray"], container: str = "list"):
+        """
+        The values of several IntVars in this solution, retrieved with a single backend call.
+        :param intvars: A list (or IntVarArray) of IntVars.
+        :param container: "list" (default) for a Python int list, "array" for an array('i'), "numpy" for a NumPy
+            int32 array.
+        :return: The values of `intvars` in this solution, in the same order.
+        """
+        values = new_int_buffer(len(intvars), container)
+        backend.get_int_vals(self._handle, make_intvar_array(intvars), values)
+        if container == "list":
+            return values.tolist()
+        return values
+
+    def get_set_vals(self, setvars: List["SetVar"]):
+        """
+        The values of several SetVars in this solution, retrieved with a single backend call (unless the sets are
+        larger than expected, in which case a second call is made).
+        :param setvars: A list of SetVars.
+        :return: The values of `setvars` in this solution (a list of sets), in the same order.
+        """
+        handles = get_handles(setvars)
+        n = len(handles)
+        values = new_int_buffer(n + 1 + 8 * n)
+        size = backend.get_set_vals(self._handle, handles, values)
+        if size > len(values):
+            values = new_int_buffer(size)
+            backend.get_set_vals(self._handle, handles, values)
+        return [set(values[values[i]:values[i + 1]]) for i in range(0, n)]
+
     def __repr__(self):
         return "Choco Solution"
+
+
+class _Projection:
+    """
+    The variables recorded by projected solutions. Shared by all the solutions of a search.
+    """
+
+    def __init__(self, intvars: Union[List["IntVar"], "IntVarArray"]):
+        """
+        :param intvars: The IntVars (or BoolVars) to record.
+        """
+        self.intvars = intvars
+        self.handle = make_intvar_array(intvars)
+        self._index = None
+
+    def index(self, x: "IntVar"):
+        """
+        :return: The position of the variable x in the projection (None if it is not recorded).
+        """
+        if self._index is None:
+            self._index = {id(v): i for i, v in enumerate(self.intvars)}
+        return self._index.get(id(x))
+
+    def record(self):
+        """
+        :return: A ProjectedSolution recording the current values of the variables (which must be instantiated).
+        """
+        values = new_int_buffer(len(self.intvars))
+        backend.intvar_array_values(self.handle, values)
+        return ProjectedSolution(self, values)
+
+    def extract(self, solution: Solution):
+        """
+        :return: A ProjectedSolution recording the values of the variables in a (complete) solution.
+        """
+        values = new_int_buffer(len(self.intvars))
+        backend.get_int_vals(solution._handle, self.handle, values)
+        return ProjectedSolution(self, values)
+
+
+class ProjectedSolution:
+    """
+    Solution to a Choco problem, restricted to the variables given to the search method (`vars` parameter).
+    Only the values of these variables are recorded, as a compact array of ints.
+    """
+
+    def __init__(self, projection: _Projection, values):
+        """
+        Warning: Not intended to be used by users, use a Solver object to find solutions instead.
+        """
+        self._projection = projection
+        self._values = values
+
+    def get_int_val(self, x: "IntVar"):
+        """
+        The value of the IntVar `x` in this solution.
+        :param x: An IntVar, among the variables recorded by this solution.
+        :return: The value of `x` in this solution.
+        """
+        i = self._projection.index(x)
+        assert i is not None, "[get_int_val] {} is not recorded in this projected solution".format(x.name)
+        return self._values[i]
+
+    def get_int_vals(self, intvars: Union[List["IntVar"], "IntVarArray"], container: str = "list"):
+        """
+        The values of several IntVars in this solution.
+        :param intvars: A list (or IntVarArray) of IntVars, among the variables recorded by this solution.
+        :param container: "list" (default) for a Python int list, "array" for an array('i'), "numpy" for a NumPy
+            int32 array.
+        :return: The values of `intvars` in this solution, in the same order.
+        """
+        if intvars is self._projection.intvars:
+            values = self._values
+        else:
+            values = new_int_buffer(len(intvars))
+            for k, x in enumerate(intvars):
+                values[k] = self.get_int_val(x)
+        if container == "list":
+            return values.tolist()
+        if container == "numpy":
+            import numpy
+            return numpy.array(values, dtype=numpy.intc)
+        return array("i", values)
+
+    def get_set_val(self, s: "SetVar"):
+        """
+        Projected solutions only record IntVars and BoolVars: raises a TypeError.
+        """
+        raise TypeError("[get_set_val] Projected solutions only record IntVars and BoolVars")
+
+    def __repr__(self):
+        return "Choco Solution (projected on {} variables)".format(len(self._values))
@@ -1,13 +1,63 @@
+import asyncio
+import threading
 import time
-from typing import Union, List
+import warnings
+from array import array
+from contextlib import contextmanager
+from typing import AsyncIterator, Iterator, Union, List
 
 from pychoco import backend
 from pychoco._handle_wrapper import _HandleWrapper
-from pychoco._utils import make_criterion_var_array, extract_solutions, make_intvar_array
+from pychoco._utils import make_criterion_var_array, extract_solutions, make_intvar_array, get_solution_matrix, \
+    new_int_buffer, shape_int_matrix
 from pychoco.search.search_strategies import SearchStrategies
-from pychoco.solution import Solution
+from pychoco.solution import Solution, ProjectedSolution, _Projection
 from pychoco.variables.intvar import IntVar
 
+# Maximum time (in seconds) an interruptible search runs in the backend between two checks of an interruption or
+# cancellation request.
+SEARCH_SLICE_TIME = 0.1
+
+
+class _SearchLimits:
+    """
+    The search limits of a search (Criterion handles), and the Java Criterion[] handles built from them once for
+    the whole search: one holding the limits, and one with an additional slot for the time limit of the current
+    slice (see Solver._run_slice()).
+    """
+
+    __slots__ = ("criteria", "_stop", "_sliced")
+
+    def __init__(self, criteria: List["SwigPyObject"]):
+        self.criteria = criteria
+        self._stop = None
+        self._sliced = None
+
+    def stop(self):
+        """
+        :return: The Java Criterion[] handle of the search limits.
+        """
+        if self._stop is None:
+            self._stop = make_criterion_var_array(self.criteria)
+        return self._stop
+
+    def sliced(self, slice_criterion):
+        """
+        :param slice_criterion: The Criterion handle of the time limit of a slice.
+        :return: The Java Criterion[] handle of the search limits and of the time limit of the slice.
+        """
+        if self._sliced is None:
+            self._sliced = make_criterion_var_array(self.criteria + [slice_criterion])
+        else:
+            backend.criterion_array_set(self._sliced, slice_criterion, len(self.criteria))
+        return self._sliced
+
+    def handles(self):
+        """
+        :return: The handles of the search limits, and of the Java arrays built from them.
+        """
+        return [handle for handle in self.criteria + [self._stop, self._sliced] if handle is not None]
+
 
 class Solver(SearchStrategies, _HandleWrapper):
     """
@@ -19,12 +69,45 @@ class Solver(SearchStrategies, _HandleWrapper):
         """
         Warning: Not intended to be used by users, use a Model object to instantiate constraints instead.
         """
-        super().__init__(handle)
+        super().__init__(handle, model)
         self._model = model
+        self._interrupted = False
+        self._interruptible = False
+        # True while a search call that cannot be interrupted runs in the backend (see interrupt()).
+        self._busy = False
 
     @property
     def _handle(self):
-        return self._handle_
+        return _HandleWrapper._handle.fget(self)
+
+    def set_interruptible(self, interruptible: bool = True):
+        """
+        Makes the searches of this solver interruptible (see interrupt()): a search is then run as a sequence of
+        backend calls of at most SEARCH_SLICE_TIME seconds each, resumed until the search ends or is interrupted.
+        Otherwise (default), a synchronous search is a single backend call. Asynchronous searches are always
+        interruptible. Optimizations recording complete solutions (find_optimal_solution() without `vars`) and
+        find_all_optimal_solutions() remain single backend calls: the backend records complete solutions, and
+        runs the two passes of the latter, only within one call.
+        :param interruptible: True to make the searches interruptible.
+        """
+        self._interruptible = interruptible
+
+    def interrupt(self):
+        """
+        Requests the running search, or the next one if no search is running, to stop. Can be called from any
+        thread, or from a signal handler (e.g. on SIGINT). The search is not stopped immediately: an interruptible
+        search (see set_interruptible()) stops at the end of its current slice, i.e. within SEARCH_SLICE_TIME
+        seconds (0.1 s by default), in the 'STOPPED' state; a search that did not start yet is not run. A search
+        method then returns what it found so far (e.g. the best solution found by find_optimal_solution()). The
+        request is cleared when the search ends.
+
+        A search running as a single backend call cannot be stopped: interrupting it issues a RuntimeWarning, and
+        the request only prevents the next backend call of the same search (if any) from running.
+        """
+        self._interrupted = True
+        if self._busy:
+            warnings.warn("[interrupt] The running search of this solver is a single backend call, which cannot be "
+                          "interrupted (see Solver.set_interruptible())", RuntimeWarning, stacklevel=2)
 
     def solve(self,
               time_limit: Union[None, str] = None,
@@ -46,26 +129,17 @@ class Solver(SearchStrategies, _HandleWrapper):
         :param backtrack_limit: Number of backtracks limit for search, None => no backtracks limit.
         :return: True if a solution was found.
         """
-        criterion = list()
-        if time_limit is not None:
-            self.limit_time(time_limit)
-        if node_limit is not None:
-            criterion.append(backend.node_counter(self.model._handle, node_limit))
-        if fail_limit is not None:
-            criterion.append(backend.fail_counter(self.model._handle, fail_limit))
-        if restart_limit is not None:
-            criterion.append(backend.restart_counter(self._handle, restart_limit))
-        if backtrack_limit is not None:
-            criterion.append(backend.backtrack_counter(self._handle, restart_limit))
-        stop = make_criterion_var_array(criterion)
-        return bool(backend.solve(self._handle, stop))
+        limits = self._stop_criteria(time_limit, None, node_limit, fail_limit, restart_limit, backtrack_limit)
+        with self._search(limits):
+            return self._solve(limits)
 
     def find_solution(self,
                       time_limit: Union[None, str] = None,
                       node_limit: Union[None, int] = None,
                       fail_limit: Union[None, int] = None,
                       restart_limit: Union[None, int] = None,
-                      backtrack_limit: Union[None, int] = None) -> Solution:
+                      backtrack_limit: Union[None, int] = None,
+                      vars: Union[None, List[IntVar]] = None) -> Union[Solution, ProjectedSolution]:
         """
         Finds a solution and retrieve it.
         :param time_limit: Time limit for search (e.g. "10s", "2m"), None => no time limit.
@@ -73,24 +147,14 @@ class Solver(SearchStrategies, _HandleWrapper):
         :param fail_limit: Number of fails limit for search, None => no fail limit.
         :param restart_limit: Number of restarts limit for search, None => no restart limit.
         :param backtrack_limit: Number of backtracks limit for search, None => no backtracks limit.
+        :param vars: If not None, the IntVars (or BoolVars) to record: solutions are then ProjectedSolutions
+            storing only the values of these variables (the other ones cannot be retrieved).
         :return: The first solution found.
         """
-        criterion = list()
-        if time_limit is not None:
-            self.limit_time(time_limit)
-        if node_limit is not None:
-            criterion.append(backend.node_counter(self.model._handle, node_limit))
-        if fail_limit is not None:
-            criterion.append(backend.fail_counter(self.model._handle, fail_limit))
-        if restart_limit is not None:
-            criterion.append(backend.restart_counter(self._handle, restart_limit))
-        if backtrack_limit is not None:
-            criterion.append(backend.backtrack_counter(self._handle, restart_limit))
-        stop = make_criterion_var_array(criterion)
-        solution_handle = backend.find_solution(self._handle, stop)
-        if solution_handle is None:
-            return None
-        return Solution(solution_handle)
+        limits = self._stop_criteria(time_limit, None, node_limit, fail_limit, restart_limit, backtrack_limit)
+        projection = _Projection(vars) if vars is not None else None
+        with self._search(limits):
+            return self._find_solution(limits, projection)
 
     def find_all_solutions(self,
                            time_limit: Union[None, str] = None,
@@ -98,7 +162,10 @@ class Solver(SearchStrategies, _HandleWrapper):
                            node_limit: Union[None, int] = None,
                            fail_limit: Union[None, int] = None,
                            restart_limit: Union[None, int] = None,
-                           backtrack_limit: Union[None, int] = None) -> List[Solution]:
+                           backtrack_limit: Union[None, int] = None,
+                           vars: Union[None, List[IntVar]] = None,
+                           as_matrix: Union[None, List[IntVar]] = None,
+                           container: str = "list"):
         """
         Finds all the solutions to a problem, eventually with respect to search limits.
         :param time_limit: Time limit for search (e.g. "10s", "2m"), None => no time limit.
@@ -107,7 +174,82 @@ class Solver(SearchStrategies, _HandleWrapper):
         :param fail_limit: Number of fails limit for search, None => no fail limit.
         :param restart_limit: Number of restarts limit for search, None => no restart limit.
         :param backtrack_limit: Number of backtracks limit for search, None => no backtracks limit.
-        :return: A list of solutions.
+        :param vars: If not None, the IntVars (or BoolVars) to record: solutions are then ProjectedSolutions
+            storing only the values of these variables (the other ones cannot be retrieved).
+        :param as_matrix: If not None, the IntVars (or BoolVars) whose values are returned, as a
+            (nb solutions x nb variables) matrix filled with a single backend call, instead of a list of solutions.
+        :param container: The type of matrix returned when `as_matrix` is used: "list" (default) for a list of int
+            lists, "array" for a 2D memoryview over an array('i'), "numpy" for a 2D NumPy int32 array.
+        :return: A list of solutions (or the solution matrix).
+        """
+        assert vars is None or as_matrix is None, "[find_all_solutions] vars and as_matrix cannot be used together"
+        limits = self._stop_criteria(time_limit, solution_limit, node_limit, fail_limit, restart_limit,
+                                       backtrack_limit)
+        with self._search(limits):
+            if as_matrix is not None:
+                if self._interruptible or self._interrupted:
+                    return self._solve_matrix(limits, as_matrix, container)
+                solutions_list_handle = self._run(lambda stop: backend.find_all_solutions(self._handle, stop), limits)
+                return self._solution_matrix(solutions_list_handle, as_matrix, container)
+            if vars is not None:
+                projection = _Projection(vars)
+                solutions = list()
+                while self._solve(limits):
+                    solutions.append(projection.record())
+                return solutions
+            if self._interruptible or self._interrupted:
+                solutions = list()
+                solution = self._find_solution(limits, None)
+                while solution is not None:
+                    solutions.append(solution)
+                    solution = self._find_solution(limits, None)
+                return solutions
+            solutions_list_handle = self._run(lambda stop: backend.find_all_solutions(self._handle, stop), limits)
+            return extract_solutions(solutions_list_handle, model=self.model)
+
+    def iter_solutions(self,
+                       time_limit: Union[None, str] = None,
+                       solution_limit: Union[None, int] = None,
+                       node_limit: Union[None, int] = None,
+                       fail_limit: Union[None, int] = None,
+                       restart_limit: Union[None, int] = None,
+                       backtrack_limit: Union[None, int] = None,
+                       vars: Union[None, List[IntVar]] = None) -> Iterator[Union[Solution, ProjectedSolution]]:
+        """
+        Lazily enumerates the solutions to a problem, eventually with respect to search limits. Unlike
+        find_all_solutions, the search is resumed only when the next solution is requested, and solutions are
+        not collected: memory stays bounded, and the enumeration can be stopped at any time (e.g. with `break`).
+        :param time_limit: Time limit for search (e.g. "10s", "2m"), None => no time limit.
+        :param solution_limit: Number of solutions limit for search, None => no solution limit.
+        :param node_limit: Number of nodes limit for search, None => no node limit.
+        :param fail_limit: Number of fails limit for search, None => no fail limit.
+        :param restart_limit: Number of restarts limit for search, None => no restart limit.
+        :param backtrack_limit: Number of backtracks limit for search, None => no backtracks limit.
+        :param vars: If not None, the IntVars (or BoolVars) to record: solutions are then ProjectedSolutions
+            storing only the values of these variables (the other ones cannot be retrieved).
+        :return: An iterator over the solutions.
+        """
+        limits = self._stop_criteria(time_limit, None, node_limit, fail_limit, restart_limit, backtrack_limit)
+        projection = _Projection(vars) if vars is not None else None
+        with self._search(limits):
+            nb_solutions = 0
+            while solution_limit is None or nb_solutions < solution_limit:
+                solution = self._find_solution(limits, projection)
+                if solution is None:
+                    return
+                nb_solutions += 1
+                yield solution
+
+    def _stop_criteria(self,
+                       time_limit: Union[None, str] = None,
+                       solution_limit: Union[None, int] = None,
+                       node_limit: Union[None, int] = None,
+                       fail_limit: Union[None, int] = None,
+                       restart_limit: Union[None, int] = None,
+                       backtrack_limit: Union[None, int] = None):
+        """
+        Sets the time limit of the solver, and returns the Java Criterion handles of the other search limits (as
+        _SearchLimits, released when the search ends).
         """
         criterion = list()
         if time_limit is not None:
@@ -121,10 +263,8 @@ class Solver(SearchStrategies, _HandleWrapper):
         if restart_limit is not None:
             criterion.append(backend.restart_counter(self._handle, restart_limit))
         if backtrack_limit is not None:
-            criterion.append(backend.backtrack_counter(self._handle, restart_limit))
-        stop = make_criterion_var_array(criterion)
-        solutions_list_handle = backend.find_all_solutions(self._handle, stop)
-        return extract_solutions(solutions_list_handle)
+            criterion.append(backend.backtrack_counter(self._handle, backtrack_limit))
+        return _SearchLimits(criterion)
 
     def find_optimal_solution(self,
                               objective: IntVar,
@@ -134,7 +274,8 @@ class Solver(SearchStrategies, _HandleWrapper):
                               node_limit: Union[None, int] = None,
                               fail_limit: Union[None, int] = None,
                               restart_limit: Union[None, int] = None,
-                              backtrack_limit: Union[None, int] = None) -> Solution:
+                              backtrack_limit: Union[None, int] = None,
+                              vars: Union[None, List[IntVar]] = None) -> Union[Solution, ProjectedSolution]:
         """
         Finds the optimal solution (minimum or maximum) solution according to an objective variable.
         Note that if search limits were defined, the returned solution might not be the optimal, but the
@@ -147,26 +288,15 @@ class Solver(SearchStrategies, _HandleWrapper):
         :param fail_limit: Number of fails limit for search, None => no fail limit.
         :param restart_limit: Number of restarts limit for search, None => no restart limit.
         :param backtrack_limit: Number of backtracks limit for search, None => no backtracks limit.
+        :param vars: If not None, the IntVars (or BoolVars) to record: solutions are then ProjectedSolutions
+            storing only the values of these variables (the other ones cannot be retrieved).
         :return: The optimal (or best) solution found.
         """
-        criterion = list()
-        if time_limit is not None:
-            self.limit_time(time_limit)
-        if solution_limit is not None:
-            criterion.append(backend.solution_counter(self.model._handle, solution_limit))
-        if node_limit is not None:
-            criterion.append(backend.node_counter(self.model._handle, node_limit))
-        if fail_limit is not None:
-            criterion.append(backend.fail_counter(self.model._handle, fail_limit))
-        if restart_limit is not None:
-            criterion.append(backend.restart_counter(self._handle, restart_limit))
-        if backtrack_limit is not None:
-            criterion.append(backend.backtrack_counter(self._handle, restart_limit))
-        stop = make_criterion_var_array(criterion)
-        solution_handle = backend.find_optimal_solution(self._handle, objective._handle, maximize, stop)
-        if solution_handle is None:
-            return None
-        return Solution(solution_handle)
+        limits = self._stop_criteria(time_limit, solution_limit, node_limit, fail_limit, restart_limit,
+                                       backtrack_limit)
+        projection = _Projection(vars) if vars is not None else None
+        with self._search(limits):
+            return self._find_optimal_solution(objective, maximize, limits, projection)
 
     def find_all_optimal_solutions(self,
                                    objective: IntVar,
@@ -176,7 +306,10 @@ class Solver(SearchStrategies, _HandleWrapper):
                                    node_limit: Union[None, int] = None,
                                    fail_limit: Union[None, int] = None,
                                    restart_limit: Union[None, int] = None,
-                                   backtrack_limit: Union[None, int] = None) -> List[Solution]:
+                                   backtrack_limit: Union[None, int] = None,
+                                   vars: Union[None, List[IntVar]] = None,
+                                   as_matrix: Union[None, List[IntVar]] = None,
+                                   container: str = "list"):
         """
         Finds all optimal solutions (minimum or maximum) solution according to an objective variable.
         Note that if search limits were defined, the returned solutions might not be optimal, but the
@@ -189,24 +322,309 @@ class Solver(SearchStrategies, _HandleWrapper):
         :param fail_limit: Number of fails limit for search, None => no fail limit.
         :param restart_limit: Number of restarts limit for search, None => no restart limit.
         :param backtrack_limit: Number of backtracks limit for search, None => no backtracks limit.
-        :return: All optimal (or best) solutions found.
+        :param vars: If not None, the IntVars (or BoolVars) to record: solutions are then ProjectedSolutions
+            storing only the values of these variables (the other ones cannot be retrieved).
+            As optimal solutions are found by Choco in two passes, complete solutions are still collected during the
+            search, and only released once projected.
+        :param as_matrix: If not None, the IntVars (or BoolVars) whose values are returned, as a
+            (nb solutions x nb variables) matrix filled with a single backend call, instead of a list of solutions.
+        :param container: The type of matrix returned when `as_matrix` is used: "list" (default) for a list of int
+            lists, "array" for a 2D memoryview over an array('i'), "numpy" for a 2D NumPy int32 array.
+        :return: All optimal (or best) solutions found (or the solution matrix).
+        """
+        assert vars is None or as_matrix is None, \
+            "[find_all_optimal_solutions] vars and as_matrix cannot be used together"
+        limits = self._stop_criteria(time_limit, solution_limit, node_limit, fail_limit, restart_limit,
+                                     backtrack_limit)
+        with self._search(limits):
+            if self._interrupted:
+                if as_matrix is not None:
+                    return shape_int_matrix(new_int_buffer(0, container), 0, len(as_matrix), container)
+                return []
+            solutions_list_handle = self._run(
+                lambda stop: backend.find_all_optimal_solutions(self._handle, objective._handle, maximize, stop),
+                limits)
+        if as_matrix is not None:
+            return self._solution_matrix(solutions_list_handle, as_matrix, container)
+        if vars is not None:
+            solutions = extract_solutions(solutions_list_handle, _Projection(vars))
+            backend.chocosolver_handles_destroy(solutions_list_handle)
+            return solutions
+        return extract_solutions(solutions_list_handle, model=self.model)
+
+    def _solution_matrix(self, solutions_list_handle, intvars: List[IntVar], container: str):
+        """
+        Converts a Java List<Solution> handle into a solution matrix, and releases the list.
+        """
+        matrix = get_solution_matrix(solutions_list_handle, intvars, container)
+        backend.chocosolver_handles_destroy(solutions_list_handle)
+        return matrix
+
+    async def solve_async(self,
+                          time_limit: Union[None, str] = None,
+                          node_limit: Union[None, int] = None,
+                          fail_limit: Union[None, int] = None,
+                          restart_limit: Union[None, int] = None,
+                          backtrack_limit: Union[None, int] = None) -> bool:
+        """
+        Asynchronous version of solve(): the search runs in the default executor of the event loop, without
+        holding the GIL. If the awaiting task is cancelled, the search is stopped (within SEARCH_SLICE_TIME seconds)
+        before the cancellation is propagated, and the search state is then 'STOPPED'.
+        :param time_limit: Time limit for search (e.g. "10s", "2m"), None => no time limit.
+        :param node_limit: Number of nodes limit for search, None => no node limit.
+        :param fail_limit: Number of fails limit for search, None => no fail limit.
+        :param restart_limit: Number of restarts limit for search, None => no restart limit.
+        :param backtrack_limit: Number of backtracks limit for search, None => no backtracks limit.
+        :return: True if a solution was found.
+        """
+        limits = self._stop_criteria(time_limit, None, node_limit, fail_limit, restart_limit, backtrack_limit)
+        with self._search(limits):
+            return await self._run_async(lambda cancelled: self._solve(limits, cancelled))
+
+    async def find_solution_async(self,
+                                  time_limit: Union[None, str] = None,
+                                  node_limit: Union[None, int] = None,
+                                  fail_limit: Union[None, int] = None,
+                                  restart_limit: Union[None, int] = None,
+                                  backtrack_limit: Union[None, int] = None,
+                                  vars: Union[None, List[IntVar]] = None) -> Union[Solution, ProjectedSolution]:
+        """
+        Asynchronous version of find_solution() (see solve_async() for cancellation).
+        :param time_limit: Time limit for search (e.g. "10s", "2m"), None => no time limit.
+        :param node_limit: Number of nodes limit for search, None => no node limit.
+        :param fail_limit: Number of fails limit for search, None => no fail limit.
+        :param restart_limit: Number of restarts limit for search, None => no restart limit.
+        :param backtrack_limit: Number of backtracks limit for search, None => no backtracks limit.
+        :param vars: If not None, the IntVars (or BoolVars) to record: solutions are then ProjectedSolutions
+            storing only the values of these variables (the other ones cannot be retrieved).
+        :return: The first solution found (None if there is none, or if the search was stopped before).
+        """
+        limits = self._stop_criteria(time_limit, None, node_limit, fail_limit, restart_limit, backtrack_limit)
+        projection = _Projection(vars) if vars is not None else None
+        with self._search(limits):
+            return await self._run_async(lambda cancelled: self._find_solution(limits, projection, cancelled))
+
+    async def iter_solutions_async(self,
+                                   time_limit: Union[None, str] = None,
+                                   solution_limit: Union[None, int] = None,
+                                   node_limit: Union[None, int] = None,
+                                   fail_limit: Union[None, int] = None,
+                                   restart_limit: Union[None, int] = None,
+                                   backtrack_limit: Union[None, int] = None,
+                                   vars: Union[None, List[IntVar]] = None) \
+            -> AsyncIterator[Union[Solution, ProjectedSolution]]:
+        """
+        Asynchronous version of iter_solutions(), to be used with `async for`: the search is resumed (in the
+        default executor of the event loop) only when the next solution is requested. See solve_async() for
+        cancellation.
+        :param time_limit: Time limit for search (e.g. "10s", "2m"), None => no time limit.
+        :param solution_limit: Number of solutions limit for search, None => no solution limit.
+        :param node_limit: Number of nodes limit for search, None => no node limit.
+        :param fail_limit: Number of fails limit for search, None => no fail limit.
+        :param restart_limit: Number of restarts limit for search, None => no restart limit.
+        :param backtrack_limit: Number of backtracks limit for search, None => no backtracks limit.
+        :param vars: If not None, the IntVars (or BoolVars) to record: solutions are then ProjectedSolutions
+            storing only the values of these variables (the other ones cannot be retrieved).
+        :return: An asynchronous iterator over the solutions.
+        """
+        limits = self._stop_criteria(time_limit, None, node_limit, fail_limit, restart_limit, backtrack_limit)
+        projection = _Projection(vars) if vars is not None else None
+        with self._search(limits):
+            nb_solutions = 0
+            while solution_limit is None or nb_solutions < solution_limit:
+                solution = await self._run_async(
+                    lambda cancelled: self._find_solution(limits, projection, cancelled))
+                if solution is None:
+                    return
+                nb_solutions += 1
+                yield solution
+
+    async def find_optimal_solution_async(self,
+                                          objective: IntVar,
+                                          maximize: bool,
+                                          time_limit: Union[None, str] = None,
+                                          solution_limit: Union[None, int] = None,
+                                          node_limit: Union[None, int] = None,
+                                          fail_limit: Union[None, int] = None,
+                                          restart_limit: Union[None, int] = None,
+                                          backtrack_limit: Union[None, int] = None,
+                                          vars: Union[None, List[IntVar]] = None) \
+            -> Union[Solution, ProjectedSolution]:
+        """
+        Asynchronous version of find_optimal_solution() (see solve_async() for cancellation). Without `vars`, the
+        search is a single backend call (see set_interruptible()): a cancellation waits for its end.
+        :param objective: Objective variable.
+        :param maximize: if True, maximizes the objective variable, otherwise minimizes it.
+        :param time_limit: Time limit for search (e.g. "10s", "2m"), None => no time limit.
+        :param solution_limit: Number of solutions limit for search, None => no solution limit.
+        :param node_limit: Number of nodes limit for search, None => no node limit.
+        :param fail_limit: Number of fails limit for search, None => no fail limit.
+        :param restart_limit: Number of restarts limit for search, None => no restart limit.
+        :param backtrack_limit: Number of backtracks limit for search, None => no backtracks limit.
+        :param vars: If not None, the IntVars (or BoolVars) to record: solutions are then ProjectedSolutions
+            storing only the values of these variables (the other ones cannot be retrieved).
+        :return: The optimal (or best) solution found.
         """
-        criterion = list()
-        if time_limit is not None:
-            self.limit_time(time_limit)
-        if solution_limit is not None:
-            criterion.append(backend.solution_counter(self.model._handle, solution_limit))
-        if node_limit is not None:
-            criterion.append(backend.node_counter(self.model._handle, node_limit))
-        if fail_limit is not None:
-            criterion.append(backend.fail_counter(self.model._handle, fail_limit))
-        if restart_limit is not None:
-            criterion.append(backend.restart_counter(self._handle, restart_limit))
-        if backtrack_limit is not None:
-            criterion.append(backend.backtrack_counter(self._handle, restart_limit))
-        stop = make_criterion_var_array(criterion)
-        solutions_list_handle = backend.find_all_optimal_solutions(self._handle, objective._handle, maximize, stop)
-        return extract_solutions(solutions_list_handle)
+        limits = self._stop_criteria(time_limit, solution_limit, node_limit, fail_limit, restart_limit,
+                                       backtrack_limit)
+        projection = _Projection(vars) if vars is not None else None
+        with self._search(limits):
+            return await self._run_async(
+                lambda cancelled: self._find_optimal_solution(objective, maximize, limits, projection, cancelled))
+
+    async def _run_async(self, search):
+        """
+        Runs `search` (a function of a threading.Event set on cancellation) in the default executor of the running
+        event loop. On cancellation, waits for the search to stop before propagating the cancellation.
+        """
+        cancelled = threading.Event()
+        future = asyncio.get_running_loop().run_in_executor(None, search, cancelled)
+        try:
+            return await asyncio.shield(future)
+        except asyncio.CancelledError:
+            cancelled.set()
+            await asyncio.wait([future])
+            raise
+
+    @contextmanager
+    def _search(self, limits: _SearchLimits):
+        """
+        Context of a search: the interruption request, if any, is cleared when the search ends, and the handles of
+        its search limits are released.
+        """
+        try:
+            yield
+        finally:
+            self._interrupted = False
+            backend.chocosolver_handles_destroy_all(self._isolate, limits.handles())
+
+    def _is_interruptible(self, cancelled: Union[None, threading.Event]):
+        """
+        :return: True if the search must be run in slices (the solver is interruptible, or the search asynchronous).
+        """
+        return self._interruptible or cancelled is not None
+
+    def _is_stopped(self, cancelled: Union[None, threading.Event]):
+        """
+        :return: True if the search was interrupted, or cancelled.
+        """
+        return self._interrupted or (cancelled is not None and cancelled.is_set())
+
+    def _run(self, call, limits: _SearchLimits):
+        """
+        Runs a search call with the search limits `limits`, in a single backend call (which cannot be interrupted).
+        :param call: A function running a backend search call on a Java Criterion[] handle.
+        :return: The result of `call`.
+        """
+        self._busy = True
+        try:
+            return call(limits.stop())
+        finally:
+            self._busy = False
+
+    def _run_slice(self, call, limits: _SearchLimits):
+        """
+        Runs a search call with the search limits `limits`, for at most SEARCH_SLICE_TIME more seconds.
+        :param call: A function running a backend search call on a Java Criterion[] handle.
+        :return: The result of `call`, and True if the search was only stopped by the slice (it can be resumed).
+        """
+        limit = backend.get_time_count(self._handle) + SEARCH_SLICE_TIME
+        slice_criterion = backend.time_counter(self.model._handle, int(limit * 1e9))
+        result = call(limits.sliced(slice_criterion))
+        # The Criterion[] of the limits still refers to the criterion, until the next slice replaces it.
+        backend.chocosolver_handles_destroy(slice_criterion)
+        # The time count is a single precision float: a slice that ran almost up to its limit is deemed complete.
+        resumable = backend.get_search_state(self._handle) == "STOPPED" and \
+            backend.get_time_count(self._handle) >= limit - SEARCH_SLICE_TIME / 10
+        return result, resumable
+
+    def _solve(self, limits: _SearchLimits, cancelled: Union[None, threading.Event] = None):
+        """
+        Searches the next solution, with the search limits `limits`.
+        :return: True if a solution was found.
+        """
+        if self._is_stopped(cancelled):
+            return False
+        solve = lambda stop: backend.solve(self._handle, stop)
+        if not self._is_interruptible(cancelled):
+            return bool(self._run(solve, limits))
+        while True:
+            found, resumable = self._run_slice(solve, limits)
+            if found or not resumable or self._is_stopped(cancelled):
+                return bool(found)
+
+    def _find_solution(self, limits: _SearchLimits, projection: Union[None, _Projection],
+                       cancelled: Union[None, threading.Event] = None):
+        """
+        Searches the next solution, with the search limits `limits`.
+        :return: The solution (a ProjectedSolution if `projection` is not None), or None if none was found.
+        """
+        if projection is not None:
+            return projection.record() if self._solve(limits, cancelled) else None
+        if self._is_stopped(cancelled):
+            return None
+        find = lambda stop: backend.find_solution(self._handle, stop)
+        if not self._is_interruptible(cancelled):
+            handle = self._run(find, limits)
+            return Solution(handle, self.model) if handle is not None else None
+        while True:
+            handle, resumable = self._run_slice(find, limits)
+            if handle is not None:
+                return Solution(handle, self.model)
+            if not resumable or self._is_stopped(cancelled):
+                return None
+
+    def _find_optimal_solution(self, objective: IntVar, maximize: bool, limits: _SearchLimits,
+                               projection: Union[None, _Projection], cancelled: Union[None, threading.Event] = None):
+        """
+        Searches the optimal solution, with the search limits `limits`. The objective is set by the backend
+        find_optimal_solution() call, as in Choco: it remains set on the model afterwards.
+        :return: The best solution found (a ProjectedSolution if `projection` is not None), or None.
+        """
+        if self._is_stopped(cancelled):
+            return None
+        optimize = lambda stop: backend.find_optimal_solution(self._handle, objective._handle, maximize, stop)
+        if projection is None or not self._is_interruptible(cancelled):
+            # The backend only records complete solutions within a single find_optimal_solution() call: setting the
+            # objective again on each slice would lose its bound.
+            handle = self._run(optimize, limits)
+            if handle is None:
+                return None
+            solution = Solution(handle, self.model)
+            return solution if projection is None else projection.extract(solution)
+        # The first slice sets the objective, the next ones resume the search (keeping the objective and its
+        # bound) and record the projection of each improving solution.
+        nb_solutions = backend.get_solution_count(self._handle)
+        handle, resumable = self._run_slice(optimize, limits)
+        best = None
+        if handle is not None and backend.get_solution_count(self._handle) > nb_solutions:
+            best = projection.extract(Solution(handle, self.model))
+        elif handle is not None:
+            backend.chocosolver_handles_destroy(handle)
+        while resumable and not self._is_stopped(cancelled):
+            found, resumable = self._run_slice(lambda stop: backend.solve(self._handle, stop), limits)
+            if found:
+                best = projection.record()
+                resumable = True
+        return best
+
+    def _solve_matrix(self, limits: _SearchLimits, intvars: List[IntVar], container: str):
+        """
+        Searches all the solutions, one at a time, and records the values of `intvars` in each of them.
+        :return: The solution matrix (see get_solution_matrix()).
+        """
+        vars_array = make_intvar_array(intvars)
+        row = new_int_buffer(len(intvars))
+        values = array("i")
+        nb_solutions = 0
+        while self._solve(limits):
+            backend.intvar_array_values(vars_array, row)
+            values.extend(row)
+            nb_solutions += 1
+        if container == "numpy":
+            import numpy
+            values = numpy.array(values, dtype=numpy.intc)
+        return shape_int_matrix(values, nb_solutions, len(intvars), container)
 
     def show_statistics(self):
         """
@@ -7,6 +7,8 @@ class BoolVar(IntVar):
     or False / True). Therefore, the domain of an integer variable is [0, 1].
     """
 
+    __slots__ = ()
+
     def get_type(self):
         return "BoolVar"
 
@@ -9,6 +9,8 @@ class DirectedGraphVar(GraphVar):
     UB is the envelope graph (or upper bound), such that any instantiation is a subgraph of it.
     """
 
+    __slots__ = ()
+
     def __init__(self, handle, model: "Model", lb: "DirectedGraph", ub: "DirectedGraph"):
         self._lb = lb
         self._ub = ub
@@ -11,6 +11,8 @@ class GraphVar(Variable, ABC):
     UB is the envelope graph (or upper bound), such that any instantiation is a subgraph of it.
     """
 
+    __slots__ = ("_lb", "_ub")
+
     def __init__(self, handle, model: "Model", lb: "Graph", ub: "Graph"):
         self._lb = lb
         self._ub = ub
@@ -1,5 +1,5 @@
 from pychoco import backend
-from pychoco._utils import get_int_array
+from pychoco._utils import get_int_array, get_intvars_bounds
 from pychoco.variables.variable import Variable
 
 
@@ -11,6 +11,12 @@ class IntVar(Variable):
     (with a lower bound and an upper bound), or enumerated.
     """
 
+    __slots__ = ("_enumerated",)
+
+    def __init__(self, handle, model):
+        super().__init__(handle, model)
+        self._enumerated = None
+
     def get_lb(self):
         """
         :return: The lower bound of the variable.
@@ -23,6 +29,13 @@ class IntVar(Variable):
         """
         return backend.get_intvar_ub(self._handle)
 
+    def get_bounds(self):
+        """
+        :return: The lower and upper bounds of the variable, retrieved with a single backend call.
+        """
+        lb, ub = get_intvars_bounds([self])
+        return lb, ub
+
     def get_value(self):
         """
         :return: The value of the variable (only valid if it is instantiated).
@@ -34,14 +47,18 @@ class IntVar(Variable):
         """
         :return: True if the domain of this variable is enumerated.
         """
-        return backend.has_enumerated_domain(self._handle)
+        if self._enumerated is None:
+            self._enumerated = bool(backend.has_enumerated_domain(self._handle))
+        return self._enumerated
 
-    def get_domain_values(self):
+    def get_domain_values(self, container: str = "list"):
         """
+        :param container: "list" (default) for a Python int list, "array" for an array('i'), "numpy" for a NumPy
+            int32 array.
         :return The enumerated values of this variable's domain.
         """
         val_handle = backend.get_domain_values(self._handle)
-        vals = get_int_array(val_handle)
+        vals = get_int_array(val_handle, container)
         return vals
 
     def get_type(self):
@@ -51,14 +68,15 @@ class IntVar(Variable):
         if self.has_enumerated_domain():
             return super().__repr__() + " = {}".format(self.get_domain_values())
         else:
-            return super().__repr__() + " = [{}, {}]".format(self.get_lb(), self.get_ub())
+            return super().__repr__() + " = [{}, {}]".format(*self.get_bounds())
 
     def __abs__(self):
         return self.model.int_abs_view(self)
 
     def __add__(self, other):
         if isinstance(other, IntVar):
-            res = self.model.intvar(self.get_lb() + other.get_lb(), self.get_ub() + other.get_ub())
+            lb, ub, other_lb, other_ub = get_intvars_bounds([self, other])
+            res = self.model.intvar(lb + other_lb, ub + other_ub)
             self.model.arithm(self, "+", other, "=", res).post()
             return res
         elif isinstance(other, int):
@@ -71,7 +89,8 @@ class IntVar(Variable):
 
     def __sub__(self, other):
         if isinstance(other, IntVar):
-            res = self.model.intvar(self.get_lb() - other.get_ub(), self.get_ub() - other.get_lb())
+            lb, ub, other_lb, other_ub = get_intvars_bounds([self, other])
+            res = self.model.intvar(lb - other_ub, ub - other_lb)
             self.model.arithm(self, "-", other, "=", res).post()
             return res
         elif isinstance(other, int):
@@ -87,8 +106,8 @@ class IntVar(Variable):
 
     def __mul__(self, other):
         if isinstance(other, IntVar):
-            a = [self.get_lb() * other.get_lb(), self.get_lb() * other.get_ub(), self.get_ub() * other.get_lb(),
-                 self.get_ub() * other.get_ub()]
+            lb, ub, other_lb, other_ub = get_intvars_bounds([self, other])
+            a = [lb * other_lb, lb * other_ub, ub * other_lb, ub * other_ub]
             res = self.model.intvar(min(a), max(a))
             self.model.arithm(self, "*", other, "=", res).post()
             return res
@@ -102,14 +121,14 @@ class IntVar(Variable):
 
     def __truediv__(self, other):
         if isinstance(other, IntVar):
-            a = [int(self.get_lb() / other.get_lb()), int(self.get_lb() / other.get_ub()),
-                 int(self.get_ub() / other.get_lb()),
-                 int(self.get_ub() / other.get_ub())]
+            lb, ub, other_lb, other_ub = get_intvars_bounds([self, other])
+            a = [int(lb / other_lb), int(lb / other_ub), int(ub / other_lb), int(ub / other_ub)]
             res = self.model.intvar(min(a), max(a))
             self.model.arithm(self, "/", other, "=", res).post()
             return res
         elif isinstance(other, int):
-            a = [int(self.get_lb() / other), int(self.get_ub() / other)]
+            lb, ub = self.get_bounds()
+            a = [int(lb / other), int(ub / other)]
             res = self.model.intvar(min(a), max(a))
             self.model.arithm(self, "/", other, "=", res).post()
             return res
@@ -120,7 +139,8 @@ class IntVar(Variable):
         if isinstance(power, int):
             if power <= 0:
                 raise NotImplementedError("Unsupported operation between IntVar and int <= 0")
-            a = [self.get_lb() ** power, self.get_ub() ** power]
+            lb, ub = self.get_bounds()
+            a = [lb ** power, ub ** power]
             res = self.model.intvar(min(a), max(a))
             self.model.pow(self, power, res).post()
             return res
@@ -129,13 +149,14 @@ class IntVar(Variable):
 
     def __mod__(self, other):
         if isinstance(other, IntVar):
-            a = [self.get_lb() % other.get_lb(), self.get_lb() % other.get_ub(), self.get_ub() % other.get_lb(),
-                 self.get_ub() % other.get_ub()]
+            lb, ub, other_lb, other_ub = get_intvars_bounds([self, other])
+            a = [lb % other_lb, lb % other_ub, ub % other_lb, ub % other_ub]
             res = self.model.intvar(min(a), max(a))
             self.model.mod(self, other, res).post()
             return res
         elif isinstance(other, int):
-            a = [self.get_lb() % other, self.get_ub() % other]
+            lb, ub = self.get_bounds()
+            a = [lb % other, ub % other]
             res = self.model.intvar(min(a), max(a))
             self.model.mod(self, other, res).post()
             return res
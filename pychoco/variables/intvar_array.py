@@ -0,0 +1,260 @@
+from collections.abc import Sequence
+from typing import List, Tuple, Union
+
+from pychoco import backend
+from pychoco._handle_wrapper import _HandleWrapper
+from pychoco.variables.boolvar import BoolVar
+from pychoco.variables.intvar import IntVar
+
+
+class IntVarArray(_HandleWrapper, Sequence):
+    """
+    An immutable sequence (or 2D matrix) of IntVars, backed by a Java IntVar[] handle. The handle is reused
+    (instead of building a new Java array) whenever the sequence is given to a constraint, a view or a search
+    strategy.
+
+    Python IntVars are only created when accessed. Slices, as well as the rows, columns and diagonals of a
+    matrix, are views sharing these variables: their own Java array is built (once) on first use.
+    """
+
+    _var_class = IntVar
+
+    def __init__(self, handle, model, shape: Union[Tuple[int], Tuple[int, int], None] = None,
+                 variables: Union[List[IntVar], None] = None):
+        """
+        :param handle: A Java IntVar[] handle. For a matrix, the rows are stored one after the other.
+        :param model: The model in which the variables were declared.
+        :param shape: (size,) or (nrows, ncols). If None, the size of the Java array.
+        :param variables: The Python variables wrapping the elements of the Java array (optional).
+            If None, they are wrapped on access.
+        """
+        super().__init__(handle, model)
+        if shape is None:
+            shape = (len(variables),) if variables is not None else (backend.intvar_array_length(handle),)
+        assert 1 <= len(shape) <= 2, "Only 1D and 2D arrays of variables are currently supported"
+        self._model = model
+        self._shape = tuple(shape)
+        self._base = self
+        self._start = 0
+        self._step = 1
+        size = self._shape[0] if len(self._shape) == 1 else self._shape[0] * self._shape[1]
+        self._vars = list(variables) if variables is not None else [None] * size
+        self._views = {}
+        self._matrix = None
+
+    @property
+    def _handle(self):
+        if self._handle_ is None:
+            self._set_handle(self._slice(self._base._handle, self._start, self._step, len(self)))
+        return _HandleWrapper._handle.fget(self)
+
+    @property
+    def model(self):
+        """
+        The model in which the variables were declared.
+        """
+        return self._model
+
+    @property
+    def shape(self):
+        """
+        The dimensions of the array: (size,), or (nrows, ncols) for a matrix.
+        """
+        return self._shape
+
+    @property
+    def ndim(self):
+        """
+        The number of dimensions of the array (1 or 2).
+        """
+        return len(self._shape)
+
+    def row(self, i: int):
+        """
+        :param i: A row index.
+        :return: The i-th row of this matrix.
+        """
+        nrows, ncols = self._matrix_shape()
+        return self._view(self._index(i, nrows) * ncols, 1, ncols)
+
+    def column(self, j: int):
+        """
+        :param j: A column index.
+        :return: The j-th column of this matrix.
+        """
+        nrows, ncols = self._matrix_shape()
+        return self._view(self._index(j, ncols), ncols, nrows)
+
+    def diagonal(self):
+        """
+        :return: The main diagonal of this matrix (from the top-left corner).
+        """
+        nrows, ncols = self._matrix_shape()
+        return self._view(0, ncols + 1, min(nrows, ncols))
+
+    def anti_diagonal(self):
+        """
+        :return: The anti-diagonal of this matrix (from the top-right corner).
+        """
+        nrows, ncols = self._matrix_shape()
+        return self._view(ncols - 1, ncols - 1, min(nrows, ncols))
+
+    def flatten(self):
+        """
+        :return: The variables of this array as a 1D array (rows one after the other for a matrix).
+        """
+        if self.ndim == 1:
+            return self
+        return self._view(0, 1, len(self._vars))
+
+    def tolist(self):
+        """
+        :return: The variables of this array as a list (a list of rows for a matrix).
+        """
+        if self._base is not self:
+            return list(self)
+        if any(v is None for v in self._vars):
+            handles = backend.intvar_array_get_all(self._handle, len(self._vars))
+            for k, h in enumerate(handles):
+                if self._vars[k] is None:
+                    self._vars[k] = self._var_class(h, self._model)
+        if self.ndim == 1:
+            return list(self._vars)
+        nrows, ncols = self._shape
+        return [self._vars[i * ncols:(i + 1) * ncols] for i in range(0, nrows)]
+
+    def __getitem__(self, item):
+        if isinstance(item, tuple):
+            assert self.ndim == 2 and len(item) == 2, "Only matrices can be indexed with a pair of indices"
+            i, j = item
+            if isinstance(i, slice):
+                if isinstance(j, slice):
+                    return [self.row(r)[j] for r in range(0, self._shape[0])[i]]
+                return self.column(j)[i]
+            return self.row(i)[j]
+        if self.ndim == 2:
+            if isinstance(item, slice):
+                return [self.row(i) for i in range(0, self._shape[0])[item]]
+            return self.row(item)
+        if isinstance(item, slice):
+            indices = range(0, len(self))[item]
+            return self._view(self._start + indices.start * self._step, indices.step * self._step, len(indices))
+        k = self._start + self._index(item, len(self)) * self._step
+        if self._vars[k] is None:
+            self._vars[k] = self._var_class(backend.intvar_array_get(self._base._handle, k), self._model)
+        return self._vars[k]
+
+    def __len__(self):
+        return self._shape[0]
+
+    def __iter__(self):
+        if self.ndim == 2:
+            return (self.row(i) for i in range(0, self._shape[0]))
+        indices = range(self._start, self._start + len(self) * self._step, self._step)
+        if all(self._vars[k] is None for k in indices):
+            handles = backend.intvar_array_get_all(self._handle, len(self))
+            for k, h in zip(indices, handles):
+                self._vars[k] = self._var_class(h, self._model)
+        return (self._vars[k] if self._vars[k] is not None else self[i] for i, k in enumerate(indices))
+
+    def __contains__(self, value):
+        return any(v is value for v in self)
+
+    def index(self, value, start=0, stop=None):
+        for i, v in enumerate(self[start:stop]):
+            if v is value:
+                return range(0, len(self))[start:stop][i]
+        raise ValueError("{} is not in array".format(value))
+
+    def count(self, value):
+        return sum(1 for v in self if v is value)
+
+    def __add__(self, other):
+        return list(self) + list(other)
+
+    def __radd__(self, other):
+        return list(other) + list(self)
+
+    def __repr__(self):
+        if self.ndim == 2:
+            return repr([list(row) for row in self])
+        return repr(list(self))
+
+    def _get_matrix_handle(self):
+        """
+        :return: A Java IntVar[][] handle over the rows of this matrix, built once.
+        """
+        if self._matrix is None:
+            nrows = self._matrix_shape()[0]
+            handle = self._create_matrix(nrows)
+            for i in range(0, nrows):
+                self._set_matrix_row(handle, self.row(i)._handle, i)
+            self._matrix = _HandleWrapper(handle, self._model)
+        return self._matrix._handle
+
+    def _matrix_shape(self):
+        assert self.ndim == 2, "This operation is only available for matrices"
+        return self._shape
+
+    def _view(self, start: int, step: int, length: int):
+        """
+        :return: The (cached) 1D view over `length` variables of the base array, starting at index `start`
+            (in the base array) and separated by `step`.
+        """
+        key = (start, step, length)
+        base = self._base
+        if base.ndim == 1 and key == (0, 1, len(base)):
+            return base
+        view = base._views.get(key)
+        if view is None:
+            view = type(self).__new__(type(self))
+            _HandleWrapper.__init__(view, None, base._model)
+            view._model = base._model
+            view._shape = (length,)
+            view._base = base
+            view._start = start
+            view._step = step
+            view._vars = base._vars
+            view._views = None
+            view._matrix = None
+            base._views[key] = view
+        return view
+
+    @staticmethod
+    def _index(i: int, length: int):
+        if not -length <= i < length:
+            raise IndexError("array index out of range")
+        return i % length
+
+    @staticmethod
+    def _slice(handle, start: int, step: int, length: int):
+        return backend.intvar_array_slice(handle, start, step, length)
+
+    @staticmethod
+    def _create_matrix(nrows: int):
+        return backend.create_intvar_2d_array(nrows)
+
+    @staticmethod
+    def _set_matrix_row(handle, row_handle, i: int):
+        backend.intvar_2d_array_set(handle, row_handle, i)
+
+
+class BoolVarArray(IntVarArray):
+    """
+    An immutable sequence (or 2D matrix) of BoolVars, backed by a Java BoolVar[] handle. As a BoolVar[] is also
+    an IntVar[], it can be used wherever an IntVarArray is expected.
+    """
+
+    _var_class = BoolVar
+
+    @staticmethod
+    def _slice(handle, start: int, step: int, length: int):
+        return backend.boolvar_array_slice(handle, start, step, length)
+
+    @staticmethod
+    def _create_matrix(nrows: int):
+        return backend.create_boolvar_2d_array(nrows)
+
+    @staticmethod
+    def _set_matrix_row(handle, row_handle, i: int):
+        backend.boolvar_2d_array_set(handle, row_handle, i)
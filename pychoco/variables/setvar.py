@@ -11,6 +11,8 @@ class SetVar(Variable):
     In the context of SetVars, a value of the variable is a set of integers.
     """
 
+    __slots__ = ()
+
     def get_lb(self):
         """
         :return: The lower bound of this setvar (a set of integers).
@@ -2,6 +2,7 @@ from typing import Union
 
 from pychoco import backend
 from pychoco._handle_wrapper import _HandleWrapper
+from pychoco._utils import get_intvars_bounds
 from pychoco.variables.intvar import IntVar
 
 
@@ -11,6 +12,8 @@ class Task(_HandleWrapper):
     It ensures that: start + duration = end
     """
 
+    __slots__ = ("_model", "_has_monitor", "_start", "_duration", "_end")
+
     def __init__(self, model: "_Model", start: "IntVar", duration: Union[int, "IntVar"],
                  end: Union[None, "IntVar"] = None):
         """
@@ -29,7 +32,8 @@ class Task(_HandleWrapper):
         self._duration = duration
         if end is None:
             if isinstance(duration, IntVar):
-                self._end = model.intvar(start.get_lb() + duration.get_lb(), start.get_ub() + duration.get_ub())
+                start_lb, start_ub, duration_lb, duration_ub = get_intvars_bounds([start, duration])
+                self._end = model.intvar(start_lb + duration_lb, start_ub + duration_ub)
                 handle = backend.create_task_iv_iv_iv(start._handle, duration._handle, self._end._handle)
             else:
                 handle = backend.create_task_iv_i(start._handle, duration)
@@ -44,7 +48,7 @@ class Task(_HandleWrapper):
                 handle = backend.create_task_iv_i_iv(start._handle, duration, end._handle)
                 self._duration = IntVar(backend.task_get_duration(handle), model)
         self._model = model
-        super().__init__(handle)
+        super().__init__(handle, model)
 
     @property
     def start(self):
@@ -9,6 +9,8 @@ class UndirectedGraphVar(GraphVar):
     UB is the envelope graph (or upper bound), such that any instantiation is a subgraph of it.
     """
 
+    __slots__ = ()
+
     def __init__(self, handle, model: "Model", lb: "UndirectedGraph", ub: "UndirectedGraph"):
         self._lb = lb
         self._ub = ub
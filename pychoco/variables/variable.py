@@ -10,16 +10,23 @@ class Variable(_HandleWrapper, ABC):
     problem. It is instantiated to a single value in any solution of the problem.
     """
 
+    # The name and the view flag of a variable never change: they are retrieved once, on first access.
+    __slots__ = ("_model", "_name", "_is_view")
+
     def __init__(self, handle, model):
-        super().__init__(handle)
+        super().__init__(handle, model)
         self._model = model
+        self._name = None
+        self._is_view = None
 
     @property
     def name(self):
         """
         The name of the variable.
         """
-        return backend.get_variable_name(self._handle)
+        if self._name is None:
+            self._name = backend.get_variable_name(self._handle)
+        return self._name
 
     @property
     def model(self):
@@ -38,7 +45,9 @@ class Variable(_HandleWrapper, ABC):
         """
         :return: True if this variable is a view
         """
-        return backend.is_view(self._handle)
+        if self._is_view is None:
+            self._is_view = bool(backend.is_view(self._handle))
+        return self._is_view
 
     @abstractmethod
     def get_type(self):
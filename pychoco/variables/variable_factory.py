@@ -1,13 +1,16 @@
 from abc import ABC, abstractmethod
+from array import array
 from typing import Union, List, Tuple
 
 from pychoco import backend
-from pychoco._utils import make_int_array
+from pychoco._handle_wrapper import _HandleWrapper
+from pychoco._utils import make_int_array, as_int_buffer, get_handles
 from pychoco.objects.graphs.directed_graph import DirectedGraph
 from pychoco.objects.graphs.undirected_graph import UndirectedGraph
 from pychoco.variables.boolvar import BoolVar
 from pychoco.variables.directed_graphvar import DirectedGraphVar
 from pychoco.variables.intvar import IntVar
+from pychoco.variables.intvar_array import IntVarArray, BoolVarArray
 from pychoco.variables.setvar import SetVar
 from pychoco.variables.task import Task
 from pychoco.variables.undirected_graphvar import UndirectedGraphVar
@@ -57,40 +60,69 @@ class VariableFactory(ABC):
                     else backend.intvar_siib(self._handle, name, lb, ub, bounded_domain)
         return IntVar(var_handle, self)
 
-    def intvars(self, size: Union[int, Tuple[int]], lb: Union[List[Union[int, List[int]]], int], ub: Union[int, None] = None, name: Union[str, None] = None, bounded_domain: Union[bool, None] = None):
+    def intvars(self, size: Union[int, Tuple[int]], lb: Union[List[Union[int, List[int]]], int], ub: Union[int, None] = None, name: Union[str, None] = None, bounded_domain: Union[bool, None] = None, as_array: bool = False):
         """
-        Creates a list of intvars.
+        Creates a list of intvars. The whole Java IntVar[] is created at once.
 
         :param size: Number of intvars. Either an int or a two-values tuple describing matrix dimensions (nrows, ncols)
         :param lb: Lower bound (integer). If lb is a list of ints, constant variables are created.
         :param ub: Upper bound (integer). If None: the variable is a constant equals to lb.
         :param bounded_domain: Force bounded (True) or enumerated domain (False). If None, Choco will automatically choose the best option.
         :param name: Prefix name of the intvars (automatically given if None).
-        :return: A list of intvars.
+        :param as_array: If True, returns an (immutable) IntVarArray, which wraps the variables on access and keeps
+            the handle of the Java array, to be reused when it is given to constraints.
+        :return: A list of intvars (a list of rows for a matrix), or an IntVarArray if as_array is True (of shape
+            (nrows, ncols) for a matrix). The Java array of a list is put in the array cache of the model, to be
+            reused when the list is given to constraints.
         """
         # Case 1D array
         if isinstance(size, int):
-            names = [None for i in range(0, size)]
-            if name is not None:
-                names = ["{}_{}".format(name, i) for i in range(0, size)]
             if isinstance(lb, list):
                 assert len(lb) == size
-                return [self.intvar(lb[i], None, names[i]) for i in range(0, size)]
-            else:
-                return [self.intvar(lb, ub, names[i], bounded_domain) for i in range(0, size)]
+            intvars = self._intvar_array((size,), lb, ub, name, bounded_domain)
+            return intvars if as_array else self._cached_list(intvars, ("intvar",))
         elif isinstance(size, tuple):
             # Case 2D array
             assert len(size) == 2, "Only 2D matrix of intvars are currently supported"
             nrows = size[0]
             ncols = size[1]
-            names = [[None for i in range(0, ncols)] for j in range(0, nrows)]
-            if name is not None:
-                names = [["{}_{},{}".format(name, j, i) for i in range(0, ncols)] for j in range(0, nrows)]
             if isinstance(lb, list):
                 assert len(lb) == nrows and len(lb[0]) == ncols, "The value list has wrong dimensions"
-                return [[self.intvar(lb[j][i], None, names[j][i]) for i in range(0, ncols)] for j in range(0, nrows)]
-            else:
-                return [[self.intvar(lb, ub, names[j][i], bounded_domain) for i in range(0, ncols)] for j in range(0, nrows)]
+                lb = [v for row in lb for v in row]
+            intvars = self._intvar_array((nrows, ncols), lb, ub, name, bounded_domain)
+            return intvars if as_array else self._cached_list(intvars, ("intvar",))
+
+    def _intvar_array(self, shape: Tuple[int], lb: Union[List[Union[int, List[int]]], int], ub: Union[int, None], name: Union[str, None], bounded_domain: Union[bool, None]):
+        """
+        Creates an IntVarArray of the given shape, whose variables are named after `name` (prefix_i, or prefix_r,c
+        for a matrix). For a matrix, lb is either an int or the flat list of the values.
+        """
+        size = shape[0] if len(shape) == 1 else shape[0] * shape[1]
+        ncols = 0 if len(shape) == 1 else shape[1]
+        if isinstance(lb, list):
+            if all(isinstance(v, int) for v in lb):
+                return IntVarArray(backend.intvars_i(self._handle, name, ncols, as_int_buffer(lb)), self, shape)
+            # Some variables have an enumerated domain: no bulk creation
+            names = [None] * size if name is None else _array_var_names(name, size, ncols)
+            variables = [self.intvar(lb[i], None, names[i]) for i in range(0, size)]
+            handle = backend.create_intvar_array_from_handles(get_handles(variables))
+            return IntVarArray(handle, self, shape, variables)
+        if ub is None:
+            return IntVarArray(backend.intvars_i(self._handle, name, ncols, array("i", [lb]) * size), self, shape)
+        bounded = -1 if bounded_domain is None else int(bounded_domain)
+        return IntVarArray(backend.intvars_ii(self._handle, name, ncols, size, lb, ub, bounded), self, shape)
+
+    def _cached_list(self, variables: IntVarArray, kinds: Tuple[str]):
+        """
+        Returns the variables of an array as a list (a list of rows for a matrix). The Java array of a 1D array is
+        handed over to the array cache of the model, for each of the given kinds of arrays.
+        """
+        variables_list = variables.tolist()
+        if variables.ndim == 1:
+            wrapper = _HandleWrapper(variables._take_handle())
+            for kind in kinds:
+                self._array_cache.add(kind, variables_list, wrapper)
+        return variables_list
 
     # Boolean variables #
 
@@ -116,38 +148,51 @@ class VariableFactory(ABC):
                 var_handle = backend.boolvar(self._handle)
         return BoolVar(var_handle, self)
 
-    def boolvars(self, size: Union[int, Tuple[int]], value: Union[List[Union[bool, List[bool]]], None] = None, name: Union[str, None] = None):
+    def boolvars(self, size: Union[int, Tuple[int]], value: Union[List[Union[bool, List[bool]]], None] = None, name: Union[str, None] = None, as_array: bool = False):
         """
-        Creates a list of boolvars.
+        Creates a list of boolvars. The whole Java BoolVar[] is created at once.
 
         :param size: Number of boolvars. Either an int or a two-values tuple describing matrix dimensions (nrows, ncols)
         :param value: If not None, a fixed value for the variables (which is thus a constant). This value is either
             the same for all variables (bool), or given as a list of bools.
         :param name: Prefix name of the variable (optional).
-        :return: A list of boolvars.
+        :param as_array: If True, returns an (immutable) BoolVarArray, which wraps the variables on access and keeps
+            the handle of the Java array, to be reused when it is given to constraints.
+        :return: A list of boolvars (a list of rows for a matrix), or a BoolVarArray if as_array is True (of shape
+            (nrows, ncols) for a matrix). The Java array of a list is put in the array cache of the model, to be
+            reused when the list is given to constraints.
         """
         if isinstance(size, int):
-            names = [None for i in range(0, size)]
-            if name is not None:
-                names = ["{}_{}".format(name, i) for i in range(0, size)]
             if isinstance(value, list):
                 assert len(value) == size
-                return [self.boolvar(value[i], names[i]) for i in range(0, size)]
-            else:
-                return [self.boolvar(value, names[i]) for i in range(0, size)]
+            boolvars = self._boolvar_array((size,), value, name)
+            return boolvars if as_array else self._cached_list(boolvars, ("boolvar", "intvar"))
         elif isinstance(size, tuple):
             # Case 2D array
             assert len(size) == 2, "Only 2D matrix of boolvars are currently supported"
             nrows = size[0]
             ncols = size[1]
-            names = [[None for i in range(0, ncols)] for j in range(0, nrows)]
-            if name is not None:
-                names = [["{}_{},{}".format(name, j, i) for i in range(0, ncols)] for j in range(0, nrows)]
             if isinstance(value, list):
                 assert len(value) == nrows and len(value[0]) == ncols, "The value list has wrong dimensions"
-                return [[self.boolvar(value[j][i], name=names[j][i]) for i in range(0, ncols)] for j in range(0, nrows)]
-            else:
-                return [[self.boolvar(name=names[j][i]) for i in range(0, ncols)] for j in range(0, nrows)]
+                value = [v for row in value for v in row]
+            boolvars = self._boolvar_array((nrows, ncols), value, name)
+            return boolvars if as_array else self._cached_list(boolvars, ("boolvar", "intvar"))
+
+    def _boolvar_array(self, shape: Tuple[int], value: Union[List[bool], bool, None], name: Union[str, None]):
+        """
+        Creates a BoolVarArray of the given shape, whose variables are named after `name` (prefix_i, or prefix_r,c
+        for a matrix). For a matrix, value is either a bool or the flat list of the values.
+        """
+        size = shape[0] if len(shape) == 1 else shape[0] * shape[1]
+        ncols = 0 if len(shape) == 1 else shape[1]
+        if isinstance(value, list):
+            assert all(v in [0, 1] for v in value), \
+                "The 'value' parameter must be either a boolean, or an int in [0, 1]"
+            return BoolVarArray(backend.boolvars_arr(self._handle, name, ncols, array("i", value)), self, shape)
+        if value is not None:
+            assert value in [0, 1], "The 'value' parameter must be either a boolean, or an int in [0, 1]"
+        val = -1 if value is None else int(value)
+        return BoolVarArray(backend.boolvars_b(self._handle, name, ncols, size, val), self, shape)
 
     # Task variables #
 
@@ -267,3 +312,14 @@ class VariableFactory(ABC):
             "[digraphvar] Bounds must be Directed graph."
         handle = backend.create_node_induced_digraphvar(self._handle, name, lb._handle, ub._handle)
         return DirectedGraphVar(handle, self, lb, ub)
+
+
+def _array_var_names(prefix: str, size: int, ncols: int):
+    """
+    Names of the variables of an array, as given by the backend bulk creation functions:
+    prefix_i, or prefix_r,c for rows of ncols columns (ncols > 0).
+    """
+    if ncols > 0:
+        return ["{}_{},{}".format(prefix, i // ncols, i % ncols) for i in range(0, size)]
+    return ["{}_{}".format(prefix, i) for i in range(0, size)]
+
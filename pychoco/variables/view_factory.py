@@ -24,6 +24,16 @@ class ViewFactory(ABC):
     def _handle(self):
         pass
 
+    def _declared_view(self, var: "Variable", key: tuple, create):
+        """
+        :return: The Python view previously created over `var` with the same `key` (if it is still alive and
+            declared views are checked), otherwise a new one, built by `create`.
+        """
+        interned = getattr(self, "_interned", None)
+        if interned is None:
+            return create()
+        return interned.get(var, key, create)
+
     # Boolean views
 
     def bool_not_view(self, boolvar: BoolVar):
@@ -32,8 +42,8 @@ class ViewFactory(ABC):
         :param boolvar: A BoolVar.
         :return: A bool_not_view.
         """
-        handle = backend.bool_not_view(boolvar._handle)
-        return BoolVar(handle, self)
+        return self._declared_view(boolvar, ("not",),
+                                   lambda: BoolVar(backend.bool_not_view(boolvar._handle), self))
 
     def set_bool_view(self, setvar: SetVar, value: int):
         """
@@ -71,8 +81,8 @@ class ViewFactory(ABC):
         :param offset: An int.
         :return: An int_offset_view.
         """
-        handle = backend.int_offset_view(intvar._handle, offset)
-        return IntVar(handle, self)
+        return self._declared_view(intvar, ("offset", offset),
+                                   lambda: IntVar(backend.int_offset_view(intvar._handle, offset), self))
 
     def int_minus_view(self, intvar: IntVar):
         """
@@ -80,8 +90,8 @@ class ViewFactory(ABC):
         :param intvar: An IntVar.
         :return: An int_minus_view.
         """
-        handle = backend.int_minus_view(intvar._handle)
-        return IntVar(handle, self)
+        return self._declared_view(intvar, ("scale", -1),
+                                   lambda: IntVar(backend.int_minus_view(intvar._handle), self))
 
     def int_scale_view(self, intvar: IntVar, scale: int):
         """
@@ -98,8 +108,12 @@ class ViewFactory(ABC):
         :return: An int_scale_view.
         """
         assert scale > -2, "[int_scale_view] scale must be > -2"
-        handle = backend.int_scale_view(intvar._handle, scale)
-        return IntVar(handle, self)
+        if scale == 1:
+            return intvar
+        if scale == 0:
+            return IntVar(backend.int_scale_view(intvar._handle, scale), self)
+        return self._declared_view(intvar, ("scale", scale),
+                                   lambda: IntVar(backend.int_scale_view(intvar._handle, scale), self))
 
     def int_abs_view(self, intvar: IntVar):
         """
@@ -135,8 +149,8 @@ class ViewFactory(ABC):
         :param value:  An int.
         :return:  An int_eq_view.
         """
-        handle = backend.int_eq_view(intvar._handle, value)
-        return BoolVar(handle, self)
+        return self._declared_view(intvar, ("eq", value),
+                                   lambda: BoolVar(backend.int_eq_view(intvar._handle, value), self))
 
     def int_ne_view(self, intvar: IntVar, value: int):
         """
@@ -146,8 +160,8 @@ class ViewFactory(ABC):
         :param value:  An int.
         :return:  An int_ne_view.
         """
-        handle = backend.int_ne_view(intvar._handle, value)
-        return BoolVar(handle, self)
+        return self._declared_view(intvar, ("ne", value),
+                                   lambda: BoolVar(backend.int_ne_view(intvar._handle, value), self))
 
     def int_le_view(self, intvar: IntVar, value: int):
         """
@@ -157,8 +171,8 @@ class ViewFactory(ABC):
         :param value:  An int.
         :return:  An int_le_view.
         """
-        handle = backend.int_le_view(intvar._handle, value)
-        return BoolVar(handle, self)
+        return self._declared_view(intvar, ("le", value),
+                                   lambda: BoolVar(backend.int_le_view(intvar._handle, value), self))
 
     def int_ge_view(self, intvar: IntVar, value: int):
         """
@@ -168,8 +182,8 @@ class ViewFactory(ABC):
         :param value:  An int.
         :return:  An int_ge_view.
         """
-        handle = backend.int_ge_view(intvar._handle, value)
-        return BoolVar(handle, self)
+        return self._declared_view(intvar, ("ge", value),
+                                   lambda: BoolVar(backend.int_ge_view(intvar._handle, value), self))
 
     # Set views
 
@@ -1,4 +1,5 @@
 import unittest
+from array import array
 
 from pychoco.model import Model
 
@@ -22,3 +23,19 @@ class TestMember(unittest.TestCase):
         self.assertEqual(len(sols), 21)
         for s in sols:
             self.assertTrue(s.get_int_val(x) in range(-10, 11))
+
+    def testMemberBuffer(self):
+        m = Model()
+        x = m.intvar(-1000, 1000)
+        m.member(x, array("i", [0, 1, 3, 5])).post()
+        sols = m.get_solver().find_all_solutions()
+        self.assertEqual(len(sols), 4)
+        for s in sols:
+            self.assertTrue(s.get_int_val(x) in [0, 1, 3, 5])
+
+    def testMemberSmallIntBuffer(self):
+        m = Model()
+        x = m.intvar(-1000, 1000)
+        m.member(x, array("b", [0, -1, 3])).post()
+        sols = m.get_solver().find_all_solutions()
+        self.assertEqual(sorted(s.get_int_val(x) for s in sols), [-1, 0, 3])
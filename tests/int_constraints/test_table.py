@@ -1,4 +1,5 @@
 import unittest
+from array import array
 
 from pychoco.model import Model
 
@@ -43,4 +44,36 @@ class TestTable(unittest.TestCase):
         ]
         m.table([x, y], tuples, algo="CT+", uvalue=-1).post()
         m.get_solver().find_all_solutions()
-        self.assertEqual(m.get_solver().get_solution_count(), 4)
\ No newline at end of file
+        self.assertEqual(m.get_solver().get_solution_count(), 4)
+
+    def testTableFlatBuffer(self):
+        m = Model()
+        x = m.intvar(0, 4)
+        y = m.boolvar()
+        z = m.boolvar()
+        tuples = array("i", [0, -1, 1,
+                             0, 0, 1,
+                             5, -1, 1,
+                             1, 0, 1])
+        m.table([x, y, z], tuples, algo="CT+").post()
+        m.get_solver().find_all_solutions()
+        self.assertEqual(m.get_solver().get_solution_count(), 2)
+
+    def testTableStridedBuffer(self):
+        m = Model()
+        x = m.intvar(0, 4)
+        y = m.boolvar()
+        z = m.boolvar()
+        # Every other row of a 2D buffer of 64-bit ints: a non-contiguous view
+        rows = array("q", [0, -1, 1,
+                           9, 9, 9,
+                           0, 0, 1,
+                           9, 9, 9,
+                           5, -1, 1,
+                           9, 9, 9,
+                           1, 0, 1])
+        tuples = memoryview(rows).cast("B").cast("q", shape=[7, 3])[::2]
+        self.assertFalse(tuples.c_contiguous)
+        m.table([x, y, z], tuples, algo="CT+").post()
+        m.get_solver().find_all_solutions()
+        self.assertEqual(m.get_solver().get_solution_count(), 2)
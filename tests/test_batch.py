@@ -0,0 +1,63 @@
+import time
+import unittest
+
+from pychoco.batch import solve_many
+from pychoco.model import Model
+
+
+def build_queens(n):
+    model = Model()
+    queens = model.intvars(n, 1, n)
+    model.all_different(queens).post()
+    model.all_different([queens[i] + i for i in range(0, n)]).post()
+    model.all_different([queens[i] - i for i in range(0, n)]).post()
+    return model
+
+
+def build_pigeonhole(n):
+    # Proving that n + 1 pigeons do not fit in n holes without global constraint takes a long time.
+    model = Model()
+    x = model.intvars(n + 1, 1, n)
+    for i in range(0, n + 1):
+        for j in range(i + 1, n + 1):
+            model.arithm(x[i], "!=", x[j]).post()
+    return model
+
+
+class TestBatch(unittest.TestCase):
+
+    def test_solve_many(self):
+        results = list(solve_many(build_queens, range(1, 9), workers=4))
+        self.assertEqual([r.index for r in results], list(range(0, 8)))
+        self.assertEqual([r.result is not None for r in results], [True, False, False, True, True, True, True, True])
+        for r in results:
+            self.assertIsNone(r.error)
+            self.assertEqual(r.statistics["solution_count"], 1 if r.result is not None else 0)
+
+    def test_solve_many_unordered(self):
+        count = lambda solver: len(solver.find_all_solutions())
+        results = list(solve_many(build_queens, [4, 5, 6, 8], workers=2, ordered=False, solve_fn=count))
+        self.assertEqual(sorted((r.input, r.result) for r in results), [(4, 2), (5, 10), (6, 4), (8, 92)])
+
+    def test_solve_many_errors(self):
+        results = list(solve_many(lambda n: build_queens(n) if n > 0 else None, [0, 4]))
+        self.assertIsInstance(results[0].error, AttributeError)
+        self.assertIsNone(results[0].statistics)
+        self.assertIsNotNone(results[1].result)
+
+    def test_solve_many_early_stop(self):
+        solvers = []
+
+        def solve(solver):
+            solvers.append(solver)
+            return solver.find_solution()
+
+        build = lambda n: build_queens(n) if n < 8 else build_pigeonhole(n)
+        results = solve_many(build, [4, 11, 12], workers=3, solve_fn=solve)
+        self.assertIsNotNone(next(results).result)
+        results.close()
+        # The running searches are interrupted
+        deadline = time.time() + 5
+        while any(s.get_search_state() == "RUNNING" for s in solvers) and time.time() < deadline:
+            time.sleep(0.05)
+        self.assertEqual(sorted(s.get_search_state() for s in solvers), ["STOPPED", "STOPPED", "TERMINATED"])
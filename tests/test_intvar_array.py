@@ -0,0 +1,52 @@
+import unittest
+
+from pychoco.model import Model
+from pychoco.variables.intvar_array import IntVarArray, BoolVarArray
+
+
+class TestIntVarArray(unittest.TestCase):
+
+    def test_slices(self):
+        m = Model()
+        x = m.intvars(6, 0, 5, name="x", as_array=True)
+        self.assertEqual([v.name for v in x[1::2]], ["x_1", "x_3", "x_5"])
+        self.assertEqual([v.name for v in x[::-1][1:3]], ["x_4", "x_3"])
+        self.assertIs(x[1::2], x[1::2])
+        self.assertIs(x[2], x[2])
+        self.assertTrue(x[3] in x)
+        self.assertEqual(x.index(x[3]), 3)
+
+    def test_matrix(self):
+        m = Model()
+        g = m.intvars((3, 4), 0, 5, name="g", as_array=True)
+        self.assertIsInstance(g, IntVarArray)
+        self.assertEqual(g.shape, (3, 4))
+        self.assertEqual(len(g), 3)
+        self.assertIs(g[1][2], g[1, 2])
+        self.assertIs(g.row(1), g[1])
+        self.assertIs(g.column(2), g[:, 2])
+        self.assertEqual([v.name for v in g.column(2)], ["g_0,2", "g_1,2", "g_2,2"])
+        self.assertEqual([v.name for v in g.diagonal()], ["g_0,0", "g_1,1", "g_2,2"])
+        self.assertEqual([v.name for v in g.anti_diagonal()], ["g_0,3", "g_1,2", "g_2,1"])
+        self.assertEqual(len(g.flatten()), 12)
+        self.assertEqual([[v.name for v in row] for row in g[1:3, 0:2]], [["g_1,0", "g_1,1"], ["g_2,0", "g_2,1"]])
+        self.assertEqual([v.name for v in g[0, 1:3]], ["g_0,1", "g_0,2"])
+        self.assertEqual([[v.name for v in row] for row in g.tolist()][2], ["g_2,0", "g_2,1", "g_2,2", "g_2,3"])
+
+    def test_latin_square(self):
+        m = Model()
+        square = m.intvars((3, 3), 1, 3, as_array=True)
+        for i in range(0, 3):
+            m.all_different(square.row(i)).post()
+            m.all_different(square.column(i)).post()
+        self.assertEqual(len(m.get_solver().find_all_solutions()), 12)
+
+    def test_boolvar_matrix(self):
+        m = Model()
+        b = m.boolvars((3, 3), as_array=True)
+        self.assertIsInstance(b, BoolVarArray)
+        for i in range(0, 3):
+            m.sum(b.row(i), "=", 1).post()
+            m.sum(b.column(i), "=", 1).post()
+        m.lex_chain_less(b).post()
+        self.assertEqual(len(m.get_solver().find_all_solutions()), 1)
@@ -1,6 +1,8 @@
 import unittest
+from array import array
 
 from pychoco.model import Model
+from pychoco.variables.intvar_array import IntVarArray
 
 
 class TestIntVar(unittest.TestCase):
@@ -21,6 +23,19 @@ class TestIntVar(unittest.TestCase):
         self.assertEqual(b.get_lb(), 1)
         self.assertEqual(b.get_ub(), 2)
 
+    def test_metadata(self):
+        model = Model()
+        a = model.intvar(0, 10, "a", bounded_domain=True)
+        b = model.intvar([1, 3, 5])
+        self.assertEqual(a.name, "a")
+        self.assertIs(a.name, a.name)
+        self.assertFalse(a.is_view())
+        self.assertFalse(a.has_enumerated_domain())
+        self.assertTrue(b.has_enumerated_domain())
+        self.assertTrue((a + 2).is_view())
+        self.assertEqual(a.get_bounds(), (0, 10))
+        self.assertEqual(b.get_bounds(), (1, 5))
+
     def test_create_shape(self):
         model = Model()
         vars = model.intvars((3, 4), 0, 10, name="var")
@@ -32,11 +47,35 @@ class TestIntVar(unittest.TestCase):
         others = model.intvars((2, 3), vals)
         self.assertEqual(others[1][1].get_ub(), 4)
 
+    def test_intvar_array(self):
+        model = Model()
+        x = model.intvars(4, 0, 3, name="x", as_array=True)
+        self.assertIsInstance(x, IntVarArray)
+        self.assertEqual([v.name for v in x], ["x_0", "x_1", "x_2", "x_3"])
+        self.assertEqual(len(x + [model.intvar(0, 1)]), 5)
+        model.all_different(x).post()
+        model.arithm(x[0], "<", x[1]).post()
+        self.assertEqual(len(model.get_solver().find_all_solutions()), 12)
+        y = model.intvars(3, [1, [2, 3], 4], name="y", as_array=True)
+        self.assertEqual(y[1].get_domain_values(), [2, 3])
+        self.assertTrue(y[2].is_instantiated())
+
+    def test_intvars_list(self):
+        model = Model()
+        x = model.intvars(3, 0, 3, name="x")
+        self.assertIsInstance(x, list)
+        self.assertEqual([v.name for v in x], ["x_0", "x_1", "x_2"])
+        x.append(model.intvar(0, 1))
+        x[0] = model.intvar(1, 2)
+        model.all_different(x + [model.intvar(4, 4)]).post()
+        self.assertEqual(len(model.get_solver().find_all_solutions()), 6)
+
     def test_created_enumerated(self):
         m = Model()
         a = m.intvar([0, 1, 4, 5], name="enum_a")
         vals = a.get_domain_values()
         self.assertEqual(vals, [0, 1, 4, 5])
+        self.assertEqual(a.get_domain_values("array"), array("i", [0, 1, 4, 5]))
         bb = m.intvars(10, 0, 4)
         self.assertTrue(a.has_enumerated_domain())
         for b in bb:
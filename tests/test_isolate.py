@@ -0,0 +1,123 @@
+import os
+import subprocess
+import sys
+import threading
+import unittest
+
+import pychoco
+from pychoco.isolate import get_current_isolate, get_nb_isolates, is_thread_attached, isolate_info, parse_size
+from pychoco.model import Model
+
+
+class TestIsolate(unittest.TestCase):
+
+    def test_attach_detach(self):
+        pychoco.attach_thread()
+        states = []
+
+        def run():
+            states.append(is_thread_attached())
+            with pychoco.attached_thread():
+                states.append(is_thread_attached())
+                model = Model()
+                x = model.intvars(3, 0, 2)
+                model.all_different(x).post()
+                states.append(len(model.get_solver().find_all_solutions()))
+            states.append(is_thread_attached())
+            # Backend calls attach the thread again
+            states.append(model.get_solver().get_solution_count())
+            states.append(is_thread_attached())
+            pychoco.detach_thread()
+            states.append(is_thread_attached())
+
+        thread = threading.Thread(target=run)
+        thread.start()
+        thread.join()
+        self.assertEqual(states, [False, True, 6, False, 6, True, False])
+        # Detaching another thread does not detach this one
+        self.assertTrue(is_thread_attached())
+
+    def test_isolate_pool(self):
+        # Creating a second isolate changes pychoco for the rest of the process: the test runs in its own
+        output = subprocess.run([sys.executable, "-c", ISOLATE_POOL], capture_output=True, text=True)
+        self.assertEqual(output.returncode, 0, output.stderr)
+        self.assertEqual(output.stdout.split(), ["done"])
+
+    def test_isolate_parameters(self):
+        self.assertEqual(parse_size("512m"), 512 << 20)
+        self.assertEqual(parse_size("2G"), 2 << 30)
+        self.assertEqual(parse_size(4096), 4096)
+        Model().intvar(0, 2)
+        # The default isolate already exists
+        with self.assertRaises(RuntimeError):
+            pychoco.init(max_heap="1g")
+        stats = pychoco.isolate_stats()
+        self.assertEqual(stats["nb_isolates"], len(stats["isolates"]))
+        self.assertIn("max_heap", stats)
+
+    def test_max_heap(self):
+        # About 200,000 variables do not fit in a 16 MB heap, but do with the default maximum heap size
+        code = "from pychoco import Model; Model().intvars(200000, 0, 1); print('done')"
+        environ = {name: value for name, value in os.environ.items() if not name.startswith("PYCHOCO_")}
+        run = lambda env: subprocess.run([sys.executable, "-c", code], capture_output=True, text=True,
+                                         env=dict(environ, **env))
+        self.assertEqual(run({}).stdout.split(), ["done"])
+        limited = run({"PYCHOCO_MAX_HEAP": "16m"})
+        self.assertNotEqual(limited.returncode, 0)
+        self.assertNotIn("done", limited.stdout)
+
+    def test_lazy_import(self):
+        # Importing pychoco neither loads the backend nor creates the isolate
+        code = "import sys, pychoco; print('pychoco.backend' in sys.modules, 'pychoco.model' in sys.modules)"
+        output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+        self.assertEqual(output.split(), ["False", "False"])
+        # Submodules are reachable as attributes of the package
+        code = "import pychoco; print(pychoco.isolate.__name__, hasattr(pychoco, 'no_such_module'))"
+        output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+        self.assertEqual(output.split(), ["pychoco.isolate", "False"])
+        self.assertIs(pychoco.Model, Model)
+
+
+# Run in a subprocess by test_isolate_pool
+ISOLATE_POOL = """
+import pychoco
+from pychoco import Model
+from pychoco.isolate import get_current_isolate, get_nb_isolates, isolate_info
+
+index = pychoco.create_isolate()
+assert get_nb_isolates() == index + 1
+model_a = Model()
+model_b = Model(isolate=index)
+assert model_b.isolate == index
+# Creating a model does not change the current isolate of the thread
+assert get_current_isolate() == 0
+x = model_a.intvars(3, 0, 2)
+y = model_b.intvars(3, 0, 2)
+model_a.all_different(x).post()
+model_b.all_different(y).post()
+assert len(model_a.get_solver().find_all_solutions()) == 6
+assert len(model_b.get_solver().find_all_solutions()) == 6
+# Objects of a single isolate can be used in turn
+solution_a = model_a.get_solver().find_solution()
+model_b.get_solver().find_solution()
+assert solution_a.get_int_val(x[0]) in range(0, 3)
+assert y[0].get_lb() == 0
+model_a.element(x[0], [2, 1, 0], x[1]).post()
+# Objects of different isolates cannot be mixed
+for mix in (lambda: model_b.arithm(x[0], "=", y[0]),
+            lambda: model_b.all_different(x),
+            lambda: model_a.all_different([x[0], y[0]])):
+    try:
+        mix()
+    except RuntimeError:
+        pass
+    else:
+        raise AssertionError("objects of different isolates were mixed")
+with pychoco.use_isolate(index):
+    assert get_current_isolate() == index
+info = isolate_info()
+assert len(info) == index + 1
+assert info[index]["models"] >= 1
+assert Model(isolate="round_robin").isolate in range(index + 1)
+print("done")
+"""
@@ -1,5 +1,8 @@
+import gc
 import unittest
 
+import pychoco
+from pychoco import _handle_wrapper
 from pychoco.model import Model
 
 
@@ -17,4 +20,87 @@ class TestModel(unittest.TestCase):
         model = Model(lcg=True)
         xs = model.intvars(5, 0, 4, "x")
         model.all_different(xs).post()
-        print(model)
\ No newline at end of file
+        print(model)
+
+    def test_array_cache(self):
+        model = Model()
+        xs = [model.intvar(0, 3) for i in range(0, 4)]
+        model.all_different(xs).post()
+        model.sum(xs, "=", 6).post()
+        model.get_solver().set_input_order_lb_search(*xs)
+        info = model.array_cache_info()
+        self.assertEqual(info.misses, 1)
+        self.assertEqual(info.hits, 2)
+        self.assertEqual(info.currsize, 1)
+        self.assertEqual(len(model.get_solver().find_all_solutions()), 24)
+        model.clear_array_cache()
+        self.assertEqual(model.array_cache_info(), (0, 0, 128, 0))
+        self.assertEqual(Model(array_cache_size=0).array_cache_info().maxsize, 0)
+        # Entries do not keep their variables alive
+        ys = [model.intvar(0, 3) for i in range(0, 3)]
+        model.all_different(ys).post()
+        self.assertEqual(model.array_cache_info().currsize, 1)
+        del ys
+        gc.collect()
+        self.assertEqual(model.array_cache_info().currsize, 0)
+
+    def test_array_cache_intvars(self):
+        model = Model()
+        # The Java arrays created by intvars() and boolvars() are reused for their lists
+        xs = model.intvars(4, 0, 3)
+        bs = model.boolvars(3)
+        model.all_different(xs).post()
+        model.sum(bs, "=", 1).post()
+        model.bools_int_channeling(bs, xs[0], 0).post()
+        info = model.array_cache_info()
+        self.assertEqual(info.misses, 0)
+        self.assertEqual(info.hits, 3)
+        self.assertEqual(info.currsize, 3)
+        self.assertEqual(len(model.get_solver().find_all_solutions()), 18)
+
+    def test_snapshot_domains(self):
+        model = Model()
+        x = model.intvar(0, 10, bounded_domain=True)
+        y = model.intvar([1, 3, 5])
+        z = model.intvar(4)
+        snapshot = model.snapshot_domains([x, y, z])
+        self.assertEqual(snapshot.lb.tolist(), [0, 1, 4])
+        self.assertEqual(snapshot.ub.tolist(), [10, 5, 4])
+        self.assertEqual(snapshot.size.tolist(), [11, 3, 1])
+        self.assertEqual(snapshot.instantiated.tolist(), [0, 0, 1])
+        self.assertEqual(snapshot.enumerated.tolist(), [0, 1, z.has_enumerated_domain()])
+        self.assertIsNone(snapshot.values)
+        snapshot = model.snapshot_domains([x, y, z], enumerated=True)
+        self.assertEqual(snapshot.values[0:2].tolist(), [0, 10])
+        self.assertEqual(snapshot.values[2:5].tolist(), [1, 3, 5])
+        offsets = snapshot.offsets.tolist()
+        self.assertEqual(offsets[:3], [0, 2, 5])
+        self.assertEqual(snapshot.values[offsets[2]:offsets[3]].tolist(), [4] if z.has_enumerated_domain() else [4, 4])
+
+    def test_close(self):
+        with Model() as model:
+            x = model.intvars(3, 0, 2)
+            model.all_different(x).post()
+            solver = model.get_solver()
+            self.assertTrue(solver.solve())
+            self.assertFalse(model.closed)
+        self.assertTrue(model.closed)
+        self.assertRaises(RuntimeError, x[0].get_value)
+        self.assertRaises(RuntimeError, solver.solve)
+        self.assertRaises(RuntimeError, model.intvar, 0, 1)
+        model.close()
+
+    def test_flush_handles(self):
+        model = Model()
+        x = [model.intvar(0, 5) for _ in range(0, 10)]
+        pychoco.flush_handles()
+        del x
+        gc.collect()
+        self.assertEqual(len(_handle_wrapper._pending_handles), 10)
+        pychoco.flush_handles()
+        self.assertEqual(len(_handle_wrapper._pending_handles), 0)
+        self.addCleanup(pychoco.set_flush_threshold, _handle_wrapper._flush_threshold)
+        pychoco.set_flush_threshold(1)
+        model.intvar(0, 5)
+        gc.collect()
+        self.assertEqual(len(_handle_wrapper._pending_handles), 0)
@@ -9,6 +9,7 @@ class TestParallelPortfolio(unittest.TestCase):
 
     def test_simple_solve(self):
         pf = ParallelPortfolio()
+        models = []
         for i in range(0, 5):
             m = Model()
             vars = m.intvars(10, 0, 20)
@@ -17,7 +18,9 @@ class TestParallelPortfolio(unittest.TestCase):
             s = m.intvar(0, 100)
             m.sum(vars, "=", s).post()
             pf.add_model(m)
+            models.append(m)
         self.assertTrue(pf.solve())
+        self.assertTrue(any(pf.get_best_model() is m for m in models))
 
     def test_optimize(self):
         pf = ParallelPortfolio()
@@ -1,5 +1,9 @@
+import asyncio
 import math
+import threading
+import time
 import unittest
+from array import array
 
 from pychoco.model import Model
 
@@ -69,6 +73,168 @@ class TestSolver(unittest.TestCase):
         solver.limit_time("120")
         solver.find_all_solutions()
 
+    def test_concurrent_solves(self):
+        counts = [None] * 4
+
+        def count_solutions(i):
+            m = Model()
+            x = m.intvars(4, 1, 4)
+            m.all_different(x).post()
+            counts[i] = len(m.get_solver().find_all_solutions())
+
+        threads = [threading.Thread(target=count_solutions, args=(i,)) for i in range(0, 4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(counts, [24] * 4)
+
+    def test_iter_solutions(self):
+        model = Model()
+        x = model.intvars(4, 0, 3)
+        model.all_different(x).post()
+        solver = model.get_solver()
+        nb = 0
+        for solution in solver.iter_solutions():
+            self.assertEqual(sorted(solution.get_int_val(v) for v in x), [0, 1, 2, 3])
+            nb += 1
+        self.assertEqual(nb, 24)
+        model = Model()
+        x = model.intvars(4, 0, 3)
+        model.all_different(x).post()
+        solver = model.get_solver()
+        self.assertEqual(len(list(solver.iter_solutions(solution_limit=5))), 5)
+        for solution in solver.iter_solutions():
+            break
+        self.assertEqual(solver.get_solution_count(), 6)
+
+    def test_async_solving(self):
+        model = Model()
+        x = model.intvars(4, 0, 3)
+        model.all_different(x).post()
+        solver = model.get_solver()
+
+        async def count_solutions():
+            return len([solution async for solution in solver.iter_solutions_async()])
+
+        self.assertEqual(asyncio.run(count_solutions()), 24)
+        model = Model()
+        x = model.intvars(3, 0, 5)
+        model.all_different(x).post()
+        s = model.intvar(0, 15)
+        model.sum(x, "=", s).post()
+        solver = model.get_solver()
+        solution = asyncio.run(solver.find_optimal_solution_async(s, True))
+        self.assertEqual(solution.get_int_val(s), 12)
+
+    def test_async_cancellation(self):
+        # Pigeonhole problem without global constraint: proving that it has no solution takes a long time.
+        model = Model()
+        x = model.intvars(12, 0, 10)
+        for i in range(0, 12):
+            for j in range(i + 1, 12):
+                model.arithm(x[i], "!=", x[j]).post()
+        solver = model.get_solver()
+
+        async def cancel_search():
+            task = asyncio.ensure_future(solver.solve_async())
+            await asyncio.sleep(0.2)
+            task.cancel()
+            await task
+
+        self.assertRaises(asyncio.CancelledError, asyncio.run, cancel_search())
+        self.assertEqual(solver.get_search_state(), "STOPPED")
+
+    def test_interrupt(self):
+        model = Model()
+        x = model.intvars(12, 0, 10)
+        for i in range(0, 12):
+            for j in range(i + 1, 12):
+                model.arithm(x[i], "!=", x[j]).post()
+        solver = model.get_solver()
+        solver.interrupt()
+        self.assertFalse(solver.solve())
+        self.assertEqual(solver.get_search_state(), "NEW")
+        solver.set_interruptible()
+        timer = threading.Timer(0.2, solver.interrupt)
+        timer.start()
+        self.assertFalse(solver.find_all_solutions())
+        timer.join()
+        self.assertEqual(solver.get_search_state(), "STOPPED")
+        self.assertFalse(solver._interrupted)
+        # A single backend call cannot be interrupted: the request is reported
+        solver.set_interruptible(False)
+        thread = threading.Thread(target=solver.find_all_solutions, kwargs={"time_limit": "1s"})
+        thread.start()
+        time.sleep(0.2)
+        with self.assertWarns(RuntimeWarning):
+            solver.interrupt()
+        thread.join()
+        self.assertFalse(solver._interrupted)
+
+    def test_projected_solutions(self):
+        model = Model()
+        x = model.intvars(4, 0, 3)
+        model.all_different(x).post()
+        solver = model.get_solver()
+        solutions = solver.find_all_solutions(vars=x[:2])
+        self.assertEqual(len(solutions), 24)
+        for solution in solutions:
+            self.assertNotEqual(solution.get_int_val(x[0]), solution.get_int_val(x[1]))
+        self.assertRaises(AssertionError, solutions[0].get_int_val, x[2])
+        model = Model()
+        x = model.intvars(4, 0, 3)
+        n = model.intvar(0, 10)
+        model.n_values(x, n).post()
+        solver = model.get_solver()
+        solution = solver.find_optimal_solution(n, True, vars=[n])
+        self.assertEqual(solution.get_int_val(n), 4)
+        model = Model()
+        x = model.intvars(4, 0, 3)
+        n = model.intvar(0, 10)
+        model.n_values(x, n).post()
+        solutions = model.get_solver().find_all_optimal_solutions(n, False, vars=x)
+        self.assertEqual(len(solutions), 4)
+        for solution in solutions:
+            self.assertEqual(len(set(solution.get_int_val(v) for v in x)), 1)
+
+    def test_solution_bulk_values(self):
+        model = Model()
+        x = model.intvars(4, 0, 3)
+        model.all_different(x).post()
+        s = model.setvar(set(), set(range(0, 20)))
+        t = model.setvar({1, 2}, {1, 2, 3})
+        model.set_sum(s, x[0]).post()
+        solution = model.get_solver().find_solution()
+        values = solution.get_int_vals(x)
+        self.assertEqual(values, [solution.get_int_val(v) for v in x])
+        self.assertEqual(solution.get_int_vals(x, "array"), array("i", values))
+        self.assertEqual(solution.get_set_vals([s, t]), [solution.get_set_val(s), solution.get_set_val(t)])
+        projected = model.get_solver().find_solution(vars=x)
+        self.assertEqual(len(projected.get_int_vals(x)), 4)
+        self.assertEqual(projected.get_int_vals(x[::-1]), projected.get_int_vals(x)[::-1])
+        self.assertRaises(TypeError, projected.get_set_val, s)
+
+    def test_solution_matrix(self):
+        model = Model()
+        x = model.intvars(3, 0, 2)
+        model.all_different(x).post()
+        matrix = model.get_solver().find_all_solutions(as_matrix=x, container="array")
+        self.assertEqual(matrix.shape, (6, 3))
+        self.assertEqual(sorted(tuple(row) for row in matrix.tolist()),
+                         [(0, 1, 2), (0, 2, 1), (1, 0, 2), (1, 2, 0), (2, 0, 1), (2, 1, 0)])
+        model = Model()
+        x = model.intvars(4, 0, 3)
+        n = model.intvar(0, 10)
+        model.n_values(x, n).post()
+        rows = model.get_solver().find_all_optimal_solutions(n, False, as_matrix=x[:2], container="list")
+        self.assertEqual(sorted(rows), [[0, 0], [1, 1], [2, 2], [3, 3]])
+        model = Model()
+        x = model.intvars(2, 0, 1)
+        model.arithm(x[0], ">", x[1]).post()
+        model.arithm(x[0], "<", x[1]).post()
+        self.assertEqual(model.get_solver().find_all_solutions(as_matrix=x), [])
+
     def test_find_all_optimal_solutions(self):
         model = Model()
         x = model.intvars(4, 0, 3)
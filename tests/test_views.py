@@ -42,6 +42,18 @@ class TestViews(unittest.TestCase):
         while m.get_solver().solve():
             self.assertEqual(intvar.get_value(), int_offset.get_value() - 2)
 
+    def test_declared_views(self):
+        m = Model()
+        x = m.intvar(0, 5)
+        self.assertIs(m.int_offset_view(x, 2), m.int_offset_view(x, 2))
+        self.assertIsNot(m.int_offset_view(x, 2), m.int_offset_view(x, 3))
+        self.assertIs(m.int_minus_view(x), m.int_scale_view(x, -1))
+        self.assertIs(m.int_scale_view(x, 1), x)
+        self.assertIs(x == 3, x == 3)
+        m = Model(check_views=False)
+        x = m.intvar(0, 5)
+        self.assertIsNot(m.int_offset_view(x, 2), m.int_offset_view(x, 2))
+
     def test_minus_view(self):
         m = Model()
         intvar = m.intvar(0, 10)